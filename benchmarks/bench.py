@@ -0,0 +1,294 @@
+"""Offline micro- and end-to-end benchmarks for the WAS client.
+
+Run with::
+
+    uv run python benchmarks/bench.py --output bench.json
+    uv run python benchmarks/bench.py --quick --compare bench.json   # fail on regressions
+
+Every benchmark runs in-process; HTTP round trips go through an ``httpx.MockTransport`` backed by
+a dict, so results measure client-side cost (signing, request construction, body handling) only.
+The ``WasEmulator`` benchmarks add the emulator's signature verification and bookkeeping.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import version
+
+import httpx
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+from wallet_attached_storage_client import Ed25519Signer, StorageClient, WasEmulator, parse_urn_uuid
+from wallet_attached_storage_client._http_signature import (
+    SignatureTemplate,
+    build_signature_string,
+    create_authorization_header,
+    create_authorization_headers,
+)
+
+SPACE_ID = "urn:uuid:f47ac10b-58cc-4372-a567-0e02b2c3d479"
+PAYLOAD_SIZES = [0, 1024, 64 * 1024, 1024 * 1024, 10 * 1024 * 1024, 100 * 1024 * 1024]
+QUICK_PAYLOAD_SIZES = [0, 1024, 64 * 1024, 1024 * 1024]
+
+
+@dataclass
+class Result:
+    name: str
+    params: dict[str, object]
+    iterations: int
+    mean_s: float
+    median_s: float
+    min_s: float
+    stdev_s: float
+    ops_per_s: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.ops_per_s = 1 / self.median_s if self.median_s else float("inf")
+
+    @property
+    def key(self) -> str:
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]" if params else self.name
+
+
+def measure(
+    name: str, fn: Callable[[], object], *, min_time: float, repeats: int = 5, **params: object
+) -> Result:
+    """Time *fn*: calibrate a loop count that takes ~``min_time / repeats``, then take *repeats* samples."""
+    fn()  # warm up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeats or loops >= 1 << 20:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / repeats / elapsed) + 1))
+    samples = [elapsed / loops]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        samples.append((time.perf_counter() - start) / loops)
+    return Result(
+        name=name,
+        params=params,
+        iterations=loops * repeats,
+        mean_s=statistics.fmean(samples),
+        median_s=statistics.median(samples),
+        min_s=min(samples),
+        stdev_s=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    )
+
+
+def _legacy_build_signature_string(
+    *, method: str, path: str, created: int, expires: int, key_id: str, include_headers: list[str] | None = None
+) -> str:
+    """The pre-template implementation, kept as a baseline for the template benchmark."""
+    values = {
+        "(created)": str(created),
+        "(expires)": str(expires),
+        "(key-id)": key_id,
+        "(request-target)": f"{method.lower()} {path}",
+    }
+    headers = include_headers or ["(created)", "(expires)", "(key-id)", "(request-target)"]
+    parts: list[str] = []
+    for h in headers:
+        if h not in values:
+            raise ValueError(f"Unsupported pseudo-header: {h!r}")
+        parts.append(f"{h}: {values[h]}")
+    return "\n".join(parts)
+
+
+def _memory_client() -> StorageClient:
+    store: dict[str, bytes] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "PUT":
+            store[path] = request.read()
+            return httpx.Response(204)
+        if request.method == "GET" and path in store:
+            return httpx.Response(200, content=store[path])
+        return httpx.Response(404)
+
+    hx = httpx.Client(base_url="https://bench.example", transport=httpx.MockTransport(handler))
+    return StorageClient("https://bench.example", httpx_client=hx)
+
+
+def bench_signing(min_time: float) -> Iterator[Result]:
+    signer = Ed25519Signer()
+    yield measure(
+        "build_signature_string",
+        lambda: build_signature_string(
+            method="GET", path="/space/abc/resource", created=1700000000, expires=1700000030, key_id=signer.id
+        ),
+        min_time=min_time,
+    )
+    yield measure(
+        "legacy_build_signature_string+encode",
+        lambda: _legacy_build_signature_string(
+            method="GET", path="/space/abc/resource", created=1700000000, expires=1700000030, key_id=signer.id
+        ).encode("utf-8"),
+        min_time=min_time,
+    )
+    template = SignatureTemplate()
+    yield measure(
+        "SignatureTemplate.build",
+        lambda: template.build(
+            method="GET", path="/space/abc/resource", created=1700000000, expires=1700000030, key_id=signer.id
+        ),
+        min_time=min_time,
+    )
+    yield measure(
+        "create_authorization_header",
+        lambda: create_authorization_header(signer=signer, method="PUT", url="/space/abc/resource"),
+        min_time=min_time,
+    )
+    batch = [("PUT", f"/space/abc/resource-{i}") for i in range(100)]
+    yield measure(
+        "create_authorization_header",
+        lambda: [create_authorization_header(signer=signer, method=m, url=u) for m, u in batch],
+        min_time=min_time,
+        batch=len(batch),
+    )
+    yield measure(
+        "create_authorization_headers",
+        lambda: create_authorization_headers(signer=signer, requests=batch),
+        min_time=min_time,
+        batch=len(batch),
+    )
+    key = Ed25519PrivateKey.generate()
+    yield measure("Ed25519Signer.__init__", lambda: Ed25519Signer(key), min_time=min_time)
+    yield measure("parse_urn_uuid", lambda: parse_urn_uuid(SPACE_ID), min_time=min_time)
+
+
+def bench_crud(min_time: float, sizes: list[int]) -> Iterator[Result]:
+    client = _memory_client()
+    resource = client.space(SPACE_ID, signer=Ed25519Signer()).resource("/bench.bin")
+    for size in sizes:
+        payload = bytes(size)
+        # Large payloads are dominated by copying; a single repeat keeps the suite tractable.
+        repeats = 5 if size <= 1024 * 1024 else 1
+        yield measure("Resource.put", lambda: resource.put(payload), min_time=min_time, repeats=repeats, size=size)
+        yield measure("Resource.get", lambda: resource.get(), min_time=min_time, repeats=repeats, size=size)
+
+
+def bench_emulator(min_time: float) -> Iterator[Result]:
+    # Signed round trips through WasEmulator, so server-side signature verification is included.
+    emulator = WasEmulator()
+    signer = Ed25519Signer()
+    emulator.provision(SPACE_ID, controller=signer.controller)
+    resource = emulator.client().space(SPACE_ID, signer=signer).resource("/bench.bin")
+    payload = bytes(1024)
+    yield measure("WasEmulator.put", lambda: resource.put(payload), min_time=min_time, size=len(payload))
+    yield measure("WasEmulator.get", lambda: resource.get(), min_time=min_time, size=len(payload))
+
+
+def _import_time(statement: str) -> float:
+    """Seconds ``python -X importtime`` attributes to this package (and everything it pulls in) for *statement*.
+
+    Lazily loaded submodules show up as separate top-level entries, so all of them are summed.
+    """
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", nested imports are indented
+        _, _, fields = line.partition("import time:")
+        parts = fields.split("|")
+        if len(parts) == 3 and parts[2].startswith(" wallet_attached_storage_client"):
+            total += int(parts[1])
+    if not total:
+        raise RuntimeError(f"no importtime entry for wallet_attached_storage_client in {statement!r}")
+    return total / 1e6
+
+
+def bench_import(repeats: int = 5) -> Iterator[Result]:
+    # Each sample is a fresh interpreter, so this ignores min_time and takes a fixed number of samples.
+    for label, statement in [
+        ("bare", "import wallet_attached_storage_client"),
+        ("make_urn_uuid", "from wallet_attached_storage_client import make_urn_uuid"),
+        ("StorageClient", "from wallet_attached_storage_client import StorageClient"),
+    ]:
+        samples = [_import_time(statement) for _ in range(repeats)]
+        yield Result(
+            name="import",
+            params={"names": label},
+            iterations=repeats,
+            mean_s=statistics.fmean(samples),
+            median_s=statistics.median(samples),
+            min_s=min(samples),
+            stdev_s=statistics.stdev(samples),
+        )
+
+
+def run(min_time: float, sizes: list[int]) -> list[Result]:
+    results = [*bench_import(), *bench_signing(min_time), *bench_crud(min_time, sizes), *bench_emulator(min_time)]
+    return results
+
+
+def compare(results: list[Result], baseline_path: str, threshold: float) -> list[str]:
+    """Return a message for every benchmark whose median is more than *threshold* slower than baseline."""
+    with open(baseline_path) as f:
+        baseline = {r["key"]: r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        base = baseline.get(r.key)
+        if base is None:
+            continue
+        ratio = r.median_s / base["median_s"] if base["median_s"] else 1.0
+        if ratio > 1 + threshold:
+            regressions.append(f"{r.key}: {base['median_s']:.3e}s -> {r.median_s:.3e}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--quick", action="store_true", help="shorter runs and payloads up to 1 MiB only")
+    parser.add_argument("--min-time", type=float, help="target seconds per benchmark (default 1.0, 0.2 quick)")
+    parser.add_argument("--compare", metavar="BASELINE", help="exit non-zero if slower than this results file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown for --compare (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    min_time = args.min_time or (0.2 if args.quick else 1.0)
+    results = run(min_time, QUICK_PAYLOAD_SIZES if args.quick else PAYLOAD_SIZES)
+
+    for r in results:
+        print(f"{r.key:<45} {r.median_s * 1e6:>12.2f} µs  {r.ops_per_s:>12.1f} ops/s")
+
+    if args.output:
+        doc = {
+            "meta": {
+                "package_version": version("wallet-attached-storage-client"),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "timestamp": time.time(),
+                "min_time": min_time,
+            },
+            "results": [{"key": r.key, **asdict(r)} for r in results],
+        }
+        with open(args.output, "w") as f:
+            json.dump(doc, f, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
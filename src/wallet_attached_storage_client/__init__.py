@@ -1,21 +1,204 @@
-"""Python client library for the Wallet Attached Storage specification."""
+"""Python client library for the Wallet Attached Storage specification.
 
-from wallet_attached_storage_client._client import StorageClient
-from wallet_attached_storage_client._http_signature import create_authorization_header
-from wallet_attached_storage_client._resource import Resource
-from wallet_attached_storage_client._signer import Ed25519Signer
-from wallet_attached_storage_client._space import Space
-from wallet_attached_storage_client._types import Signer
-from wallet_attached_storage_client._urn_uuid import is_urn_uuid, make_urn_uuid, parse_urn_uuid
+Public names are imported lazily on first attribute access, so ``import wallet_attached_storage_client``
+stays cheap for callers that only need a few helpers (e.g. :func:`make_urn_uuid`) and does not pull
+in ``httpx`` or ``cryptography`` until they are needed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._async_client import AsyncStorageClient
+    from wallet_attached_storage_client._async_resource import AsyncResource
+    from wallet_attached_storage_client._async_space import AsyncSpace
+    from wallet_attached_storage_client._bulk import BulkResult
+    from wallet_attached_storage_client._cache import (
+        CachedResponse,
+        CacheStats,
+        DiskResponseCache,
+        MemoryResponseCache,
+        ResponseCache,
+    )
+    from wallet_attached_storage_client._chunked import ChunkedManifest, ChunkInfo
+    from wallet_attached_storage_client._client import StorageClient
+    from wallet_attached_storage_client._coalesce import RequestCoalescer
+    from wallet_attached_storage_client._collection import SpaceItem
+    from wallet_attached_storage_client._config import ConnectionOptions
+    from wallet_attached_storage_client._dedup import ContentIndex, PutResult
+    from wallet_attached_storage_client._download import DownloadResult
+    from wallet_attached_storage_client._emulator import EmulatorStats, WasEmulator
+    from wallet_attached_storage_client._http_signature import (
+        SignatureCache,
+        SignatureTemplate,
+        compile_signature_template,
+        create_authorization_header,
+        create_authorization_headers,
+    )
+    from wallet_attached_storage_client._instrument import (
+        HistogramSnapshot,
+        LatencyHistogram,
+        LatencyRecorder,
+        RequestRecord,
+    )
+    from wallet_attached_storage_client._limiter import AdaptiveLimiter
+    from wallet_attached_storage_client._range import RangeResult
+    from wallet_attached_storage_client._replica import (
+        AsyncReplicatedStorageClient,
+        QuorumError,
+        ReplicaSelector,
+        ReplicaStats,
+        ReplicatedStorageClient,
+    )
+    from wallet_attached_storage_client._resource import Resource
+    from wallet_attached_storage_client._retry import RetryPolicy
+    from wallet_attached_storage_client._shard import (
+        AsyncShardedStorageClient,
+        HashRing,
+        Migration,
+        ShardedStorageClient,
+        plan_migration,
+    )
+    from wallet_attached_storage_client._signer import Ed25519Signer, ThreadPoolSigner
+    from wallet_attached_storage_client._space import Space
+    from wallet_attached_storage_client._sync import DirectorySync, SyncPlan, SyncReport
+    from wallet_attached_storage_client._transfer import BulkTransferEngine, TransferItem, TransferResult
+    from wallet_attached_storage_client._types import AsyncSigner, BatchSigner, Signer
+    from wallet_attached_storage_client._urn_uuid import is_urn_uuid, make_urn_uuid, parse_urn_uuid
+
+_LAZY_IMPORTS = {
+    "AdaptiveLimiter": "_limiter",
+    "AsyncReplicatedStorageClient": "_replica",
+    "AsyncResource": "_async_resource",
+    "AsyncShardedStorageClient": "_shard",
+    "AsyncSigner": "_types",
+    "AsyncSpace": "_async_space",
+    "AsyncStorageClient": "_async_client",
+    "BatchSigner": "_types",
+    "BulkResult": "_bulk",
+    "BulkTransferEngine": "_transfer",
+    "CacheStats": "_cache",
+    "CachedResponse": "_cache",
+    "ChunkInfo": "_chunked",
+    "ChunkedManifest": "_chunked",
+    "ConnectionOptions": "_config",
+    "ContentIndex": "_dedup",
+    "DirectorySync": "_sync",
+    "DiskResponseCache": "_cache",
+    "DownloadResult": "_download",
+    "Ed25519Signer": "_signer",
+    "EmulatorStats": "_emulator",
+    "HashRing": "_shard",
+    "HistogramSnapshot": "_instrument",
+    "LatencyHistogram": "_instrument",
+    "LatencyRecorder": "_instrument",
+    "MemoryResponseCache": "_cache",
+    "Migration": "_shard",
+    "PutResult": "_dedup",
+    "QuorumError": "_replica",
+    "RangeResult": "_range",
+    "ReplicaSelector": "_replica",
+    "ReplicaStats": "_replica",
+    "ReplicatedStorageClient": "_replica",
+    "RequestCoalescer": "_coalesce",
+    "RequestRecord": "_instrument",
+    "Resource": "_resource",
+    "ResponseCache": "_cache",
+    "RetryPolicy": "_retry",
+    "ShardedStorageClient": "_shard",
+    "SignatureCache": "_http_signature",
+    "SignatureTemplate": "_http_signature",
+    "Signer": "_types",
+    "Space": "_space",
+    "SpaceItem": "_collection",
+    "StorageClient": "_client",
+    "SyncPlan": "_sync",
+    "SyncReport": "_sync",
+    "ThreadPoolSigner": "_signer",
+    "TransferItem": "_transfer",
+    "TransferResult": "_transfer",
+    "WasEmulator": "_emulator",
+    "compile_signature_template": "_http_signature",
+    "create_authorization_header": "_http_signature",
+    "create_authorization_headers": "_http_signature",
+    "is_urn_uuid": "_urn_uuid",
+    "make_urn_uuid": "_urn_uuid",
+    "parse_urn_uuid": "_urn_uuid",
+    "plan_migration": "_shard",
+}
 
 __all__ = [
+    "AdaptiveLimiter",
+    "AsyncReplicatedStorageClient",
+    "AsyncResource",
+    "AsyncShardedStorageClient",
+    "AsyncSigner",
+    "AsyncSpace",
+    "AsyncStorageClient",
+    "BatchSigner",
+    "BulkResult",
+    "BulkTransferEngine",
+    "CacheStats",
+    "CachedResponse",
+    "ChunkInfo",
+    "ChunkedManifest",
+    "ConnectionOptions",
+    "ContentIndex",
+    "DirectorySync",
+    "DiskResponseCache",
+    "DownloadResult",
     "Ed25519Signer",
+    "EmulatorStats",
+    "HashRing",
+    "HistogramSnapshot",
+    "LatencyHistogram",
+    "LatencyRecorder",
+    "MemoryResponseCache",
+    "Migration",
+    "PutResult",
+    "QuorumError",
+    "RangeResult",
+    "ReplicaSelector",
+    "ReplicaStats",
+    "ReplicatedStorageClient",
+    "RequestCoalescer",
+    "RequestRecord",
     "Resource",
+    "ResponseCache",
+    "RetryPolicy",
+    "ShardedStorageClient",
+    "SignatureCache",
+    "SignatureTemplate",
     "Signer",
     "Space",
+    "SpaceItem",
     "StorageClient",
+    "SyncPlan",
+    "SyncReport",
+    "ThreadPoolSigner",
+    "TransferItem",
+    "TransferResult",
+    "WasEmulator",
+    "compile_signature_template",
     "create_authorization_header",
+    "create_authorization_headers",
     "is_urn_uuid",
     "make_urn_uuid",
     "parse_urn_uuid",
+    "plan_migration",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
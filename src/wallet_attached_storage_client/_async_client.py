@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+
+from wallet_attached_storage_client._async_space import AsyncSpace
+from wallet_attached_storage_client._coalesce import RequestCoalescer
+from wallet_attached_storage_client._config import ClientConfig, ConnectionOptions
+from wallet_attached_storage_client._urn_uuid import make_urn_uuid
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from wallet_attached_storage_client._cache import CacheStats, ResponseCache
+    from wallet_attached_storage_client._dedup import ContentIndex
+    from wallet_attached_storage_client._http_signature import SignatureCache
+    from wallet_attached_storage_client._instrument import Observer
+    from wallet_attached_storage_client._limiter import AdaptiveLimiter
+    from wallet_attached_storage_client._retry import RetryPolicy
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+
+class AsyncStorageClient:
+    """Async entry-point client for a Wallet Attached Storage server.
+
+    Mirrors :class:`StorageClient`, but every request method is a coroutine, so a single
+    event loop can keep many requests in flight over one shared connection pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        httpx_client: httpx.AsyncClient | None = None,
+        signature_cache: SignatureCache | None = None,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        coalesce: bool = False,
+        limiter: AdaptiveLimiter | None = None,
+        content_index: ContentIndex | None = None,
+    ) -> None:
+        if httpx_client is not None:
+            if connection is not None:
+                raise ValueError("Pass either httpx_client or connection, not both")
+            self._client = httpx_client
+            self._owns_client = False
+        else:
+            connection = connection or ConnectionOptions()
+            self._client = httpx.AsyncClient(base_url=base_url, **connection.client_kwargs())
+            self._owns_client = True
+        self._config = ClientConfig(
+            signature_cache=signature_cache,
+            response_cache=response_cache,
+            retry=retry,
+            observers=list(observers),
+            coalescer=RequestCoalescer() if coalesce else None,
+            limiter=limiter,
+        )
+        if content_index is not None:
+            self._config.content_index = content_index
+
+    @property
+    def coalescer(self) -> RequestCoalescer | None:
+        """The shared :class:`RequestCoalescer` when created with ``coalesce=True``, else ``None``."""
+        return self._config.coalescer
+
+    @property
+    def limiter(self) -> AdaptiveLimiter | None:
+        """The :class:`AdaptiveLimiter` every request goes through, if one was given."""
+        return self._config.limiter
+
+    @property
+    def content_index(self) -> ContentIndex:
+        """Digests of content last written by ``put_if_changed``, used to skip identical uploads."""
+        return self._config.content_index
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and bytes-saved counters for the *response_cache* (all zero without one)."""
+        return self._config.cache_stats
+
+    def add_observer(self, observer: Observer) -> None:
+        """Register a callable that receives a :class:`RequestRecord` after every request attempt."""
+        self._config.observers.append(observer)
+
+    def space(
+        self,
+        id: str | None = None,  # noqa: A002
+        *,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncSpace:
+        """Create an :class:`AsyncSpace` handle.
+
+        If *id* is ``None``, a new random ``urn:uuid`` is generated.
+        """
+        if id is None:
+            id = make_urn_uuid()  # noqa: A001
+        return AsyncSpace(
+            client=self._client,
+            id=id,
+            signer=signer,
+            config=self._config,
+        )
+
+    async def warmup(self, n: int) -> int:
+        """Open up to *n* pooled connections ahead of time; see :meth:`StorageClient.warmup`."""
+        if n < 1:
+            return 0
+
+        async def probe() -> bool:
+            try:
+                await self._client.request("HEAD", "/")
+            except httpx.HTTPError:
+                return False
+            return True
+
+        results = await asyncio.gather(*(probe() for _ in range(n)))
+        return sum(results)
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncStorageClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
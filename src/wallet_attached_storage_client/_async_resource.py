@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from wallet_attached_storage_client._bulk import arun_bounded
+from wallet_attached_storage_client._config import ClientConfig
+from wallet_attached_storage_client._content import CHUNK_SIZE, aprepare_content
+from wallet_attached_storage_client._dedup import AsyncHashingIterator, PutResult, content_digest
+from wallet_attached_storage_client._download import DownloadResult, atomic_destination, awrite_chunks
+from wallet_attached_storage_client._range import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_PART_WORKERS,
+    PositionalFile,
+    RangeResult,
+    check_part,
+    if_range,
+    range_header,
+    result_for,
+    split_ranges,
+)
+from wallet_attached_storage_client._request import asend, astream
+
+if TYPE_CHECKING:
+    import os
+
+    from wallet_attached_storage_client._content import Content
+    from wallet_attached_storage_client._download import Destination
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+
+class AsyncResource:
+    """Async counterpart of :class:`Resource`, backed by :class:`httpx.AsyncClient`."""
+
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        path: str,
+        signer: Signer | AsyncSigner | None = None,
+        config: ClientConfig | None = None,
+    ) -> None:
+        self._client = client
+        self._path = path
+        self._signer = signer
+        self._config = config or ClientConfig()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    async def _send(
+        self,
+        method: str,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+        content: Any = None,
+    ) -> httpx.Response:
+        return await asend(
+            self._client,
+            self._config,
+            method,
+            self._path,
+            signer=signer or self._signer,
+            headers=headers,
+            content=content,
+        )
+
+    async def get(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self._send("GET", signer=signer, headers=headers)
+
+    async def head(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self._send("HEAD", signer=signer, headers=headers)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """GET this resource without buffering the body; read it with ``response.aiter_bytes()``."""
+        async with astream(
+            self._client, self._config, "GET", self._path, signer=signer or self._signer, headers=headers
+        ) as response:
+            yield response
+
+    async def iter_bytes(
+        self,
+        chunk_size: int | None = CHUNK_SIZE,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Yield the body of this resource in chunks of at most *chunk_size* bytes.
+
+        Raises :class:`httpx.HTTPStatusError` if the server does not answer with a 2xx status.
+        """
+        async with self.stream(signer=signer, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def download_to(
+        self,
+        dest: Destination,
+        *,
+        hash_algorithm: str | None = None,
+        chunk_size: int | None = CHUNK_SIZE,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> DownloadResult:
+        """Stream this resource into *dest*; see :meth:`Resource.download_to`."""
+        chunks = self.iter_bytes(chunk_size, signer=signer, headers=headers)
+        return await awrite_chunks(chunks, dest, hash_algorithm)
+
+    async def get_range(
+        self,
+        start: int,
+        end: int | None = None,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> RangeResult:
+        """GET bytes *start* to *end* (inclusive) of this resource; see :meth:`Resource.get_range`."""
+        h = {**(headers or {}), "range": range_header(start, end)}
+        return RangeResult.from_response(await self.get(signer=signer, headers=h), start, end)
+
+    async def download_parallel(
+        self,
+        dest: str | os.PathLike[str],
+        *,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_PART_WORKERS,
+        hash_algorithm: str | None = None,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> DownloadResult:
+        """Download into *dest* as concurrent ranged GETs; see :meth:`Resource.download_parallel`.
+
+        File writes run off the event loop.
+        """
+        first = await self.get_range(0, part_size - 1, signer=signer, headers=headers)
+        if first.response.status_code == 416 and first.total == 0:
+            return await awrite_chunks(_aiter_once(b""), dest, hash_algorithm)
+        first.response.raise_for_status()
+        if not first.partial:
+            return await awrite_chunks(_aiter_once(first.response.content), dest, hash_algorithm)
+        if first.total is None or first.start != 0:
+            raise ValueError(f"Cannot split {self._path}: server did not report a usable Content-Range")
+        h = if_range(headers, first.response)
+
+        with atomic_destination(dest) as tmp:
+            out = await asyncio.to_thread(PositionalFile, tmp, first.total)
+
+            async def fetch(part: tuple[int, int]) -> None:
+                result = await self.get_range(*part, signer=signer, headers=h)
+                check_part(result, *part)
+                await asyncio.to_thread(out.write_at, result.content, part[0])
+
+            try:
+                await asyncio.to_thread(out.write_at, first.content, 0)
+                parts = split_ranges(first.total, part_size, len(first.content))
+                async for _ in arun_bounded(fetch, parts, max_workers):
+                    pass
+            finally:
+                out.close()
+        return await asyncio.to_thread(result_for, dest, first.total, hash_algorithm)
+
+    async def put(
+        self,
+        content: Content = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """PUT *content* to this resource.
+
+        *content* may be ``bytes``, a binary file object, an ``os.PathLike``, or a sync or async
+        iterable of ``bytes`` chunks. Anything other than ``bytes`` is streamed in bounded chunks,
+        with a ``content-length`` when the size is known up front and chunked transfer otherwise.
+        """
+        body, body_headers = aprepare_content(content)
+        h = dict(headers or {})
+        h.setdefault("content-type", content_type)
+        for k, v in body_headers.items():
+            h.setdefault(k, v)
+        return await self._send("PUT", signer=signer, headers=h, content=body)
+
+    async def put_if_changed(
+        self,
+        content: Content = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        verify: bool = False,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> PutResult:
+        """Async counterpart of :meth:`Resource.put_if_changed`."""
+        index = self._config.content_index
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            digest = content_digest(content)
+        else:
+            digest = await asyncio.to_thread(content_digest, content)
+        entry = index.get(self._path) if digest is not None else None
+        if entry is not None and entry.digest == digest:
+            if not verify or entry.etag is None:
+                return PutResult(None, sent=False, digest=digest)
+            h = {**(headers or {}), "if-none-match": entry.etag}
+            check = await self.head(signer=signer, headers=h)
+            if check.status_code == 304:
+                return PutResult(check, sent=False, digest=digest)
+        hasher = None
+        if digest is None:
+            content = hasher = AsyncHashingIterator(content)
+        response = await self.put(content, content_type, signer=signer, headers=headers)
+        digest = digest or hasher.hexdigest()
+        if response.is_success:
+            index.record(self._path, digest, response.headers.get("etag"))
+        return PutResult(response, sent=True, digest=digest)
+
+    async def post(
+        self,
+        content: Content = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """POST *content* to this resource; accepts the same body types as :meth:`put`."""
+        body, body_headers = aprepare_content(content)
+        h = dict(headers or {})
+        h.setdefault("content-type", content_type)
+        for k, v in body_headers.items():
+            h.setdefault(k, v)
+        return await self._send("POST", signer=signer, headers=h, content=body)
+
+    async def delete(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self._send("DELETE", signer=signer, headers=headers)
+
+
+async def _aiter_once(data: bytes) -> AsyncIterator[bytes]:
+    if data:
+        yield data
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from wallet_attached_storage_client._async_resource import AsyncResource
+from wallet_attached_storage_client._bulk import DEFAULT_MAX_WORKERS, BulkResult, PutItem, arun_bounded, split_put_item
+from wallet_attached_storage_client._collection import CollectionParser, SpaceItem, link_path
+from wallet_attached_storage_client._config import ClientConfig
+from wallet_attached_storage_client._request import asend, astream
+from wallet_attached_storage_client._urn_uuid import is_urn_uuid, parse_urn_uuid
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+
+class AsyncSpace:
+    """Async counterpart of :class:`Space`, backed by :class:`httpx.AsyncClient`."""
+
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient,
+        id: str,  # noqa: A002
+        signer: Signer | AsyncSigner | None = None,
+        config: ClientConfig | None = None,
+    ) -> None:
+        if not is_urn_uuid(id):
+            raise ValueError(f"Expected a urn:uuid, got {id!r}")
+        self._client = client
+        self._id = id
+        self._uuid = parse_urn_uuid(id)
+        self._signer = signer
+        self._config = config or ClientConfig()
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def path(self) -> str:
+        return f"/space/{self._uuid}"
+
+    async def _send(
+        self,
+        method: str,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+        content: Any = None,
+    ) -> httpx.Response:
+        return await asend(
+            self._client,
+            self._config,
+            method,
+            self.path,
+            signer=signer or self._signer,
+            headers=headers,
+            content=content,
+        )
+
+    async def get(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self._send("GET", signer=signer, headers=headers)
+
+    async def put(
+        self,
+        content: bytes = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        h = dict(headers or {})
+        h.setdefault("content-type", content_type)
+        return await self._send("PUT", signer=signer, headers=h, content=content)
+
+    async def delete(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self._send("DELETE", signer=signer, headers=headers)
+
+    async def iter_items(
+        self,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[SpaceItem]:
+        """Async counterpart of :meth:`Space.iter_items`."""
+        path: str | None = self.path
+        seen: set[str] = set()
+        while path is not None and path not in seen:
+            seen.add(path)
+            parser = CollectionParser()
+            async with astream(
+                self._client, self._config, "GET", path, signer=signer or self._signer, headers=headers
+            ) as response:
+                response.raise_for_status()
+                async for text in response.aiter_text():
+                    for item in parser.feed(text):
+                        yield item
+                for item in parser.close():
+                    yield item
+            link = parser.next_link
+            path = link_path(link) if link is not None else None
+
+    def resource(
+        self,
+        path: str | None = None,
+        *,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncResource:
+        """Create a resource within this space.
+
+        If *path* is ``None``, a random UUID path is generated.
+        """
+        if path is None:
+            path = f"/{uuid.uuid4()}"
+        elif not path.startswith("/"):
+            path = f"/{path}"
+        return AsyncResource(
+            client=self._client,
+            path=f"{self.path}{path}",
+            signer=signer or self._signer,
+            config=self._config,
+        )
+
+    def put_many(
+        self,
+        items: Iterable[PutItem],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        dedup: bool = False,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncIterator[BulkResult]:
+        """PUT many resources concurrently, yielding a :class:`BulkResult` per item as it finishes.
+
+        *items* yields ``(path, content)`` or ``(path, content, content_type)`` tuples, with paths
+        relative to this space as for :meth:`resource`. At most *max_workers* requests are in
+        flight at once, and every request is signed individually. With *dedup*, each item goes
+        through :meth:`AsyncResource.put_if_changed` and unchanged ones are skipped (``sent=False``).
+        """
+
+        async def put_one(item: PutItem) -> BulkResult:
+            path, content, content_type = split_put_item(item)
+            r = self.resource(path, signer=signer)
+            try:
+                if dedup:
+                    result = await r.put_if_changed(content, content_type)
+                    return BulkResult(r.path, response=result.response if result.sent else None, sent=result.sent)
+                return BulkResult(r.path, response=await r.put(content, content_type))
+            except (httpx.HTTPError, OSError, ValueError) as e:
+                # A missing or unreadable local file fails its own item, not the whole batch.
+                return BulkResult(r.path, error=e)
+
+        return arun_bounded(put_one, items, max_workers)
+
+    def get_many(
+        self,
+        paths: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncIterator[BulkResult]:
+        """GET many resources concurrently, yielding a :class:`BulkResult` per path as it finishes."""
+
+        async def get_one(path: str) -> BulkResult:
+            r = self.resource(path, signer=signer)
+            try:
+                return BulkResult(r.path, response=await r.get())
+            except httpx.HTTPError as e:
+                return BulkResult(r.path, error=e)
+
+        return arun_bounded(get_one, paths, max_workers)
+
+    def delete_many(
+        self,
+        paths: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncIterator[BulkResult]:
+        """DELETE many resources concurrently, yielding a :class:`BulkResult` per path as it finishes."""
+
+        async def delete_one(path: str) -> BulkResult:
+            r = self.resource(path, signer=signer)
+            try:
+                return BulkResult(r.path, response=await r.delete())
+            except httpx.HTTPError as e:
+                return BulkResult(r.path, error=e)
+
+        return arun_bounded(delete_one, paths, max_workers)
@@ -0,0 +1,137 @@
+"""Bounded-concurrency helpers behind the ``*_many`` bulk methods on spaces."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TypeVar
+
+import httpx
+
+from wallet_attached_storage_client._content import Content
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+DEFAULT_MAX_WORKERS = 16
+
+PutItem = tuple[str, Content] | tuple[str, Content, str]
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """Outcome of one request issued by a ``*_many`` bulk method.
+
+    Exactly one of *response* and *error* is set, unless a deduplicated PUT was skipped: then
+    *sent* is ``False`` and neither is. Non-2xx responses are returned as-is; only
+    transport-level failures (connection errors, timeouts, ...) and, for PUTs, content that
+    cannot be read (a missing or unreadable file) populate *error*.
+    """
+
+    path: str
+    response: httpx.Response | None = None
+    error: Exception | None = None
+    sent: bool = True
+
+    @property
+    def ok(self) -> bool:
+        if not self.sent:
+            return self.error is None
+        return self.response is not None and self.response.is_success
+
+
+def split_put_item(item: PutItem) -> tuple[str, Content, str]:
+    """Normalise a ``(path, content)`` or ``(path, content, content_type)`` tuple."""
+    if len(item) == 2:
+        path, content = item
+        return path, content, "application/octet-stream"
+    path, content, content_type = item
+    return path, content, content_type
+
+
+def submit_bounded(executor: Executor, fn: Callable[[_T], _R], items: Iterable[_T], window: int) -> Iterator[_R]:
+    """Submit *fn* over *items* to *executor*, keeping at most *window* calls pending.
+
+    Results are yielded in completion order; *items* is consumed lazily.
+    """
+    pending: set[Future[_R]] = set()
+    try:
+        for item in items:
+            pending.add(executor.submit(fn, item))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for f in done:
+                    yield f.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for f in done:
+                yield f.result()
+    finally:
+        for f in pending:
+            f.cancel()
+
+
+def run_bounded(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int) -> Iterator[_R]:
+    """Apply *fn* to *items* on a thread pool, yielding results in completion order.
+
+    At most ``2 * max_workers`` items are pulled from *items* ahead of the consumer, so
+    arbitrarily long (or lazy) inputs run in constant memory.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield from submit_bounded(pool, fn, items, 2 * max_workers)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_ordered(fn: Callable[[_T], _R], items: Iterable[_T], max_workers: int) -> Iterator[_R]:
+    """Like :func:`run_bounded`, but yield results in input order.
+
+    At most ``2 * max_workers`` results are held at once, so a slow item stalls the pipeline
+    rather than letting completed results pile up behind it.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending: deque[Future[_R]] = deque()
+    try:
+        for item in items:
+            pending.append(pool.submit(fn, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for f in pending:
+            f.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def arun_bounded(
+    fn: Callable[[_T], Awaitable[_R]], items: Iterable[_T], max_workers: int
+) -> AsyncIterator[_R]:
+    """Async counterpart of :func:`run_bounded`: at most *max_workers* coroutines run at once."""
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+    pending: set[asyncio.Future[_R]] = set()
+    try:
+        for item in items:
+            pending.add(asyncio.ensure_future(fn(item)))
+            if len(pending) >= max_workers:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for t in done:
+                    yield t.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                yield t.result()
+    finally:
+        for t in pending:
+            t.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
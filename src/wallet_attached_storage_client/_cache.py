@@ -0,0 +1,203 @@
+"""Conditional-GET response caching keyed on resource path."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Protocol, runtime_checkable
+
+import httpx
+
+# Response headers worth replaying when a cached body is served after a 304.
+_REPLAYED_HEADERS = ("content-type", "content-language", "etag", "last-modified")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A cached response body together with the validators used to revalidate it."""
+
+    content: bytes
+    headers: dict[str, str]
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+    def validators(self) -> dict[str, str]:
+        """Return the ``If-None-Match`` / ``If-Modified-Since`` headers for a conditional GET."""
+        v: dict[str, str] = {}
+        if self.etag:
+            v["if-none-match"] = self.etag
+        if self.last_modified:
+            v["if-modified-since"] = self.last_modified
+        return v
+
+
+@runtime_checkable
+class ResponseCache(Protocol):
+    """Storage backend for :class:`CachedResponse` entries, keyed on request path."""
+
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    def set(self, key: str, entry: CachedResponse) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+@dataclass
+class CacheStats:
+    """Running response-cache counters; ``bytes_saved`` counts body bytes served from cache."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_hit(self, size: int) -> None:
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+
+class MemoryResponseCache:
+    """In-memory LRU :class:`ResponseCache` bounded by the total size of cached bodies."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total bytes of cached bodies."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._pop(key)
+            if len(entry.content) > self._max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def _pop(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old.content)
+
+
+class DiskResponseCache:
+    """On-disk :class:`ResponseCache`: one file per path under *directory*.
+
+    Each file holds a one-line JSON header block followed by the raw body. Writes go through a
+    temporary file and ``os.replace`` so concurrent readers never see a torn entry.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self._directory = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self._directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def get(self, key: str) -> CachedResponse | None:
+        try:
+            with open(self._file(key), "rb") as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key:
+            return None
+        return CachedResponse(content=content, headers=meta["headers"])
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        meta = json.dumps({"key": key, "headers": entry.headers}).encode("utf-8")
+        fd, tmp = tempfile.mkstemp(dir=self._directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(meta + b"\n")
+                f.write(entry.content)
+            os.replace(tmp, self._file(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._file(key))
+        except FileNotFoundError:
+            pass
+
+
+def is_conditional(headers: dict[str, str] | None) -> bool:
+    """Return True if caller-supplied *headers* already make the request conditional (or ranged).
+
+    The cache leaves such requests alone: it must not add its own validators to them, and their
+    answers (``304``, ``206``) are not whole bodies it could store.
+    """
+    return bool(headers) and any(k.lower() in ("if-none-match", "if-modified-since", "range") for k in headers)
+
+
+def update_cache(
+    cache: ResponseCache,
+    stats: CacheStats,
+    method: str,
+    path: str,
+    entry: CachedResponse | None,
+    response: httpx.Response,
+) -> httpx.Response:
+    """Fold *response* into *cache* and return what the caller should see.
+
+    A ``304`` for a cached entry is turned back into a ``200`` carrying the cached body; fresh
+    ``200`` responses with an ``ETag`` or ``Last-Modified`` are stored; writes and ``404``
+    responses drop the entry for *path*.
+    """
+    if method != "GET":
+        if method not in ("HEAD", "OPTIONS"):
+            cache.delete(path)
+        return response
+    if response.status_code == 304 and entry is not None:
+        stats.record_hit(len(entry.content))
+        return httpx.Response(200, headers=entry.headers, content=entry.content, request=response.request)
+    stats.record_miss()
+    if response.status_code == 200 and "no-store" not in response.headers.get("cache-control", ""):
+        replayed = {k: response.headers[k] for k in _REPLAYED_HEADERS if k in response.headers}
+        if "etag" in replayed or "last-modified" in replayed:
+            cache.set(path, CachedResponse(content=response.content, headers=replayed))
+    elif response.status_code in (404, 410):
+        cache.delete(path)
+    return response
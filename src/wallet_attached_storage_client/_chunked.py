@@ -0,0 +1,269 @@
+"""Large objects stored as fixed-size chunk resources plus a JSON manifest written last."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+
+from wallet_attached_storage_client._bulk import BulkResult, run_bounded, run_ordered
+from wallet_attached_storage_client._content import _iter_fileobj, _iter_path
+from wallet_attached_storage_client._download import DownloadResult, atomic_destination, write_chunks
+from wallet_attached_storage_client._retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._content import Content
+    from wallet_attached_storage_client._download import Destination
+    from wallet_attached_storage_client._space import Space
+    from wallet_attached_storage_client._types import Signer
+
+CHUNK_PREFIX = "/.chunks"
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+# Up to 2 * workers chunks are buffered at once, so keep this modest for large chunk sizes.
+DEFAULT_CHUNK_WORKERS = 4
+DEFAULT_CHUNK_ATTEMPTS = 3
+MANIFEST_CONTENT_TYPE = "application/vnd.was-chunked-object+json"
+_MANIFEST_TYPE = "ChunkedObject"
+
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class ChunkInfo:
+    """One stored chunk: its resource path (relative to the space), size and SHA-256."""
+
+    path: str
+    size: int
+    digest: str
+
+
+@dataclass(frozen=True)
+class ChunkedManifest:
+    """Describes a chunked object: total *size* and *digest*, and its chunks in order."""
+
+    size: int
+    digest: str
+    chunk_size: int
+    content_type: str
+    chunks: tuple[ChunkInfo, ...]
+
+    def to_json(self) -> bytes:
+        doc: dict[str, Any] = {
+            "type": _MANIFEST_TYPE,
+            "size": self.size,
+            "digest": self.digest,
+            "chunkSize": self.chunk_size,
+            "contentType": self.content_type,
+            "chunks": [{"path": c.path, "size": c.size, "digest": c.digest} for c in self.chunks],
+        }
+        return json.dumps(doc, separators=(",", ":")).encode()
+
+    @classmethod
+    def from_json(cls, data: bytes) -> ChunkedManifest:
+        doc = json.loads(data)
+        if not isinstance(doc, dict) or doc.get("type") != _MANIFEST_TYPE:
+            raise ValueError("Resource is not a chunked object manifest")
+        return cls(
+            size=doc["size"],
+            digest=doc["digest"],
+            chunk_size=doc["chunkSize"],
+            content_type=doc["contentType"],
+            chunks=tuple(ChunkInfo(c["path"], c["size"], c["digest"]) for c in doc["chunks"]),
+        )
+
+
+def chunk_path(object_path: str, index: int, digest: str) -> str:
+    """Hidden resource path for chunk *index* of *object_path*.
+
+    The chunk digest is part of the name, so a leftover chunk from an earlier, different
+    upload is never mistaken for the current one when resuming.
+    """
+    return f"{CHUNK_PREFIX}/{object_path.lstrip('/')}/{index:08d}-{digest}"
+
+
+def split_chunks(content: Content, chunk_size: int) -> Iterator[bytes]:
+    """Re-slice *content* into ``chunk_size``-byte pieces (the last one may be shorter).
+
+    Only one chunk is held at a time, on top of whatever the source hands out.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        view = memoryview(content)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start:start + chunk_size])
+        return
+    source: Iterable[bytes]
+    if isinstance(content, os.PathLike):
+        source = _iter_path(content)
+    elif hasattr(content, "read"):
+        source = _iter_fileobj(content)
+    else:
+        source = content
+    buf = bytearray()
+    for piece in source:
+        buf += piece
+        while len(buf) >= chunk_size:
+            yield bytes(buf[:chunk_size])
+            del buf[:chunk_size]
+    if buf:
+        yield bytes(buf)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _check_attempts(attempts: int) -> None:
+    if attempts < 1:
+        raise ValueError(f"attempts must be >= 1, got {attempts}")
+
+
+def _with_attempts(attempts: int, retry: RetryPolicy | None, fn: Callable[[], _R]) -> _R:
+    # Waits between attempts follow the client's retry policy (or the default one).
+    policy = retry or RetryPolicy()
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except (httpx.HTTPError, ValueError) as e:
+            if attempt >= attempts:
+                raise
+            response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+            time.sleep(policy.delay(attempt, response))
+        attempt += 1
+
+
+def _previous_manifest(space: Space, path: str, *, signer: Signer | None) -> ChunkedManifest | None:
+    # Only the headers are read unless *path* already holds a manifest, so overwriting a large
+    # plain resource does not download it.
+    with space.resource(path, signer=signer).stream() as response:
+        if response.status_code == 404 or response.headers.get("content-type") != MANIFEST_CONTENT_TYPE:
+            return None
+        response.raise_for_status()
+        try:
+            return ChunkedManifest.from_json(response.read())
+        except (KeyError, ValueError):
+            return None
+
+
+def put_chunked(
+    space: Space,
+    path: str,
+    content: Content,
+    content_type: str,
+    *,
+    chunk_size: int,
+    max_workers: int,
+    attempts: int,
+    resume: bool,
+    retry: RetryPolicy | None,
+    signer: Signer | None,
+) -> ChunkedManifest:
+    _check_attempts(attempts)
+    previous = _previous_manifest(space, path, signer=signer)
+    total = hashlib.sha256()
+    size = 0
+
+    def numbered() -> Iterator[tuple[int, bytes]]:
+        # Pulled on the calling thread, in order, so the whole-object digest can be updated here.
+        nonlocal size
+        for index, data in enumerate(split_chunks(content, chunk_size)):
+            total.update(data)
+            size += len(data)
+            yield index, data
+
+    def upload(item: tuple[int, bytes]) -> tuple[int, ChunkInfo]:
+        index, data = item
+        digest = _digest(data)
+        info = ChunkInfo(chunk_path(path, index, digest), len(data), digest)
+        resource = space.resource(info.path, signer=signer)
+
+        def attempt() -> None:
+            if resume and resource.head().is_success:
+                return
+            resource.put(data).raise_for_status()
+
+        _with_attempts(attempts, retry, attempt)
+        return index, info
+
+    chunks = tuple(info for _, info in sorted(run_bounded(upload, numbered(), max_workers)))
+    manifest = ChunkedManifest(size, total.hexdigest(), chunk_size, content_type, chunks)
+    space.resource(path, signer=signer).put(manifest.to_json(), MANIFEST_CONTENT_TYPE).raise_for_status()
+    if previous is not None:
+        # Chunks only the replaced manifest referenced are unreachable now; a failed delete
+        # just leaves an orphan behind, so it does not fail the upload.
+        current = {c.path for c in chunks}
+        stale = [c.path for c in previous.chunks if c.path not in current]
+        for _ in space.delete_many(stale, max_workers=max_workers, signer=signer):
+            pass
+    return manifest
+
+
+def get_manifest(space: Space, path: str, *, signer: Signer | None) -> ChunkedManifest:
+    response = space.resource(path, signer=signer).get()
+    response.raise_for_status()
+    return ChunkedManifest.from_json(response.content)
+
+
+def iter_chunks(
+    space: Space,
+    manifest: ChunkedManifest,
+    *,
+    max_workers: int,
+    attempts: int,
+    retry: RetryPolicy | None,
+    signer: Signer | None,
+) -> Iterator[bytes]:
+    _check_attempts(attempts)
+
+    def fetch(info: ChunkInfo) -> bytes:
+        def attempt() -> bytes:
+            response = space.resource(info.path, signer=signer).get()
+            response.raise_for_status()
+            if _digest(response.content) != info.digest:
+                raise ValueError(f"Chunk {info.path} does not match its manifest digest")
+            return response.content
+
+        return _with_attempts(attempts, retry, attempt)
+
+    return run_ordered(fetch, manifest.chunks, max_workers)
+
+
+def download_chunked(
+    space: Space,
+    path: str,
+    dest: Destination,
+    *,
+    max_workers: int,
+    attempts: int,
+    retry: RetryPolicy | None,
+    signer: Signer | None,
+) -> DownloadResult:
+    _check_attempts(attempts)
+    manifest = get_manifest(space, path, signer=signer)
+    chunks = iter_chunks(space, manifest, max_workers=max_workers, attempts=attempts, retry=retry, signer=signer)
+    if not isinstance(dest, (str, os.PathLike)):
+        return _verified(write_chunks(chunks, dest, "sha256"), manifest, path)
+    # Check the digest before the reassembled file replaces anything already at *dest*.
+    with atomic_destination(dest) as tmp, open(tmp, "xb") as f:
+        return _verified(write_chunks(chunks, f, "sha256"), manifest, path)
+
+
+def _verified(result: DownloadResult, manifest: ChunkedManifest, path: str) -> DownloadResult:
+    if result.digest != manifest.digest:
+        raise ValueError(f"Reassembled {path} does not match its manifest digest")
+    return result
+
+
+def delete_chunked(space: Space, path: str, *, max_workers: int, signer: Signer | None) -> list[BulkResult]:
+    manifest = get_manifest(space, path, signer=signer)
+    # Drop the manifest first so readers never see an object with missing chunks.
+    space.resource(path, signer=signer).delete().raise_for_status()
+    return list(space.delete_many((c.path for c in manifest.chunks), max_workers=max_workers, signer=signer))
@@ -1,13 +1,24 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import httpx
 
+from wallet_attached_storage_client._coalesce import RequestCoalescer
+from wallet_attached_storage_client._config import ClientConfig, ConnectionOptions
 from wallet_attached_storage_client._space import Space
 from wallet_attached_storage_client._urn_uuid import make_urn_uuid
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from wallet_attached_storage_client._cache import CacheStats, ResponseCache
+    from wallet_attached_storage_client._dedup import ContentIndex
+    from wallet_attached_storage_client._http_signature import SignatureCache
+    from wallet_attached_storage_client._instrument import Observer
+    from wallet_attached_storage_client._limiter import AdaptiveLimiter
+    from wallet_attached_storage_client._retry import RetryPolicy
     from wallet_attached_storage_client._types import Signer
 
 
@@ -19,13 +30,58 @@ class StorageClient:
         base_url: str,
         *,
         httpx_client: httpx.Client | None = None,
+        signature_cache: SignatureCache | None = None,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        coalesce: bool = False,
+        limiter: AdaptiveLimiter | None = None,
+        content_index: ContentIndex | None = None,
     ) -> None:
         if httpx_client is not None:
+            if connection is not None:
+                raise ValueError("Pass either httpx_client or connection, not both")
             self._client = httpx_client
             self._owns_client = False
         else:
-            self._client = httpx.Client(base_url=base_url)
+            connection = connection or ConnectionOptions()
+            self._client = httpx.Client(base_url=base_url, **connection.client_kwargs())
             self._owns_client = True
+        self._config = ClientConfig(
+            signature_cache=signature_cache,
+            response_cache=response_cache,
+            retry=retry,
+            observers=list(observers),
+            coalescer=RequestCoalescer() if coalesce else None,
+            limiter=limiter,
+        )
+        if content_index is not None:
+            self._config.content_index = content_index
+
+    @property
+    def coalescer(self) -> RequestCoalescer | None:
+        """The shared :class:`RequestCoalescer` when created with ``coalesce=True``, else ``None``."""
+        return self._config.coalescer
+
+    @property
+    def limiter(self) -> AdaptiveLimiter | None:
+        """The :class:`AdaptiveLimiter` every request goes through, if one was given."""
+        return self._config.limiter
+
+    @property
+    def content_index(self) -> ContentIndex:
+        """Digests of content last written by ``put_if_changed``, used to skip identical uploads."""
+        return self._config.content_index
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Hit, miss and bytes-saved counters for the *response_cache* (all zero without one)."""
+        return self._config.cache_stats
+
+    def add_observer(self, observer: Observer) -> None:
+        """Register a callable that receives a :class:`RequestRecord` after every request attempt."""
+        self._config.observers.append(observer)
 
     def space(
         self,
@@ -43,8 +99,30 @@ class StorageClient:
             client=self._client,
             id=id,
             signer=signer,
+            config=self._config,
         )
 
+    def warmup(self, n: int) -> int:
+        """Open up to *n* pooled connections ahead of time.
+
+        Issues *n* concurrent unsigned ``HEAD /`` requests so the pool establishes (and keeps
+        alive) that many connections before real traffic arrives. Only connections within
+        ``max_keepalive_connections`` survive afterwards. Returns how many probes got a
+        response of any status.
+        """
+        if n < 1:
+            return 0
+
+        def probe(_: int) -> bool:
+            try:
+                self._client.request("HEAD", "/")
+            except httpx.HTTPError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            return sum(pool.map(probe, range(n)))
+
     def close(self) -> None:
         if self._owns_client:
             self._client.close()
@@ -0,0 +1,107 @@
+"""Request coalescing ("singleflight"): concurrent identical GETs share one in-flight request."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+
+def coalesce_key(
+    path: str, signer: Signer | AsyncSigner | None, headers: dict[str, str] | None
+) -> tuple[Hashable, ...]:
+    """Key under which GETs are considered identical: path, signer identity and any extra headers."""
+    return (path, signer.id if signer is not None else None, *sorted((headers or {}).items()))
+
+
+# The body is handed over already decoded, so framing and encoding headers no longer apply.
+_DROPPED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+def _copy(response: httpx.Response) -> httpx.Response:
+    # Every caller gets its own (already read) response object; only the body bytes are shared.
+    return httpx.Response(
+        response.status_code,
+        headers=[(k, v) for k, v in response.headers.multi_items() if k not in _DROPPED_HEADERS],
+        content=response.content,
+        request=response.request,
+        extensions=response.extensions,
+    )
+
+
+class _Call:
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: httpx.Response | None = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Collapse concurrent calls with the same key into a single request.
+
+    The first caller for a key (the leader) performs the request; callers that arrive while it
+    is in flight wait for it and receive a copy of its response, or the same exception. Nothing
+    is remembered once the request finishes, so this never serves stale data — pair it with a
+    response cache for that. Thread-safe; async callers are coalesced per event loop.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._tasks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[httpx.Response]] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], httpx.Response]) -> httpx.Response:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.requests += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _copy(call.response)
+        try:
+            call.response = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.response
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        task_key = (loop, key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            # Run the request as its own task so cancelling the first caller does not cancel it
+            # for everyone else waiting on the same result.
+            task = self._tasks[task_key] = loop.create_task(fn())
+            task.add_done_callback(lambda t: self._finish(task_key, t))
+            with self._lock:
+                self.requests += 1
+        else:
+            with self._lock:
+                self.coalesced += 1
+        return _copy(await asyncio.shield(task))
+
+    def _finish(self, task_key: tuple[asyncio.AbstractEventLoop, Hashable], task: asyncio.Task[httpx.Response]) -> None:
+        self._tasks.pop(task_key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every waiter was cancelled
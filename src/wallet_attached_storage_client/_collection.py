@@ -0,0 +1,193 @@
+"""Incremental parsing of (paged) ActivityStreams ``Collection`` bodies returned for a space."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+_ITEM_KEYS = frozenset({"items", "orderedItems"})
+_WHITESPACE = " \t\n\r"
+# Compact the buffer once this much of it has been consumed.
+_COMPACT_AT = 64 * 1024
+
+
+@dataclass(frozen=True)
+class SpaceItem:
+    """One entry of a space listing.
+
+    Collections may list items as bare links or as objects; a bare link becomes a
+    ``SpaceItem`` with only :attr:`id` set. The original JSON value is kept in :attr:`data`.
+    """
+
+    id: str | None
+    type: str | list[str] | None = None
+    name: str | None = None
+    url: str | None = None
+    data: dict[str, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_json(cls, value: Any) -> SpaceItem:
+        if isinstance(value, str):
+            return cls(id=value, data={"id": value})
+        if not isinstance(value, dict):
+            raise ValueError(f"Unexpected collection item: {value!r}")
+        url = value.get("url")
+        if isinstance(url, dict):
+            url = url.get("href")
+        return cls(id=value.get("id"), type=value.get("type"), name=value.get("name"), url=url, data=value)
+
+
+class _IncompleteError(Exception):
+    """More input is needed before the next token can be parsed."""
+
+
+class CollectionParser:
+    """Push parser that yields collection items as soon as each one is complete.
+
+    Feed decoded text with :meth:`feed` and finish with :meth:`close`. Only the top-level
+    ``items``/``orderedItems`` array is streamed; every other top-level member is small and is
+    decoded whole into :attr:`fields` (an embedded ``first`` page is decoded whole as well, and its
+    items are yielded). Memory use is bounded by the largest single item, not the collection.
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        # "start" -> "key" <-> "value"/"array" -> "end"
+        self._state = "start"
+        self._key: str | None = None
+        self._first_member = True
+        self._first_element = True
+        self._had_items = False
+
+    @property
+    def next_link(self) -> str | None:
+        """URL of the page to fetch after this one, if the server advertised one."""
+        link = _link(self.fields.get("next"))
+        if link is not None:
+            return link
+        first = self.fields.get("first")
+        if isinstance(first, dict):
+            return _link(first.get("next"))
+        # Pages may point back at the first page; only a collection without items is followed there.
+        return None if self._had_items else _link(first)
+
+    def feed(self, text: str) -> Iterator[SpaceItem]:
+        self._buf += text
+        return self._parse()
+
+    def close(self) -> Iterator[SpaceItem]:
+        self._eof = True
+        yield from self._parse()
+        if self._state != "end":
+            raise ValueError("Truncated collection body")
+        if self._skip_ws() < len(self._buf):
+            raise ValueError("Unexpected data after collection body")
+
+    def _skip_ws(self) -> int:
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos
+
+    def _peek(self) -> str:
+        pos = self._skip_ws()
+        if pos >= len(self._buf):
+            raise _IncompleteError
+        return self._buf[pos]
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self._pos} of collection body")
+        self._pos += 1
+
+    def _value(self) -> Any:
+        self._skip_ws()
+        try:
+            value, end = self._decoder.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            raise _IncompleteError from None
+        if end == len(self._buf) and not self._eof and type(value) in (int, float):
+            # A number running to the end of the buffer may continue in the next chunk.
+            raise _IncompleteError
+        self._pos = end
+        return value
+
+    def _parse(self) -> Iterator[SpaceItem]:
+        while self._state != "end":
+            mark = self._pos
+            try:
+                item = self._step()
+            except _IncompleteError:
+                self._pos = mark
+                break
+            if item is not None:
+                yield from item
+        if self._pos >= _COMPACT_AT:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+    def _step(self) -> list[SpaceItem] | None:
+        if self._state == "start":
+            self._expect("{")
+            self._state = "key"
+        elif self._state == "key":
+            if self._peek() == "}":
+                self._pos += 1
+                self._state = "end"
+                return None
+            if not self._first_member:
+                self._expect(",")
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError("Collection member names must be strings")
+            self._expect(":")
+            self._key = key
+            self._first_member = False
+            self._state = "value"
+        elif self._state == "value":
+            if self._key in _ITEM_KEYS and self._peek() == "[":
+                self._pos += 1
+                self._first_element = True
+                self._had_items = True
+                self._state = "array"
+                return None
+            value = self._value()
+            self.fields[self._key] = value
+            self._state = "key"
+            if self._key == "first" and isinstance(value, dict):
+                page = value.get("orderedItems", value.get("items", []))
+                return [SpaceItem.from_json(v) for v in page]
+        else:  # array
+            if self._peek() == "]":
+                self._pos += 1
+                self._state = "key"
+                return None
+            if not self._first_element:
+                self._expect(",")
+            item = SpaceItem.from_json(self._value())
+            self._first_element = False
+            return [item]
+        return None
+
+
+def _link(value: Any) -> str | None:
+    if isinstance(value, dict):
+        value = value.get("id")
+    return value if isinstance(value, str) else None
+
+
+def link_path(link: str) -> str:
+    """Reduce a (possibly absolute) pagination link to the path+query the client requests."""
+    url = httpx.URL(link)
+    return url.raw_path.decode("ascii") if url.is_absolute_url else link
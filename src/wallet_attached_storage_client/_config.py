@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import httpx
+
+from wallet_attached_storage_client._cache import CacheStats
+from wallet_attached_storage_client._dedup import ContentIndex
+from wallet_attached_storage_client._http_signature import SignatureTemplate, compile_signature_template
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._cache import ResponseCache
+    from wallet_attached_storage_client._coalesce import RequestCoalescer
+    from wallet_attached_storage_client._http_signature import SignatureCache
+    from wallet_attached_storage_client._instrument import Observer
+    from wallet_attached_storage_client._limiter import AdaptiveLimiter
+    from wallet_attached_storage_client._retry import RetryPolicy
+
+
+@dataclass
+class ClientConfig:
+    """Client-wide settings shared by every :class:`Space` and :class:`Resource` a client hands out."""
+
+    signature_template: SignatureTemplate = field(default_factory=compile_signature_template)
+    signature_cache: SignatureCache | None = None
+    response_cache: ResponseCache | None = None
+    cache_stats: CacheStats = field(default_factory=CacheStats)
+    retry: RetryPolicy | None = None
+    observers: list[Observer] = field(default_factory=list)
+    coalescer: RequestCoalescer | None = None
+    limiter: AdaptiveLimiter | None = None
+    content_index: ContentIndex = field(default_factory=ContentIndex)
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    """Connection-pool, keep-alive, HTTP/2 and timeout settings for a client-owned ``httpx`` pool.
+
+    Defaults match ``httpx``. Each per-phase timeout falls back to *timeout* when left as
+    ``None``; a *timeout* of ``None`` disables timeouts entirely. HTTP/2 requires the optional
+    ``h2`` package (``pip install httpx[http2]``).
+    """
+
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    http2: bool = False
+    timeout: float | None = 5.0
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self) -> httpx.Timeout:
+        def phase(value: float | None) -> float | None:
+            return self.timeout if value is None else value
+
+        return httpx.Timeout(
+            connect=phase(self.connect_timeout),
+            read=phase(self.read_timeout),
+            write=phase(self.write_timeout),
+            pool=phase(self.pool_timeout),
+        )
+
+    def client_kwargs(self) -> dict[str, object]:
+        """Keyword arguments for ``httpx.Client`` / ``httpx.AsyncClient``."""
+        return {"limits": self.limits(), "timeout": self.timeouts(), "http2": self.http2}
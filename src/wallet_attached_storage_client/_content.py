@@ -0,0 +1,99 @@
+"""Normalise request bodies so uploads stream in fixed-size chunks instead of being buffered."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import BinaryIO
+
+CHUNK_SIZE = 64 * 1024
+
+Content = bytes | bytearray | memoryview | BinaryIO | os.PathLike[str] | Iterable[bytes] | AsyncIterable[bytes]
+"""Anything :meth:`Resource.put` / :meth:`Resource.post` accept as a request body."""
+
+_SyncBody = bytes | str | Iterable[bytes]
+_AsyncBody = bytes | str | AsyncIterable[bytes]
+
+
+def _remaining_length(fileobj: BinaryIO) -> int | None:
+    """Return the number of bytes left in a seekable *fileobj*, or ``None`` if unknown."""
+    try:
+        if not fileobj.seekable():
+            return None
+        pos = fileobj.tell()
+        end = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(pos)
+    except (AttributeError, OSError):
+        return None
+    return end - pos
+
+
+def _iter_fileobj(fileobj: BinaryIO) -> Iterator[bytes]:
+    while chunk := fileobj.read(CHUNK_SIZE):
+        yield chunk
+
+
+def _iter_path(path: os.PathLike[str]) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        yield from _iter_fileobj(f)
+
+
+async def _aiter_fileobj(fileobj: BinaryIO) -> AsyncIterator[bytes]:
+    while chunk := await asyncio.to_thread(fileobj.read, CHUNK_SIZE):
+        yield chunk
+
+
+async def _aiter_path(path: os.PathLike[str]) -> AsyncIterator[bytes]:
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        async for chunk in _aiter_fileobj(f):
+            yield chunk
+    finally:
+        f.close()
+
+
+async def _aiter_sync(it: Iterable[bytes]) -> AsyncIterator[bytes]:
+    for chunk in it:
+        yield chunk
+
+
+def prepare_content(content: Content) -> tuple[_SyncBody, dict[str, str]]:
+    """Turn *content* into an ``httpx`` request body for a blocking client.
+
+    Returns the body plus any extra headers: a ``content-length`` when the size is known up
+    front (paths, seekable files), otherwise ``httpx`` falls back to chunked transfer.
+    Non-``bytes`` bodies are read lazily, :data:`CHUNK_SIZE` bytes at a time.
+    """
+    if isinstance(content, (bytes, str)):
+        return content, {}
+    if isinstance(content, (bytearray, memoryview)):
+        return bytes(content), {}
+    if isinstance(content, os.PathLike):
+        return _iter_path(content), {"content-length": str(os.stat(content).st_size)}
+    if hasattr(content, "read"):
+        length = _remaining_length(content)
+        return _iter_fileobj(content), {} if length is None else {"content-length": str(length)}
+    if isinstance(content, AsyncIterable):
+        raise TypeError("Async iterables can only be uploaded with AsyncResource")
+    if isinstance(content, Iterable):
+        return content, {}
+    raise TypeError(f"Unsupported content type: {type(content).__name__}")
+
+
+def aprepare_content(content: Content) -> tuple[_AsyncBody, dict[str, str]]:
+    """Async counterpart of :func:`prepare_content`; file reads run off the event loop."""
+    if isinstance(content, (bytes, str)):
+        return content, {}
+    if isinstance(content, (bytearray, memoryview)):
+        return bytes(content), {}
+    if isinstance(content, os.PathLike):
+        return _aiter_path(content), {"content-length": str(os.stat(content).st_size)}
+    if hasattr(content, "read"):
+        length = _remaining_length(content)
+        return _aiter_fileobj(content), {} if length is None else {"content-length": str(length)}
+    if isinstance(content, AsyncIterable):
+        return content, {}
+    if isinstance(content, Iterable):
+        return _aiter_sync(content), {}
+    raise TypeError(f"Unsupported content type: {type(content).__name__}")
@@ -0,0 +1,148 @@
+"""Content-hash deduplication: remember what each path holds so identical PUTs can be skipped."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+
+from wallet_attached_storage_client._content import _aiter_fileobj, _iter_fileobj, _remaining_length
+
+if TYPE_CHECKING:
+    import httpx
+
+    from wallet_attached_storage_client._content import Content
+
+HASH_ALGORITHM = "sha256"
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    digest: str
+    etag: str | None = None
+
+
+@dataclass(frozen=True)
+class PutResult:
+    """Outcome of :meth:`Resource.put_if_changed`.
+
+    *sent* is ``False`` when the upload was skipped because the resource already holds the
+    same bytes; *response* is then ``None``, or the ``304`` answer to the ETag check when
+    ``verify=True``. *digest* is the SHA-256 of the content.
+    """
+
+    response: httpx.Response | None
+    sent: bool
+    digest: str
+
+    @property
+    def ok(self) -> bool:
+        return not self.sent or (self.response is not None and self.response.is_success)
+
+
+class ContentIndex:
+    """Thread-safe LRU map from resource path to the digest (and ETag) of its last known content.
+
+    Entries are recorded after successful :meth:`Resource.put_if_changed` uploads and dropped
+    whenever any other write to the same path goes through the client.
+    """
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, IndexEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str) -> IndexEntry | None:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries.move_to_end(path)
+            return entry
+
+    def record(self, path: str, digest: str, etag: str | None = None) -> None:
+        with self._lock:
+            self._entries[path] = IndexEntry(digest, etag)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, path: str) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def content_digest(content: Content) -> str | None:
+    """Hash *content* up front if that can be done without consuming it, else return ``None``.
+
+    ``bytes``-like values are hashed directly, paths are read once, and seekable files are read
+    and then rewound. Iterators and unseekable streams return ``None``; hash them on the way
+    out with :class:`HashingIterator` instead.
+    """
+    if isinstance(content, str):
+        content = content.encode()
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return hashlib.new(HASH_ALGORITHM, content).hexdigest()
+    if isinstance(content, os.PathLike):
+        with open(content, "rb") as f:
+            return hashlib.file_digest(f, HASH_ALGORITHM).hexdigest()
+    if hasattr(content, "read") and _remaining_length(content) is not None:
+        pos = content.tell()
+        h = hashlib.new(HASH_ALGORITHM)
+        for chunk in _iter_fileobj(content):
+            h.update(chunk)
+        content.seek(pos)
+        return h.hexdigest()
+    return None
+
+
+class _Hasher:
+    def __init__(self) -> None:
+        self._hash = hashlib.new(HASH_ALGORITHM)
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class HashingIterator(_Hasher):
+    """Pass the chunks of a streamed body through unchanged while hashing them."""
+
+    def __init__(self, content: Iterable[bytes] | BinaryIO) -> None:
+        super().__init__()
+        self._content = _iter_fileobj(content) if hasattr(content, "read") else content
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._content:
+            self._hash.update(chunk)
+            yield chunk
+
+
+class AsyncHashingIterator(_Hasher):
+    """Async counterpart of :class:`HashingIterator`."""
+
+    def __init__(self, content: Iterable[bytes] | AsyncIterable[bytes] | BinaryIO) -> None:
+        super().__init__()
+        self._content = content
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        content = self._content
+        if hasattr(content, "read"):
+            content = _aiter_fileobj(content)
+        if isinstance(content, AsyncIterable):
+            async for chunk in content:
+                self._hash.update(chunk)
+                yield chunk
+        else:
+            for chunk in content:
+                self._hash.update(chunk)
+                yield chunk
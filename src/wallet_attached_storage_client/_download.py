@@ -0,0 +1,87 @@
+"""Write streamed response bodies to disk without buffering them in memory."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import secrets
+from collections.abc import AsyncIterable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import BinaryIO
+
+Destination = str | os.PathLike[str] | BinaryIO
+
+
+@dataclass(frozen=True)
+class DownloadResult:
+    """Summary of a completed :meth:`Resource.download_to` call."""
+
+    bytes_written: int
+    digest: str | None = None
+    """Hex digest of the body when a *hash_algorithm* was requested, else ``None``."""
+
+
+def _new_hash(hash_algorithm: str | None) -> hashlib._Hash | None:
+    return hashlib.new(hash_algorithm) if hash_algorithm else None
+
+
+@contextmanager
+def atomic_destination(dest: str | os.PathLike[str]) -> Iterator[str]:
+    """Yield a temporary path next to *dest* that replaces *dest* only if the block succeeds.
+
+    On failure only the temporary file is removed, so an existing *dest* is left untouched.
+    Open the temporary path with mode ``"xb"``; its name is unique but not reserved.
+    """
+    head, tail = os.path.split(os.fspath(dest))
+    tmp = os.path.join(head, f".{tail}.{secrets.token_hex(4)}.part")
+    try:
+        yield tmp
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_chunks(chunks: Iterable[bytes], dest: Destination, hash_algorithm: str | None = None) -> DownloadResult:
+    """Write *chunks* to *dest* (a path or binary file object), hashing as they pass through.
+
+    When *dest* is a path, the body goes to a temporary file that replaces *dest* once the
+    transfer completes, so a failed transfer leaves any existing file at *dest* as it was.
+    """
+    h = _new_hash(hash_algorithm)
+    written = 0
+    if isinstance(dest, (str, os.PathLike)):
+        with atomic_destination(dest) as tmp, open(tmp, "xb") as f:
+            return write_chunks(chunks, f, hash_algorithm)
+    for chunk in chunks:
+        dest.write(chunk)
+        if h is not None:
+            h.update(chunk)
+        written += len(chunk)
+    return DownloadResult(bytes_written=written, digest=h.hexdigest() if h is not None else None)
+
+
+async def awrite_chunks(
+    chunks: AsyncIterable[bytes], dest: Destination, hash_algorithm: str | None = None
+) -> DownloadResult:
+    """Async counterpart of :func:`write_chunks`; file writes run off the event loop."""
+    h = _new_hash(hash_algorithm)
+    written = 0
+    if isinstance(dest, (str, os.PathLike)):
+        with atomic_destination(dest) as tmp:
+            f = await asyncio.to_thread(open, tmp, "xb")
+            try:
+                return await awrite_chunks(chunks, f, hash_algorithm)
+            finally:
+                f.close()
+    async for chunk in chunks:
+        await asyncio.to_thread(dest.write, chunk)
+        if h is not None:
+            h.update(chunk)
+        written += len(chunk)
+    return DownloadResult(bytes_written=written, digest=h.hexdigest() if h is not None else None)
@@ -0,0 +1,454 @@
+"""An in-process Wallet Attached Storage server, exposed as an httpx transport.
+
+Intended for tests and offline load tests: it verifies the client's HTTP signatures and keeps
+spaces and resources in memory, so whole workloads run without a server or network.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import binascii
+import functools
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import base58
+import httpx
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._http_signature import _DEFAULT_INCLUDE_HEADERS, compile_signature_template
+from wallet_attached_storage_client._urn_uuid import make_urn_uuid
+
+DEFAULT_BASE_URL = "https://was.emulator"
+DEFAULT_CLOCK_SKEW = 5.0
+"""Seconds of clock difference tolerated when checking ``(created)`` and ``(expires)``."""
+
+_MULTICODEC_ED25519_PUB = b"\xed\x01"
+_REQUIRED_HEADERS = frozenset(_DEFAULT_INCLUDE_HEADERS)
+_SIGNATURE_PARAM_RE = re.compile(r'(\w+)="([^"]*)"')
+_RANGE_RE = re.compile(r"bytes=(\d*)-(\d*)")
+_SPACE_PATH_RE = re.compile(r"/space/([^/]+)(/.*)?")
+
+Latency = float | Callable[[httpx.Request], float]
+"""Seconds to delay each request, or a function of the request returning them."""
+
+
+@dataclass(frozen=True)
+class EmulatorStats:
+    """Counters accumulated by a :class:`WasEmulator` since it was created or last :meth:`~WasEmulator.reset`."""
+
+    requests: int
+    injected_errors: int
+    bytes_received: int
+    bytes_sent: int
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Object:
+    content: bytes
+    content_type: str
+    etag: str
+
+
+@dataclass
+class _Space:
+    controller: str
+    objects: dict[str, _Object] = field(default_factory=dict)
+
+
+class _RejectError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+@functools.lru_cache(maxsize=1024)
+def resolve_did_key(key_id: str) -> Ed25519PublicKey:
+    """Return the Ed25519 public key named by a ``did:key:z...`` DID or ``did:key:z...#z...`` key id.
+
+    Raises ``ValueError`` for any other DID method or key type.
+    """
+    did, _, fragment = key_id.partition("#")
+    fingerprint = did.removeprefix("did:key:")
+    if fingerprint == did or not fingerprint.startswith("z") or fragment not in ("", fingerprint):
+        raise ValueError(f"Unsupported key id: {key_id!r}")
+    try:
+        multikey = base58.b58decode(fingerprint[1:])
+    except ValueError:
+        raise ValueError(f"Invalid base58 in key id: {key_id!r}") from None
+    if len(multikey) != 34 or not multikey.startswith(_MULTICODEC_ED25519_PUB):
+        raise ValueError(f"Not an Ed25519 did:key: {key_id!r}")
+    return Ed25519PublicKey.from_public_bytes(multikey[2:])
+
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def _etag_matches(header: str | None, etag: str | None) -> bool:
+    if header is None or etag is None:
+        return False
+    return any(tag.strip() in ("*", etag, f"W/{etag}") for tag in header.split(","))
+
+
+def _problem(status: int, message: str) -> httpx.Response:
+    return httpx.Response(status, json={"title": message})
+
+
+class WasEmulator(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """A Wallet Attached Storage server that runs inside the client's process.
+
+    Pass it as the ``transport`` of an ``httpx.Client`` or ``httpx.AsyncClient``; :meth:`client`
+    and :meth:`async_client` do so for you. One emulator can serve several clients, sync or async,
+    from any number of threads.
+
+    It behaves like a WAS server for the protocol this package speaks:
+
+    - A signed ``PUT /space/<uuid>`` with ``{"controller": "did:key:..."}`` provisions a space;
+      the request must be signed by that controller (or, for an existing space, by its current one).
+    - ``GET`` on the space returns its JSON with a ``Collection`` listing of its resources, split
+      into pages linked by ``next`` when *page_size* is set. ``DELETE`` removes the space.
+    - ``PUT``, ``POST``, ``GET``, ``HEAD`` and ``DELETE`` on ``/space/<uuid>/<path>`` manage
+      resources. Responses carry a strong ``ETag``; ``If-None-Match``, ``If-Match`` and single
+      ``Range`` requests (with ``If-Range``) are honoured.
+    - ``Authorization`` signatures are verified against the ``did:key`` in ``keyId``, including
+      the ``(created)``/``(expires)`` window. A bad signature is ``401``; writes by anyone but the
+      space controller are ``403``. Reads need the controller too unless *public_reads* is set.
+
+    For load tests, *latency* delays every request (a fixed number of seconds or a function of
+    the request), *error_rate* makes that fraction of requests fail with *error_status* before
+    they touch any state, and :meth:`fail_next` queues specific failures. Pass *seed* for a
+    repeatable error sequence and *clock* to test signature expiry.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: Latency = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int | None = None,
+        page_size: int | None = None,
+        public_reads: bool = False,
+        clock_skew: float = DEFAULT_CLOCK_SKEW,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate must be in [0, 1], got {error_rate}")
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"page_size must be >= 1, got {page_size}")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.page_size = page_size
+        self.public_reads = public_reads
+        self._clock_skew = clock_skew
+        self._clock = clock
+        self._random = random.Random(seed)  # noqa: S311 - fault injection, not cryptography
+        self._lock = threading.Lock()
+        self._spaces: dict[str, _Space] = {}
+        self._failures: deque[tuple[int, dict[str, str]]] = deque()
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self._requests = 0
+        self._injected = 0
+        self._received = 0
+        self._sent = 0
+        self._statuses: Counter[int] = Counter()
+
+    # -- setup and inspection ------------------------------------------------------------------
+
+    def provision(self, space_id: str | None = None, *, controller: str) -> str:
+        """Create (or re-own) a space directly, without a signed request; returns its ``urn:uuid``."""
+        space_id = space_id or make_urn_uuid()
+        key = self._space_key(space_id.removeprefix("urn:uuid:"))
+        if key is None:
+            raise ValueError(f"Expected a urn:uuid, got {space_id!r}")
+        with self._lock:
+            space = self._spaces.setdefault(key, _Space(controller))
+            space.controller = controller
+        return space_id
+
+    def fail_next(self, count: int = 1, status: int = 503, *, retry_after: float | None = None) -> None:
+        """Answer the next *count* requests with *status*, optionally advertising ``Retry-After``."""
+        headers = {"retry-after": f"{retry_after:g}"} if retry_after is not None else {}
+        with self._lock:
+            self._failures.extend((status, headers) for _ in range(count))
+
+    def stats(self) -> EmulatorStats:
+        with self._lock:
+            return EmulatorStats(
+                requests=self._requests,
+                injected_errors=self._injected,
+                bytes_received=self._received,
+                bytes_sent=self._sent,
+                statuses=dict(self._statuses),
+            )
+
+    def reset(self) -> None:
+        """Drop every space, queued failure and counter."""
+        with self._lock:
+            self._spaces.clear()
+            self._failures.clear()
+            self._reset_stats()
+
+    def client(self, base_url: str = DEFAULT_BASE_URL, **kwargs: Any) -> StorageClient:
+        """A :class:`StorageClient` wired to this emulator; *kwargs* go to its constructor."""
+        hx = httpx.Client(base_url=base_url, transport=self)
+        return StorageClient(base_url, httpx_client=hx, **kwargs)
+
+    def async_client(self, base_url: str = DEFAULT_BASE_URL, **kwargs: Any) -> AsyncStorageClient:
+        """An :class:`AsyncStorageClient` wired to this emulator; *kwargs* go to its constructor."""
+        hx = httpx.AsyncClient(base_url=base_url, transport=self)
+        return AsyncStorageClient(base_url, httpx_client=hx, **kwargs)
+
+    # -- transport ---------------------------------------------------------------------------
+
+    def _delay(self, request: httpx.Request) -> float:
+        latency = self.latency
+        return latency(request) if callable(latency) else latency
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        delay = self._delay(request)
+        if delay > 0:
+            time.sleep(delay)
+        return self._handle(request, body)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        delay = self._delay(request)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self._handle(request, body)
+
+    def _handle(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        response = self._injected_failure()
+        if response is None:
+            try:
+                response = self._dispatch(request, body)
+            except _RejectError as exc:
+                response = _problem(exc.status, str(exc))
+        with self._lock:
+            self._requests += 1
+            self._received += len(body)
+            self._sent += len(response.content)
+            self._statuses[response.status_code] += 1
+        return response
+
+    def _injected_failure(self) -> httpx.Response | None:
+        with self._lock:
+            if self._failures:
+                status, headers = self._failures.popleft()
+            elif self.error_rate and self._random.random() < self.error_rate:
+                status, headers = self.error_status, {}
+            else:
+                return None
+            self._injected += 1
+        return httpx.Response(status, headers=headers)
+
+    # -- authentication ----------------------------------------------------------------------
+
+    def _authenticate(self, request: httpx.Request) -> str | None:
+        """Verify the request signature; return the signer's controller DID, or ``None`` if unsigned."""
+        header = request.headers.get("authorization")
+        if header is None:
+            return None
+        scheme, _, rest = header.partition(" ")
+        if scheme.lower() != "signature":
+            raise _RejectError(401, f"Unsupported authorization scheme: {scheme}")
+        params = dict(_SIGNATURE_PARAM_RE.findall(rest))
+        try:
+            key_id = params["keyId"]
+            headers = params["headers"].split()
+            created = int(params["created"])
+            expires = int(params["expires"])
+            signature = base64.urlsafe_b64decode(params["signature"] + "=" * (-len(params["signature"]) % 4))
+            template = compile_signature_template(headers)
+            public_key = resolve_did_key(key_id)
+        except (KeyError, ValueError, binascii.Error) as exc:
+            raise _RejectError(401, f"Malformed signature: {exc}") from None
+        if not _REQUIRED_HEADERS <= set(headers):
+            raise _RejectError(401, f"Signature must cover {' '.join(_DEFAULT_INCLUDE_HEADERS)}")
+        now = self._clock()
+        if created > now + self._clock_skew:
+            raise _RejectError(401, "Signature created in the future")
+        if expires < now - self._clock_skew:
+            raise _RejectError(401, "Signature expired")
+
+        target = request.url.raw_path.decode("ascii")
+        # The client signs the path it was given; httpx may have percent-encoded it since.
+        for path in dict.fromkeys((target, urllib.parse.unquote(target))):
+            payload = template.build(
+                method=request.method, path=path, created=created, expires=expires, key_id=key_id
+            )
+            try:
+                public_key.verify(signature, payload)
+            except InvalidSignature:
+                continue
+            return key_id.partition("#")[0]
+        raise _RejectError(401, "Invalid signature")
+
+    @staticmethod
+    def _authorize(space: _Space, controller: str | None) -> None:
+        if controller is None:
+            raise _RejectError(401, "Signature required")
+        if controller != space.controller:
+            raise _RejectError(403, "Signer is not the space controller")
+
+    # -- routing -----------------------------------------------------------------------------
+
+    @staticmethod
+    def _space_key(value: str) -> str | None:
+        try:
+            return str(uuid.UUID(value))
+        except ValueError:
+            return None
+
+    def _dispatch(self, request: httpx.Request, body: bytes) -> httpx.Response:
+        match = _SPACE_PATH_RE.fullmatch(request.url.path)
+        key = self._space_key(match.group(1)) if match else None
+        if key is None:
+            return _problem(404, "Not found")
+        controller = self._authenticate(request)
+        path = match.group(2)
+        if path is None or path == "/":
+            return self._space(request, key, controller, body)
+        return self._resource(request, key, path, controller, body)
+
+    def _space(self, request: httpx.Request, key: str, controller: str | None, body: bytes) -> httpx.Response:
+        method = request.method
+        if method == "PUT":
+            return self._provision(key, controller, body)
+        with self._lock:
+            space = self._spaces.get(key)
+            if space is None:
+                return _problem(404, "Space not found")
+            if method == "GET":
+                if not self.public_reads:
+                    self._authorize(space, controller)
+                return self._listing(request, key, space)
+            if method == "DELETE":
+                self._authorize(space, controller)
+                del self._spaces[key]
+                return httpx.Response(204)
+        return httpx.Response(405, headers={"allow": "GET, PUT, DELETE"})
+
+    def _provision(self, key: str, controller: str | None, body: bytes) -> httpx.Response:
+        try:
+            doc = json.loads(body)
+        except ValueError:
+            return _problem(400, "Space body must be JSON")
+        owner = doc.get("controller") if isinstance(doc, dict) else None
+        if not isinstance(owner, str):
+            return _problem(400, "Space body must name a controller")
+        if "id" in doc and self._space_key(str(doc["id"]).removeprefix("urn:uuid:")) != key:
+            return _problem(400, "Space id does not match the request path")
+        with self._lock:
+            space = self._spaces.get(key)
+            self._authorize(space or _Space(owner), controller)
+            if space is None:
+                self._spaces[key] = _Space(owner)
+            else:
+                space.controller = owner
+        return httpx.Response(204)
+
+    def _listing(self, request: httpx.Request, key: str, space: _Space) -> httpx.Response:
+        base = f"/space/{key}"
+        names = sorted(space.objects)
+        doc: dict[str, Any] = {
+            "id": make_urn_uuid(uuid.UUID(key)),
+            "type": "Collection",
+            "controller": space.controller,
+            "totalItems": len(names),
+        }
+        if self.page_size is not None:
+            try:
+                page = max(1, int(request.url.params.get("page", "1")))
+            except ValueError:
+                return _problem(400, "Invalid page number")
+            start = (page - 1) * self.page_size
+            if start + self.page_size < len(names):
+                doc["next"] = f"{base}?page={page + 1}"
+            names = names[start:start + self.page_size]
+        doc["items"] = [
+            {"id": f"{base}{name}", "type": "Object", "name": name, "url": f"{base}{name}",
+             "mediaType": space.objects[name].content_type}
+            for name in names
+        ]
+        return httpx.Response(200, json=doc)
+
+    def _resource(
+        self, request: httpx.Request, key: str, path: str, controller: str | None, body: bytes
+    ) -> httpx.Response:
+        method = request.method
+        headers = request.headers
+        with self._lock:
+            space = self._spaces.get(key)
+            if space is None:
+                return _problem(404, "Space not found")
+            obj = space.objects.get(path)
+            if method in ("GET", "HEAD"):
+                if not self.public_reads:
+                    self._authorize(space, controller)
+                if obj is None:
+                    return _problem(404, "Resource not found")
+                return self._read(request, obj)
+            if method not in ("PUT", "POST", "DELETE"):
+                return httpx.Response(405, headers={"allow": "GET, HEAD, PUT, POST, DELETE"})
+            self._authorize(space, controller)
+            etag = obj.etag if obj is not None else None
+            if_match = headers.get("if-match")
+            if (if_match is not None and not _etag_matches(if_match, etag)) or _etag_matches(
+                headers.get("if-none-match"), etag
+            ):
+                return httpx.Response(412)
+            if method == "DELETE":
+                if obj is None:
+                    return _problem(404, "Resource not found")
+                del space.objects[path]
+                return httpx.Response(204)
+            obj = _Object(body, headers.get("content-type", "application/octet-stream"), _etag(body))
+            space.objects[path] = obj
+        return httpx.Response(201 if method == "POST" else 204, headers={"etag": obj.etag})
+
+    @staticmethod
+    def _read(request: httpx.Request, obj: _Object) -> httpx.Response:
+        headers = {"etag": obj.etag, "content-type": obj.content_type, "accept-ranges": "bytes"}
+        if _etag_matches(request.headers.get("if-none-match"), obj.etag):
+            return httpx.Response(304, headers={"etag": obj.etag})
+        content = obj.content
+        size = len(content)
+        spec = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        match = _RANGE_RE.fullmatch(spec.strip()) if spec is not None else None
+        if match is not None and match.group(0) != "bytes=-" and (if_range is None or if_range == obj.etag):
+            first, last = match.groups()
+            if first:
+                start, end = int(first), min(int(last) if last else size - 1, size - 1)
+            else:
+                start, end = max(0, size - int(last)), size - 1
+            if start >= size or start > end:
+                return httpx.Response(416, headers={"content-range": f"bytes */{size}"})
+            headers["content-range"] = f"bytes {start}-{end}/{size}"
+            content = content[start:end + 1]
+        status = 206 if "content-range" in headers else 200
+        if request.method == "HEAD":
+            return httpx.Response(status, headers={**headers, "content-length": str(len(content))})
+        return httpx.Response(status, headers=headers, content=content)
@@ -7,12 +7,18 @@ Signs pseudo-headers: (created), (expires), (key-id), (request-target).
 from __future__ import annotations
 
 import base64
+import functools
+import inspect
 import math
+import threading
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from wallet_attached_storage_client._types import Signer
+    from collections.abc import Iterable
+
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
 
 _DEFAULT_INCLUDE_HEADERS = [
     "(created)",
@@ -24,6 +30,121 @@ _DEFAULT_INCLUDE_HEADERS = [
 _EXPIRATION_SECONDS = 30
 
 
+class SignatureCache:
+    """Bounded LRU cache of signed ``Authorization`` header values.
+
+    A header depends only on the signer, method, path and its ``(created)``/``(expires)``
+    window, so it can be reused for repeated requests to the same target until shortly before
+    it expires. Entries are keyed on ``(signer.id, method, path, include_headers)`` and are
+    served until *margin* seconds before their ``expires`` timestamp. Thread-safe.
+    """
+
+    def __init__(self, max_size: int = 1024, *, margin: float = 5.0) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        if not 0 <= margin < _EXPIRATION_SECONDS:
+            raise ValueError(f"margin must be in [0, {_EXPIRATION_SECONDS}), got {margin}")
+        self._max_size = max_size
+        self._margin = margin
+        self._entries: OrderedDict[tuple[str, ...], tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple[str, ...], now: float) -> str | None:
+        """Return the cached header for *key* if it is still outside the safety margin."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                header, expires = entry
+                if now < expires - self._margin:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return header
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: tuple[str, ...], header: str, expires: int) -> None:
+        with self._lock:
+            self._entries[key] = (header, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Format-string fragment for each supported pseudo-header. Positional fields:
+# {0} created, {1} expires, {2} key id, {3} lowercased method, {4} path.
+_PSEUDO_HEADER_FIELDS = {
+    "(created)": "{0}",
+    "(expires)": "{1}",
+    "(key-id)": "{2}",
+    "(request-target)": "{3} {4}",
+}
+
+
+class SignatureTemplate:
+    """A signature-string layout compiled once from an ``include_headers`` list.
+
+    The header list is validated at construction; :meth:`build` then renders the signing bytes
+    with a single ``str.format`` call instead of rebuilding and re-validating per request.
+    Instances are immutable and safe to share across threads.
+    """
+
+    __slots__ = ("_format", "_headers", "_headers_param")
+
+    def __init__(self, include_headers: Iterable[str] | None = None) -> None:
+        headers = tuple(include_headers or _DEFAULT_INCLUDE_HEADERS)
+        for h in headers:
+            if h not in _PSEUDO_HEADER_FIELDS:
+                raise ValueError(f"Unsupported pseudo-header: {h!r}")
+        self._headers = headers
+        self._headers_param = " ".join(headers)
+        self._format = "\n".join(f"{h}: {_PSEUDO_HEADER_FIELDS[h]}" for h in headers)
+
+    @property
+    def headers(self) -> tuple[str, ...]:
+        return self._headers
+
+    @property
+    def headers_param(self) -> str:
+        """Value of the ``headers="..."`` parameter in the ``Authorization`` header."""
+        return self._headers_param
+
+    def build_string(self, *, method: str, path: str, created: int, expires: int, key_id: str) -> str:
+        return self._format.format(created, expires, key_id, method.lower(), path)
+
+    def build(self, *, method: str, path: str, created: int, expires: int, key_id: str) -> bytes:
+        """Return the UTF-8 signing input for one request."""
+        text = self.build_string(method=method, path=path, created=created, expires=expires, key_id=key_id)
+        return text.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(headers: tuple[str, ...]) -> SignatureTemplate:
+    return SignatureTemplate(headers)
+
+
+def compile_signature_template(include_headers: Iterable[str] | None = None) -> SignatureTemplate:
+    """Return a (memoised) :class:`SignatureTemplate` for *include_headers*."""
+    return _compiled(tuple(include_headers or _DEFAULT_INCLUDE_HEADERS))
+
+
 def build_signature_string(
     *,
     method: str,
@@ -37,19 +158,9 @@ def build_signature_string(
 
     Each pseudo-header produces one ``name: value`` line; lines are joined with ``\\n``.
     """
-    values = {
-        "(created)": str(created),
-        "(expires)": str(expires),
-        "(key-id)": key_id,
-        "(request-target)": f"{method.lower()} {path}",
-    }
-    headers = include_headers or _DEFAULT_INCLUDE_HEADERS
-    parts: list[str] = []
-    for h in headers:
-        if h not in values:
-            raise ValueError(f"Unsupported pseudo-header: {h!r}")
-        parts.append(f"{h}: {values[h]}")
-    return "\n".join(parts)
+    return compile_signature_template(include_headers).build_string(
+        method=method, path=path, created=created, expires=expires, key_id=key_id
+    )
 
 
 def build_auth_headers(
@@ -58,13 +169,37 @@ def build_auth_headers(
     path: str,
     signer: Signer | None = None,
     headers: dict[str, str] | None = None,
+    cache: SignatureCache | None = None,
+    template: SignatureTemplate | None = None,
 ) -> dict[str, str]:
     """Merge caller-supplied *headers* with an ``Authorization`` header when a *signer* is present."""
     merged: dict[str, str] = {}
     if headers:
         merged.update(headers)
     if signer:
-        merged["authorization"] = create_authorization_header(signer=signer, method=method, url=path)
+        merged["authorization"] = create_authorization_header(
+            signer=signer, method=method, url=path, cache=cache, template=template
+        )
+    return merged
+
+
+async def abuild_auth_headers(
+    *,
+    method: str,
+    path: str,
+    signer: Signer | AsyncSigner | None = None,
+    headers: dict[str, str] | None = None,
+    cache: SignatureCache | None = None,
+    template: SignatureTemplate | None = None,
+) -> dict[str, str]:
+    """Async counterpart of :func:`build_auth_headers` that also accepts an :class:`AsyncSigner`."""
+    merged: dict[str, str] = {}
+    if headers:
+        merged.update(headers)
+    if signer:
+        merged["authorization"] = await acreate_authorization_header(
+            signer=signer, method=method, url=path, cache=cache, template=template
+        )
     return merged
 
 
@@ -76,6 +211,8 @@ def create_authorization_header(
     created: float | None = None,
     expires: float | None = None,
     include_headers: list[str] | None = None,
+    cache: SignatureCache | None = None,
+    template: SignatureTemplate | None = None,
 ) -> str:
     """Create a full ``Authorization`` header value using HTTP Signatures (Cavage draft-12).
 
@@ -85,27 +222,98 @@ def create_authorization_header(
         signature="<base64>",created="N",expires="N"
 
     The *signer* must implement the ``Signer`` protocol (``id`` property, ``sign(data)`` method).
+
+    A precompiled *template* takes precedence over *include_headers*; without either, the
+    default four pseudo-headers are signed.
+
+    When a *cache* is given and neither *created* nor *expires* is pinned, a previously signed
+    header for the same signer, method and path is reused while it is still fresh.
     """
-    now = time.time()
-    created_ts = math.floor(created if created is not None else now)
-    expires_ts = math.floor(expires if expires is not None else now + _EXPIRATION_SECONDS)
+    pending = _PendingHeader(signer.id, method, url, created, expires, include_headers, cache, template)
+    if pending.cached is not None:
+        return pending.cached
+    sig_bytes = signer.sign(pending.payload)
+    if inspect.isawaitable(sig_bytes):
+        sig_bytes.close()
+        raise TypeError(f"{type(signer).__name__}.sign is async; use it with AsyncStorageClient")
+    return pending.finish(sig_bytes)
 
-    headers = include_headers or _DEFAULT_INCLUDE_HEADERS
-    key_id = signer.id
 
-    sig_string = build_signature_string(
-        method=method,
-        path=url,
-        created=created_ts,
-        expires=expires_ts,
-        key_id=key_id,
-        include_headers=headers,
-    )
+async def acreate_authorization_header(
+    *,
+    signer: Signer | AsyncSigner,
+    method: str,
+    url: str,
+    created: float | None = None,
+    expires: float | None = None,
+    include_headers: list[str] | None = None,
+    cache: SignatureCache | None = None,
+    template: SignatureTemplate | None = None,
+) -> str:
+    """Async counterpart of :func:`create_authorization_header`.
 
-    sig_bytes = signer.sign(sig_string.encode("utf-8"))
-    sig_b64 = base64.urlsafe_b64encode(sig_bytes).decode("ascii").rstrip("=")
+    Accepts either a :class:`Signer` or an :class:`AsyncSigner`; an async ``sign`` is awaited, so
+    slow remote signers yield the event loop to in-flight requests instead of blocking it.
+    """
+    pending = _PendingHeader(signer.id, method, url, created, expires, include_headers, cache, template)
+    if pending.cached is not None:
+        return pending.cached
+    sig_bytes = signer.sign(pending.payload)
+    if inspect.isawaitable(sig_bytes):
+        sig_bytes = await sig_bytes
+    return pending.finish(sig_bytes)
+
+
+class _PendingHeader:
+    """Everything about one ``Authorization`` header except producing its signature.
+
+    Shared by the sync and async entry points: resolves the timestamps and template, serves a
+    fresh *cache* hit as :attr:`cached`, and otherwise exposes the :attr:`payload` to sign and
+    :meth:`finish` to assemble (and cache) the header from the signature bytes.
+    """
+
+    __slots__ = ("_cache", "_cache_key", "_created", "_expires", "_headers_param", "_key_id", "cached", "payload")
 
-    headers_param = " ".join(headers)
+    def __init__(
+        self,
+        key_id: str,
+        method: str,
+        url: str,
+        created: float | None,
+        expires: float | None,
+        include_headers: list[str] | None,
+        cache: SignatureCache | None,
+        template: SignatureTemplate | None,
+    ) -> None:
+        now = time.time()
+        self._created = math.floor(created if created is not None else now)
+        self._expires = math.floor(expires if expires is not None else now + _EXPIRATION_SECONDS)
+        if template is None:
+            template = compile_signature_template(include_headers)
+        self._key_id = key_id
+        self._headers_param = template.headers_param
+        self._cache = cache
+        self._cache_key: tuple[str, ...] | None = None
+        self.cached: str | None = None
+        self.payload = b""
+        if cache is not None and created is None and expires is None:
+            self._cache_key = (key_id, method.upper(), url, *template.headers)
+            self.cached = cache.get(self._cache_key, now)
+            if self.cached is not None:
+                return
+        self.payload = template.build(
+            method=method, path=url, created=self._created, expires=self._expires, key_id=key_id
+        )
+
+    def finish(self, sig_bytes: bytes) -> str:
+        header = _format_header(self._key_id, self._headers_param, sig_bytes, self._created, self._expires)
+        if self._cache is not None and self._cache_key is not None:
+            self._cache.put(self._cache_key, header, self._expires)
+        return header
+
+
+def _format_header(key_id: str, headers_param: str, sig_bytes: bytes, created_ts: int, expires_ts: int) -> str:
+    sig_b64 = base64.urlsafe_b64encode(sig_bytes).decode("ascii").rstrip("=")
     return (
         f'Signature keyId="{key_id}",'
         f'headers="{headers_param}",'
@@ -113,3 +321,45 @@ def create_authorization_header(
         f'created="{created_ts}",'
         f'expires="{expires_ts}"'
     )
+
+
+def create_authorization_headers(
+    *,
+    signer: Signer,
+    requests: Iterable[tuple[str, str]],
+    created: float | None = None,
+    expires: float | None = None,
+    include_headers: list[str] | None = None,
+    template: SignatureTemplate | None = None,
+) -> list[str]:
+    """Sign a batch of ``(method, url)`` requests with one shared ``(created)``/``(expires)`` window.
+
+    Returns one ``Authorization`` header value per request, in order. If *signer* implements
+    :class:`BatchSigner` the whole batch goes to ``sign_many`` in a single call (one round trip
+    for remote or HSM-backed signers); otherwise each payload is signed with ``sign``.
+    """
+    now = time.time()
+    created_ts = math.floor(created if created is not None else now)
+    expires_ts = math.floor(expires if expires is not None else now + _EXPIRATION_SECONDS)
+
+    if template is None:
+        template = compile_signature_template(include_headers)
+    key_id = signer.id
+    build = template.build
+    payloads = [
+        build(method=method, path=url, created=created_ts, expires=expires_ts, key_id=key_id)
+        for method, url in requests
+    ]
+    if not payloads:
+        return []
+
+    sign_many = getattr(signer, "sign_many", None)
+    if sign_many is not None:
+        signatures = list(sign_many(payloads))
+        if len(signatures) != len(payloads):
+            raise ValueError(f"sign_many returned {len(signatures)} signatures for {len(payloads)} payloads")
+    else:
+        signatures = [signer.sign(p) for p in payloads]
+
+    headers_param = template.headers_param
+    return [_format_header(key_id, headers_param, sig, created_ts, expires_ts) for sig in signatures]
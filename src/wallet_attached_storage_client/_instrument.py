@@ -0,0 +1,143 @@
+"""Per-request timing records and dependency-free latency histograms."""
+
+from __future__ import annotations
+
+import bisect
+import math
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+_SPACE_PATH_RE = re.compile(r"^/space/[^/]+(/.+)?$")
+
+# Histogram bucket upper bounds: 10 µs growing by 2 ** (1/8) per bucket, up to roughly two minutes.
+_BUCKET_BOUNDS = tuple(1e-5 * 2 ** (i / 8) for i in range(190))
+
+
+def path_template(path: str) -> str:
+    """Collapse a concrete WAS path into a low-cardinality label.
+
+    ``/space/<uuid>`` becomes ``/space/{space}`` and anything below it
+    ``/space/{space}/{resource}``; other paths are returned unchanged.
+    """
+    m = _SPACE_PATH_RE.match(path)
+    if m is None:
+        return path
+    return "/space/{space}/{resource}" if m.group(1) else "/space/{space}"
+
+
+@dataclass(frozen=True)
+class RequestRecord:
+    """Timing and size of a single HTTP attempt (each retry produces its own record).
+
+    Durations are in seconds. ``signing`` covers ``Authorization`` header creation, ``ttfb`` runs
+    from handing the request to ``httpx`` until the response headers arrive, and ``total`` spans
+    signing through the last body byte. ``bytes_sent`` is ``None`` for streamed bodies of unknown
+    length; ``status`` and ``ttfb`` are ``None`` when the attempt failed with *error*.
+    """
+
+    method: str
+    path_template: str
+    status: int | None
+    signing: float
+    ttfb: float | None
+    total: float
+    bytes_sent: int | None
+    bytes_received: int
+    attempt: int = 1
+    error: Exception | None = None
+
+
+Observer = Callable[[RequestRecord], None]
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time summary of a :class:`LatencyHistogram`, in seconds."""
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """Thread-safe log-bucketed latency histogram.
+
+    Buckets grow geometrically by ``2 ** (1/8)`` (about 9 %) from 10 µs to roughly two minutes, so
+    reported percentiles are accurate to one bucket width without keeping individual samples.
+    """
+
+    _BOUNDS = _BUCKET_BOUNDS
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(self._BOUNDS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        i = bisect.bisect_left(self._BOUNDS, seconds)
+        with self._lock:
+            self._counts[i] += 1
+            self._count += 1
+            self._sum += seconds
+            self._max = max(self._max, seconds)
+
+    def _percentile(self, q: float) -> float:
+        if self._count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self._count))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                upper = self._BOUNDS[i] if i < len(self._BOUNDS) else self._max
+                return min(upper, self._max)
+        return self._max
+
+    def snapshot(self) -> HistogramSnapshot:
+        with self._lock:
+            return HistogramSnapshot(
+                count=self._count,
+                mean=self._sum / self._count if self._count else 0.0,
+                p50=self._percentile(0.50),
+                p95=self._percentile(0.95),
+                p99=self._percentile(0.99),
+                max=self._max,
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self._BOUNDS) + 1)
+            self._count = 0
+            self._sum = 0.0
+            self._max = 0.0
+
+
+class LatencyRecorder:
+    """Observer that keeps a total-duration :class:`LatencyHistogram` per ``(method, path_template)``.
+
+    Pass an instance in a client's ``observers`` list and call :meth:`snapshot` at any time.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: dict[tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, record: RequestRecord) -> None:
+        key = (record.method, record.path_template)
+        hist = self._histograms.get(key)
+        if hist is None:
+            with self._lock:
+                hist = self._histograms.setdefault(key, LatencyHistogram())
+        hist.record(record.total)
+
+    def snapshot(self) -> dict[tuple[str, str], HistogramSnapshot]:
+        with self._lock:
+            items = list(self._histograms.items())
+        return {key: hist.snapshot() for key, hist in items}
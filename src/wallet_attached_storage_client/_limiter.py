@@ -0,0 +1,193 @@
+"""Adaptive (AIMD) concurrency limiting driven by server overload signals and latency."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+
+import httpx
+
+DEFAULT_OVERLOAD_STATUSES = frozenset({429, 503})
+DEFAULT_BASELINE_WINDOW = 100
+
+
+class _Waiter:
+    __slots__ = ("event", "loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdaptiveLimiter:
+    """Bound in-flight requests with a limit that adapts to how the server is coping.
+
+    Additive increase, multiplicative decrease: every healthy response grows the limit by
+    *increase* / limit (about *increase* per full window of requests), while an overload signal
+    multiplies it by *decrease*. Overload signals are a status in *overload_statuses*, a
+    timeout, or a smoothed latency more than *latency_tolerance* times the fastest of the last
+    *baseline_window* latencies (pass ``None`` to ignore latency, e.g. for workloads mixing tiny
+    and very large bodies). The baseline is windowed so one unusually fast response (a ``304``
+    or a ``404``) only skews it until *baseline_window* newer samples have pushed it out.
+    Only one decrease is applied per window: responses to requests that started before the last
+    decrease do not shrink the limit again.
+
+    Sync and async callers may share one limiter; waiters are admitted in FIFO order.
+    :attr:`limit`, :attr:`in_flight` and :attr:`queued` are safe to read for monitoring.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float | None = 2.0,
+        smoothing: float = 0.2,
+        baseline_window: int = DEFAULT_BASELINE_WINDOW,
+        overload_statuses: frozenset[int] = DEFAULT_OVERLOAD_STATUSES,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be between 0 and 1, got {decrease}")
+        if baseline_window < 1:
+            raise ValueError(f"baseline_window must be >= 1, got {baseline_window}")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_window = baseline_window
+        self.overload_statuses = overload_statuses
+        self._lock = threading.Lock()
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._last_decrease = -math.inf
+        # Recent (sample number, latency) pairs with increasing latency; the head is the window minimum.
+        self._baseline: deque[tuple[int, float]] = deque()
+        self._samples = 0
+        self._smoothed_latency: float | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Callers currently waiting for a slot."""
+        return len(self._waiters)
+
+    def _enqueue(self, loop: asyncio.AbstractEventLoop | None) -> _Waiter | None:
+        # Caller holds the lock. Newcomers may only skip the queue when nobody is waiting.
+        if not self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            return None
+        waiter = _Waiter(loop)
+        self._waiters.append(waiter)
+        return waiter
+
+    def acquire(self) -> float:
+        """Block until a slot is free; returns a start token to hand back to :meth:`release`."""
+        with self._lock:
+            waiter = self._enqueue(None)
+        if waiter is not None:
+            waiter.event.wait()
+        return time.monotonic()
+
+    async def aacquire(self) -> float:
+        """Async counterpart of :meth:`acquire`."""
+        with self._lock:
+            waiter = self._enqueue(asyncio.get_running_loop())
+        if waiter is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter.granted:
+                        self._in_flight -= 1
+                        self._dispatch()
+                    else:
+                        self._waiters.remove(waiter)
+                raise
+        return time.monotonic()
+
+    def release(
+        self,
+        started: float,
+        *,
+        status: int | None = None,
+        error: BaseException | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Return a slot taken at *started* and feed the outcome into the limit.
+
+        *latency* overrides the time the slot was held as the response time to learn from, for
+        callers that keep the slot while they stream a body after the response arrived.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._in_flight -= 1
+            self._update(started, now, status, error, now - started if latency is None else latency)
+            self._dispatch()
+
+    def _update(
+        self, started: float, now: float, status: int | None, error: BaseException | None, latency: float
+    ) -> None:
+        overloaded = status in self.overload_statuses or isinstance(error, httpx.TimeoutException)
+        if status is not None and not overloaded and self.latency_tolerance is not None:
+            if self._smoothed_latency is None:
+                self._smoothed_latency = latency
+            else:
+                self._smoothed_latency += self.smoothing * (latency - self._smoothed_latency)
+            overloaded = self._smoothed_latency > self.latency_tolerance * self._record_baseline(latency) > 0
+        if overloaded:
+            if started >= self._last_decrease:
+                self._limit = max(self.min_limit, self._limit * self.decrease)
+                self._last_decrease = now
+        elif status is not None:
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+    def _record_baseline(self, latency: float) -> float:
+        # Caller holds the lock. Sliding-window minimum over the last baseline_window samples.
+        self._samples += 1
+        baseline = self._baseline
+        while baseline and baseline[-1][1] >= latency:
+            baseline.pop()
+        baseline.append((self._samples, latency))
+        if baseline[0][0] <= self._samples - self.baseline_window:
+            baseline.popleft()
+        return baseline[0][1]
+
+    def _dispatch(self) -> None:
+        # Caller holds the lock.
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft().wake()
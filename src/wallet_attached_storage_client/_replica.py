@@ -0,0 +1,596 @@
+"""Replicated storage: quorum writes and hedged, latency-steered reads across WAS endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._instrument import LatencyHistogram
+from wallet_attached_storage_client._urn_uuid import is_urn_uuid
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._async_resource import AsyncResource
+    from wallet_attached_storage_client._config import ConnectionOptions
+    from wallet_attached_storage_client._content import Content
+    from wallet_attached_storage_client._http_signature import SignatureCache
+    from wallet_attached_storage_client._instrument import Observer
+    from wallet_attached_storage_client._resource import Resource
+    from wallet_attached_storage_client._retry import RetryPolicy
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+DEFAULT_HEDGE_AFTER = 0.05
+"""Hedge delay, in seconds, used until enough reads have been seen to estimate the p95."""
+_MIN_HEDGE_SAMPLES = 20
+
+Outcome = httpx.Response | Exception
+
+
+@dataclass(frozen=True)
+class ReplicaStats:
+    """Point-in-time view of one endpoint as seen by a :class:`ReplicaSelector`."""
+
+    endpoint: str
+    ewma: float | None
+    """Smoothed response time in seconds, ``None`` before the first sample."""
+    failures: int
+    """Consecutive failed requests (transport errors, ``429`` and ``5xx``)."""
+    healthy: bool
+
+
+class _Replica:
+    __slots__ = ("ewma", "failures", "down_until")
+
+    def __init__(self) -> None:
+        self.ewma: float | None = None
+        self.failures = 0
+        self.down_until = 0.0
+
+
+class ReplicaSelector:
+    """Ranks endpoints by an exponentially weighted moving average of their response times.
+
+    Endpoints without samples rank first so each is tried at least once. After
+    *failure_threshold* consecutive failures an endpoint is considered down and ranks last
+    for *cooldown* seconds, after which it is tried again. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        *,
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        cooldown: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        self._replicas = {endpoint: _Replica() for endpoint in endpoints}
+        if not self._replicas:
+            raise ValueError("At least one endpoint is required")
+        self._alpha = alpha
+        self._failure_threshold = failure_threshold
+        self._cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def order(self) -> list[str]:
+        """Endpoints from most to least preferred."""
+        now = self._clock()
+        with self._lock:
+            ranked = [
+                (r.down_until > now, r.ewma if r.ewma is not None else 0.0, i, endpoint)
+                for i, (endpoint, r) in enumerate(self._replicas.items())
+            ]
+        return [endpoint for *_, endpoint in sorted(ranked)]
+
+    def record_latency(self, endpoint: str, seconds: float) -> None:
+        """Fold a response time into *endpoint*'s EWMA without changing its health."""
+        with self._lock:
+            r = self._replicas[endpoint]
+            r.ewma = seconds if r.ewma is None else r.ewma + self._alpha * (seconds - r.ewma)
+
+    def record_success(self, endpoint: str, seconds: float) -> None:
+        self.record_latency(endpoint, seconds)
+        with self._lock:
+            r = self._replicas[endpoint]
+            r.failures = 0
+            r.down_until = 0.0
+
+    def record_failure(self, endpoint: str) -> None:
+        with self._lock:
+            r = self._replicas[endpoint]
+            r.failures += 1
+            if r.failures >= self._failure_threshold:
+                r.down_until = self._clock() + self._cooldown
+
+    def stats(self) -> list[ReplicaStats]:
+        now = self._clock()
+        with self._lock:
+            return [
+                ReplicaStats(endpoint, r.ewma, r.failures, r.down_until <= now)
+                for endpoint, r in self._replicas.items()
+            ]
+
+
+class QuorumError(Exception):
+    """Too few replicas acknowledged a write; *outcomes* maps each endpoint heard from to its result."""
+
+    def __init__(self, message: str, outcomes: dict[str, Outcome]) -> None:
+        super().__init__(message)
+        self.outcomes = outcomes
+
+
+def _is_good(outcome: Outcome) -> bool:
+    # 4xx answers are authoritative (the replica is up and the request was wrong); only
+    # transport errors, throttling and server errors say something about the replica.
+    return isinstance(outcome, httpx.Response) and outcome.status_code < 500 and outcome.status_code != 429
+
+
+def _materialize(content: Content) -> bytes:
+    """Read *content* into memory once so the same body can be sent to every replica."""
+    if isinstance(content, str):
+        return content.encode()
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        return bytes(content)
+    if isinstance(content, os.PathLike):
+        with open(content, "rb") as f:
+            return f.read()
+    if hasattr(content, "read"):
+        return content.read()
+    return b"".join(content)
+
+
+async def _amaterialize(content: Content | AsyncIterable[bytes]) -> bytes:
+    if isinstance(content, AsyncIterable):
+        return b"".join([chunk async for chunk in content])
+    if isinstance(content, (str, bytes, bytearray, memoryview)):
+        return _materialize(content)
+    return await asyncio.to_thread(_materialize, content)
+
+
+class _ReplicatedBase:
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        *,
+        write_quorum: int | None,
+        hedge_after: float | None,
+        max_hedges: int,
+        selector: ReplicaSelector | None,
+    ) -> None:
+        self._endpoints = [e.rstrip("/") for e in endpoints]
+        if not self._endpoints:
+            raise ValueError("At least one endpoint is required")
+        n = len(self._endpoints)
+        self._write_quorum = write_quorum if write_quorum is not None else n // 2 + 1
+        if not 1 <= self._write_quorum <= n:
+            raise ValueError(f"write_quorum must be between 1 and {n}, got {self._write_quorum}")
+        if max_hedges < 0:
+            raise ValueError(f"max_hedges must be >= 0, got {max_hedges}")
+        self._hedge_after = hedge_after
+        self._max_hedges = max_hedges
+        self._selector = selector or ReplicaSelector(self._endpoints)
+        self._read_latency = LatencyHistogram()
+        self._hedged = 0
+
+    @property
+    def endpoints(self) -> list[str]:
+        return list(self._endpoints)
+
+    @property
+    def write_quorum(self) -> int:
+        return self._write_quorum
+
+    @property
+    def selector(self) -> ReplicaSelector:
+        return self._selector
+
+    @property
+    def hedged_requests(self) -> int:
+        """How many hedged second reads have been sent so far."""
+        return self._hedged
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for a read before hedging: *hedge_after*, or the observed read p95."""
+        if self._hedge_after is not None:
+            return self._hedge_after
+        snapshot = self._read_latency.snapshot()
+        if snapshot.count < _MIN_HEDGE_SAMPLES:
+            return DEFAULT_HEDGE_AFTER
+        return snapshot.p95
+
+    def _record(self, endpoint: str, outcome: Outcome, elapsed: float, *, read: bool) -> None:
+        if _is_good(outcome):
+            self._selector.record_success(endpoint, elapsed)
+            if read:
+                self._read_latency.record(elapsed)
+        else:
+            self._selector.record_failure(endpoint)
+
+    def _quorum_failed(self, outcomes: dict[str, Outcome]) -> QuorumError:
+        acked = sum(1 for o in outcomes.values() if isinstance(o, httpx.Response) and o.is_success)
+        return QuorumError(
+            f"Write reached {acked} of {len(self._endpoints)} replicas; {self._write_quorum} required",
+            outcomes,
+        )
+
+
+class ReplicatedStorageClient(_ReplicatedBase):
+    """Keeps every space on several WAS endpoints that each hold a full copy.
+
+    Writes (``PUT``/``DELETE``) go to all endpoints at once and return as soon as
+    *write_quorum* of them (a majority by default) succeed; the rest finish in the background.
+    Reads go to the endpoint with the lowest latency EWMA (see :class:`ReplicaSelector`). If it
+    has not answered within :meth:`hedge_delay` (a fixed *hedge_after*, or the observed p95), a
+    hedged ``GET`` goes to the next-best endpoint and the first good answer wins; up to
+    *max_hedges* hedges are sent per read. Replicas that fail are skipped in favour of the next.
+
+    A synchronous request cannot be interrupted once sent, so the losing read of a hedge runs to
+    completion on a worker thread (feeding its latency into the EWMA) while the caller moves on.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        *,
+        write_quorum: int | None = None,
+        hedge_after: float | None = None,
+        max_hedges: int = 1,
+        selector: ReplicaSelector | None = None,
+        max_workers: int = 32,
+        signature_cache: SignatureCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        httpx_client_factory: Callable[[str], httpx.Client] | None = None,
+    ) -> None:
+        super().__init__(
+            endpoints, write_quorum=write_quorum, hedge_after=hedge_after, max_hedges=max_hedges, selector=selector
+        )
+        observers = list(observers)
+        self._clients = {
+            url: StorageClient(
+                url,
+                httpx_client=httpx_client_factory(url) if httpx_client_factory is not None else None,
+                signature_cache=signature_cache,
+                retry=retry,
+                observers=observers,
+                connection=connection,
+            )
+            for url in self._endpoints
+        }
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="was-replica")
+
+    @property
+    def clients(self) -> dict[str, StorageClient]:
+        """The per-endpoint clients, keyed by base URL."""
+        return dict(self._clients)
+
+    def space(self, id: str, *, signer: Signer | None = None) -> ReplicatedSpace:  # noqa: A002
+        return ReplicatedSpace(self, id, signer)
+
+    def _attempt(self, endpoint: str, op: Callable[[Resource], httpx.Response], target: _Target, read: bool) -> Outcome:
+        resource = self._clients[endpoint].space(target.space_id, signer=target.signer).resource(target.path)
+        start = time.perf_counter()
+        try:
+            outcome: Outcome = op(resource)
+        except httpx.HTTPError as e:
+            outcome = e
+        self._record(endpoint, outcome, time.perf_counter() - start, read=read)
+        return outcome
+
+    def _read(self, target: _Target, op: Callable[[Resource], httpx.Response]) -> httpx.Response:
+        order = self._selector.order()
+        pending: dict[Future[Outcome], str] = {}
+        last: Outcome | None = None
+        hedges = 0
+
+        def launch() -> None:
+            endpoint = order.pop(0)
+            pending[self._pool.submit(self._attempt, endpoint, op, target, True)] = endpoint
+
+        launch()
+        try:
+            while pending:
+                can_hedge = bool(order) and hedges < self._max_hedges
+                done, _ = wait(pending, timeout=self.hedge_delay() if can_hedge else None, return_when=FIRST_COMPLETED)
+                if not done:
+                    hedges += 1
+                    self._hedged += 1
+                    launch()
+                    continue
+                for f in done:
+                    del pending[f]
+                    last = f.result()
+                    if _is_good(last):
+                        return last
+                    if order:
+                        launch()
+        finally:
+            for f in pending:
+                f.cancel()
+        if isinstance(last, Exception):
+            raise last
+        return last
+
+    def _write(self, target: _Target, op: Callable[[Resource], httpx.Response]) -> httpx.Response:
+        futures = {self._pool.submit(self._attempt, e, op, target, False): e for e in self._endpoints}
+        outcomes: dict[str, Outcome] = {}
+        acked: list[httpx.Response] = []
+        for f in as_completed(futures):
+            outcome = outcomes[futures[f]] = f.result()
+            if isinstance(outcome, httpx.Response) and outcome.is_success:
+                acked.append(outcome)
+                if len(acked) >= self._write_quorum:
+                    return acked[0]
+            elif len(self._endpoints) - (len(outcomes) - len(acked)) < self._write_quorum:
+                break
+        raise self._quorum_failed(outcomes)
+
+    def close(self) -> None:
+        """Wait for background writes to finish, then close the per-endpoint clients."""
+        self._pool.shutdown(wait=True)
+        for client in self._clients.values():
+            client.close()
+
+    def __enter__(self) -> ReplicatedStorageClient:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class AsyncReplicatedStorageClient(_ReplicatedBase):
+    """Async counterpart of :class:`ReplicatedStorageClient`.
+
+    Here the losing read of a hedge is cancelled outright; the time it had been running is
+    still fed into that endpoint's EWMA as a lower bound on its latency.
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        *,
+        write_quorum: int | None = None,
+        hedge_after: float | None = None,
+        max_hedges: int = 1,
+        selector: ReplicaSelector | None = None,
+        signature_cache: SignatureCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        httpx_client_factory: Callable[[str], httpx.AsyncClient] | None = None,
+    ) -> None:
+        super().__init__(
+            endpoints, write_quorum=write_quorum, hedge_after=hedge_after, max_hedges=max_hedges, selector=selector
+        )
+        observers = list(observers)
+        self._clients = {
+            url: AsyncStorageClient(
+                url,
+                httpx_client=httpx_client_factory(url) if httpx_client_factory is not None else None,
+                signature_cache=signature_cache,
+                retry=retry,
+                observers=observers,
+                connection=connection,
+            )
+            for url in self._endpoints
+        }
+        self._background: set[asyncio.Task[Outcome]] = set()
+
+    @property
+    def clients(self) -> dict[str, AsyncStorageClient]:
+        """The per-endpoint clients, keyed by base URL."""
+        return dict(self._clients)
+
+    def space(self, id: str, *, signer: Signer | AsyncSigner | None = None) -> AsyncReplicatedSpace:  # noqa: A002
+        return AsyncReplicatedSpace(self, id, signer)
+
+    async def _attempt(
+        self, endpoint: str, op: Callable[[AsyncResource], Awaitable[httpx.Response]], target: _Target, read: bool
+    ) -> Outcome:
+        resource = self._clients[endpoint].space(target.space_id, signer=target.signer).resource(target.path)
+        start = time.perf_counter()
+        try:
+            outcome: Outcome = await op(resource)
+        except httpx.HTTPError as e:
+            outcome = e
+        except asyncio.CancelledError:
+            self._selector.record_latency(endpoint, time.perf_counter() - start)
+            raise
+        self._record(endpoint, outcome, time.perf_counter() - start, read=read)
+        return outcome
+
+    async def _read(
+        self, target: _Target, op: Callable[[AsyncResource], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        order = self._selector.order()
+        pending: set[asyncio.Task[Outcome]] = set()
+        last: Outcome | None = None
+        hedges = 0
+
+        def launch() -> None:
+            pending.add(asyncio.ensure_future(self._attempt(order.pop(0), op, target, True)))
+
+        launch()
+        try:
+            while pending:
+                can_hedge = bool(order) and hedges < self._max_hedges
+                timeout = self.hedge_delay() if can_hedge else None
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedges += 1
+                    self._hedged += 1
+                    launch()
+                    continue
+                for t in done:
+                    last = t.result()
+                    if _is_good(last):
+                        return last
+                    if order:
+                        launch()
+        finally:
+            for t in pending:
+                t.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        if isinstance(last, Exception):
+            raise last
+        return last
+
+    async def _write(
+        self, target: _Target, op: Callable[[AsyncResource], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        tasks = {asyncio.ensure_future(self._attempt(e, op, target, False)): e for e in self._endpoints}
+        for t in tasks:
+            self._background.add(t)
+            t.add_done_callback(self._background.discard)
+        outcomes: dict[str, Outcome] = {}
+        acked: list[httpx.Response] = []
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for t in done:
+                outcome = outcomes[tasks[t]] = t.result()
+                if isinstance(outcome, httpx.Response) and outcome.is_success:
+                    acked.append(outcome)
+            if len(acked) >= self._write_quorum:
+                return acked[0]
+            if len(self._endpoints) - (len(outcomes) - len(acked)) < self._write_quorum:
+                break
+        raise self._quorum_failed(outcomes)
+
+    async def aclose(self) -> None:
+        """Wait for background writes to finish, then close the per-endpoint clients."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        for client in self._clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncReplicatedStorageClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
+
+
+@dataclass(frozen=True)
+class _Target:
+    space_id: str
+    path: str
+    signer: Signer | AsyncSigner | None
+
+
+class ReplicatedSpace:
+    """A space stored on every endpoint of a :class:`ReplicatedStorageClient`."""
+
+    def __init__(self, client: ReplicatedStorageClient, id: str, signer: Signer | None) -> None:  # noqa: A002
+        if not is_urn_uuid(id):
+            raise ValueError(f"Expected a urn:uuid, got {id!r}")
+        self._client = client
+        self._id = id
+        self._signer = signer
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    def resource(self, path: str, *, signer: Signer | None = None) -> ReplicatedResource:
+        if not path.startswith("/"):
+            path = f"/{path}"
+        return ReplicatedResource(self._client, _Target(self._id, path, signer or self._signer))
+
+
+class ReplicatedResource:
+    """A resource read with hedging and written with a quorum; see :class:`ReplicatedStorageClient`."""
+
+    def __init__(self, client: ReplicatedStorageClient, target: _Target) -> None:
+        self._client = client
+        self._target = target
+
+    @property
+    def path(self) -> str:
+        return self._target.path
+
+    def get(self, *, headers: dict[str, str] | None = None) -> httpx.Response:
+        return self._client._read(self._target, lambda r: r.get(headers=headers))
+
+    def put(
+        self,
+        content: Content = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """PUT *content* to every replica; returns the first success once the quorum is reached.
+
+        *content* is read into memory once so it can be replayed to each endpoint. Raises
+        :class:`QuorumError` when too few replicas accept the write.
+        """
+        body = _materialize(content)
+        return self._client._write(self._target, lambda r: r.put(body, content_type, headers=headers))
+
+    def delete(self, *, headers: dict[str, str] | None = None) -> httpx.Response:
+        return self._client._write(self._target, lambda r: r.delete(headers=headers))
+
+
+class AsyncReplicatedSpace:
+    """A space stored on every endpoint of an :class:`AsyncReplicatedStorageClient`."""
+
+    def __init__(
+        self, client: AsyncReplicatedStorageClient, id: str, signer: Signer | AsyncSigner | None  # noqa: A002
+    ) -> None:
+        if not is_urn_uuid(id):
+            raise ValueError(f"Expected a urn:uuid, got {id!r}")
+        self._client = client
+        self._id = id
+        self._signer = signer
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    def resource(self, path: str, *, signer: Signer | AsyncSigner | None = None) -> AsyncReplicatedResource:
+        if not path.startswith("/"):
+            path = f"/{path}"
+        return AsyncReplicatedResource(self._client, _Target(self._id, path, signer or self._signer))
+
+
+class AsyncReplicatedResource:
+    """Async counterpart of :class:`ReplicatedResource`."""
+
+    def __init__(self, client: AsyncReplicatedStorageClient, target: _Target) -> None:
+        self._client = client
+        self._target = target
+
+    @property
+    def path(self) -> str:
+        return self._target.path
+
+    async def get(self, *, headers: dict[str, str] | None = None) -> httpx.Response:
+        return await self._client._read(self._target, lambda r: r.get(headers=headers))
+
+    async def put(
+        self,
+        content: Content | AsyncIterable[bytes] = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """PUT *content* to every replica; see :meth:`ReplicatedResource.put`."""
+        body = await _amaterialize(content)
+        return await self._client._write(self._target, lambda r: r.put(body, content_type, headers=headers))
+
+    async def delete(self, *, headers: dict[str, str] | None = None) -> httpx.Response:
+        return await self._client._write(self._target, lambda r: r.delete(headers=headers))
@@ -0,0 +1,538 @@
+"""The single request path shared by spaces and resources: sign, send, post-process."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from wallet_attached_storage_client._cache import is_conditional, update_cache
+from wallet_attached_storage_client._coalesce import coalesce_key
+from wallet_attached_storage_client._http_signature import abuild_auth_headers, build_auth_headers
+from wallet_attached_storage_client._instrument import RequestRecord, path_template
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._cache import CachedResponse
+    from wallet_attached_storage_client._config import ClientConfig
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _sign(
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | None,
+    headers: dict[str, str] | None,
+) -> dict[str, str]:
+    return build_auth_headers(
+        method=method,
+        path=path,
+        signer=signer,
+        headers=headers,
+        cache=config.signature_cache,
+        template=config.signature_template,
+    )
+
+
+async def _asign(
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | AsyncSigner | None,
+    headers: dict[str, str] | None,
+) -> dict[str, str]:
+    return await abuild_auth_headers(
+        method=method,
+        path=path,
+        signer=signer,
+        headers=headers,
+        cache=config.signature_cache,
+        template=config.signature_template,
+    )
+
+
+def build_request(
+    client: httpx.Client | httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | None = None,
+    headers: dict[str, str] | None = None,
+    content: Any = None,
+) -> httpx.Request:
+    """Sign and build (but do not send) a request for *path*."""
+    h = _sign(config, method, path, signer, headers)
+    return client.build_request(method, path, headers=h, content=content)
+
+
+async def abuild_request(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | AsyncSigner | None = None,
+    headers: dict[str, str] | None = None,
+    content: Any = None,
+) -> httpx.Request:
+    """Async counterpart of :func:`build_request`; awaits an :class:`AsyncSigner`."""
+    h = await _asign(config, method, path, signer, headers)
+    return client.build_request(method, path, headers=h, content=content)
+
+
+class _Timer:
+    """Timestamps for one attempt, turned into a :class:`RequestRecord` for the observers."""
+
+    __slots__ = ("start", "signed", "sent", "first_byte")
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.signed = self.sent = self.start
+        self.first_byte: float | None = None
+
+    def emit(
+        self,
+        config: ClientConfig,
+        request: httpx.Request,
+        response: httpx.Response | None,
+        path: str,
+        attempt: int,
+        error: Exception | None = None,
+    ) -> None:
+        length = request.headers.get("content-length")
+        received = 0
+        if response is not None:
+            received = response.num_bytes_downloaded
+            if not received:
+                # Transports that hand back pre-built responses never report wire bytes.
+                try:
+                    received = len(response.content)
+                except httpx.ResponseNotRead:
+                    pass
+        record = RequestRecord(
+            method=request.method,
+            path_template=path_template(path),
+            status=response.status_code if response is not None else None,
+            signing=self.signed - self.start,
+            ttfb=self.first_byte - self.sent if self.first_byte is not None else None,
+            total=time.perf_counter() - self.start,
+            bytes_sent=int(length) if length is not None else None,
+            bytes_received=received,
+            attempt=attempt,
+            error=error,
+        )
+        for observer in config.observers:
+            observer(record)
+
+
+def _send_once(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | None,
+    headers: dict[str, str] | None,
+    content: Any,
+    attempt: int,
+) -> httpx.Response:
+    limiter = config.limiter
+    if limiter is None:
+        return _send_attempt(client, config, method, path, signer, headers, content, attempt)
+    started = limiter.acquire()
+    try:
+        response = _send_attempt(client, config, method, path, signer, headers, content, attempt)
+    except BaseException as e:
+        limiter.release(started, error=e)
+        raise
+    limiter.release(started, status=response.status_code)
+    return response
+
+
+def _send_attempt(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | None,
+    headers: dict[str, str] | None,
+    content: Any,
+    attempt: int,
+) -> httpx.Response:
+    timer = _Timer()
+    h = _sign(config, method, path, signer, headers)
+    timer.signed = time.perf_counter()
+    request = client.build_request(method, path, headers=h, content=content)
+    response = None
+    timer.sent = time.perf_counter()
+    try:
+        response = client.send(request, stream=True)
+        timer.first_byte = time.perf_counter()
+        try:
+            response.read()
+        except BaseException:
+            response.close()
+            raise
+    except Exception as e:
+        if config.observers:
+            timer.emit(config, request, response, path, attempt, e)
+        raise
+    if config.observers:
+        timer.emit(config, request, response, path, attempt)
+    return response
+
+
+async def _asend_once(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | AsyncSigner | None,
+    headers: dict[str, str] | None,
+    content: Any,
+    attempt: int,
+) -> httpx.Response:
+    limiter = config.limiter
+    if limiter is None:
+        return await _asend_attempt(client, config, method, path, signer, headers, content, attempt)
+    started = await limiter.aacquire()
+    try:
+        response = await _asend_attempt(client, config, method, path, signer, headers, content, attempt)
+    except BaseException as e:
+        limiter.release(started, error=e)
+        raise
+    limiter.release(started, status=response.status_code)
+    return response
+
+
+async def _asend_attempt(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | AsyncSigner | None,
+    headers: dict[str, str] | None,
+    content: Any,
+    attempt: int,
+) -> httpx.Response:
+    timer = _Timer()
+    h = await _asign(config, method, path, signer, headers)
+    timer.signed = time.perf_counter()
+    request = client.build_request(method, path, headers=h, content=content)
+    response = None
+    timer.sent = time.perf_counter()
+    try:
+        response = await client.send(request, stream=True)
+        timer.first_byte = time.perf_counter()
+        try:
+            await response.aread()
+        except BaseException:
+            await response.aclose()
+            raise
+    except Exception as e:
+        if config.observers:
+            timer.emit(config, request, response, path, attempt, e)
+        raise
+    if config.observers:
+        timer.emit(config, request, response, path, attempt)
+    return response
+
+
+def _cache_lookup(
+    config: ClientConfig, method: str, path: str, headers: dict[str, str] | None
+) -> tuple[bool, CachedResponse | None, dict[str, str] | None]:
+    cache = config.response_cache
+    if cache is None or (method == "GET" and is_conditional(headers)):
+        return False, None, headers
+    if method != "GET":
+        return True, None, headers
+    entry = cache.get(path)
+    if entry is None:
+        return True, None, headers
+    return True, entry, {**entry.validators(), **(headers or {})}
+
+
+def send(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | None = None,
+    headers: dict[str, str] | None = None,
+    content: Any = None,
+) -> httpx.Response:
+    """Sign and send a request, applying the client-wide settings in *config*."""
+    if method not in _SAFE_METHODS:
+        config.content_index.discard(path)
+    if config.coalescer is not None and method == "GET" and content is None:
+        return config.coalescer.do(
+            coalesce_key(path, signer, headers),
+            lambda: _send(client, config, method, path, signer=signer, headers=headers, content=content),
+        )
+    return _send(client, config, method, path, signer=signer, headers=headers, content=content)
+
+
+def _send(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | None,
+    headers: dict[str, str] | None,
+    content: Any,
+) -> httpx.Response:
+    cached, entry, headers = _cache_lookup(config, method, path, headers)
+    retry = config.retry
+    retryable = retry is not None and retry.allows(method, content)
+    attempt = 1
+    while True:
+        try:
+            response = _send_once(
+                client, config, method, path, signer=signer, headers=headers, content=content, attempt=attempt
+            )
+        except Exception as e:
+            if not retryable or attempt >= retry.max_attempts or not isinstance(e, retry.retry_exceptions):
+                raise
+            delay = retry.delay(attempt)
+        else:
+            if not retryable or attempt >= retry.max_attempts or response.status_code not in retry.retry_statuses:
+                break
+            delay = retry.delay(attempt, response)
+            response.close()
+        time.sleep(delay)
+        attempt += 1
+    if cached:
+        response = update_cache(config.response_cache, config.cache_stats, method, path, entry, response)
+    return response
+
+
+async def asend(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | AsyncSigner | None = None,
+    headers: dict[str, str] | None = None,
+    content: Any = None,
+) -> httpx.Response:
+    """Async counterpart of :func:`send`."""
+    if method not in _SAFE_METHODS:
+        config.content_index.discard(path)
+    if config.coalescer is not None and method == "GET" and content is None:
+        return await config.coalescer.ado(
+            coalesce_key(path, signer, headers),
+            lambda: _asend(client, config, method, path, signer=signer, headers=headers, content=content),
+        )
+    return await _asend(client, config, method, path, signer=signer, headers=headers, content=content)
+
+
+async def _asend(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | AsyncSigner | None,
+    headers: dict[str, str] | None,
+    content: Any,
+) -> httpx.Response:
+    cached, entry, headers = _cache_lookup(config, method, path, headers)
+    retry = config.retry
+    retryable = retry is not None and retry.allows(method, content)
+    attempt = 1
+    while True:
+        try:
+            response = await _asend_once(
+                client, config, method, path, signer=signer, headers=headers, content=content, attempt=attempt
+            )
+        except Exception as e:
+            if not retryable or attempt >= retry.max_attempts or not isinstance(e, retry.retry_exceptions):
+                raise
+            delay = retry.delay(attempt)
+        else:
+            if not retryable or attempt >= retry.max_attempts or response.status_code not in retry.retry_statuses:
+                break
+            delay = retry.delay(attempt, response)
+            await response.aclose()
+        await asyncio.sleep(delay)
+        attempt += 1
+    if cached:
+        response = update_cache(config.response_cache, config.cache_stats, method, path, entry, response)
+    return response
+
+
+class _StreamAttempt:
+    """One streamed attempt whose limiter slot and observer record stay open until :meth:`finish`."""
+
+    __slots__ = ("config", "path", "attempt", "started", "timer", "request", "response")
+
+    def __init__(self, config: ClientConfig, path: str, attempt: int, started: float) -> None:
+        self.config = config
+        self.path = path
+        self.attempt = attempt
+        self.started = started
+        self.timer = _Timer()
+        self.request: httpx.Request | None = None
+        self.response: httpx.Response | None = None
+
+    def finish(self, error: BaseException | None = None) -> None:
+        # Abandoning the body early (GeneratorExit, cancellation) is not a failed request.
+        error = error if isinstance(error, Exception) else None
+        config, response, timer = self.config, self.response, self.timer
+        if config.limiter is not None:
+            if error is not None or response is None:
+                config.limiter.release(self.started, error=error)
+            else:
+                # Feed the limiter time-to-headers; holding the slot while a large body is read
+                # is not a sign of server overload.
+                latency = (timer.first_byte or timer.start) - timer.start
+                config.limiter.release(self.started, status=response.status_code, latency=latency)
+        if config.observers and self.request is not None:
+            timer.emit(config, self.request, response, self.path, self.attempt, error)
+
+
+def _open_stream(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | None,
+    headers: dict[str, str] | None,
+    attempt: int,
+) -> _StreamAttempt:
+    limiter = config.limiter
+    s = _StreamAttempt(config, path, attempt, limiter.acquire() if limiter is not None else 0.0)
+    try:
+        h = _sign(config, method, path, signer, headers)
+        s.timer.signed = time.perf_counter()
+        s.request = client.build_request(method, path, headers=h)
+        s.timer.sent = time.perf_counter()
+        s.response = client.send(s.request, stream=True)
+        s.timer.first_byte = time.perf_counter()
+    except BaseException as e:
+        s.finish(e)
+        raise
+    return s
+
+
+async def _aopen_stream(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    signer: Signer | AsyncSigner | None,
+    headers: dict[str, str] | None,
+    attempt: int,
+) -> _StreamAttempt:
+    limiter = config.limiter
+    s = _StreamAttempt(config, path, attempt, await limiter.aacquire() if limiter is not None else 0.0)
+    try:
+        h = await _asign(config, method, path, signer, headers)
+        s.timer.signed = time.perf_counter()
+        s.request = client.build_request(method, path, headers=h)
+        s.timer.sent = time.perf_counter()
+        s.response = await client.send(s.request, stream=True)
+        s.timer.first_byte = time.perf_counter()
+    except BaseException as e:
+        s.finish(e)
+        raise
+    return s
+
+
+@contextmanager
+def stream(
+    client: httpx.Client,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | None = None,
+    headers: dict[str, str] | None = None,
+) -> Iterator[httpx.Response]:
+    """Sign and send a request, yielding the response as soon as its headers arrive.
+
+    The body is left unread for the caller to iterate. As with :func:`send`, the request waits
+    for a limiter slot and is retried per the retry policy until headers arrive; after that,
+    failures are the caller's. The slot is held, and the observer record (covering the whole
+    body transfer) emitted, when the block exits; the response is closed on exit.
+    """
+    if method not in _SAFE_METHODS:
+        config.content_index.discard(path)
+    retry = config.retry
+    retryable = retry is not None and retry.allows(method, None)
+    attempt = 1
+    while True:
+        try:
+            s = _open_stream(client, config, method, path, signer, headers, attempt)
+        except Exception as e:
+            if not retryable or attempt >= retry.max_attempts or not isinstance(e, retry.retry_exceptions):
+                raise
+            delay = retry.delay(attempt)
+        else:
+            if not retryable or attempt >= retry.max_attempts or s.response.status_code not in retry.retry_statuses:
+                break
+            delay = retry.delay(attempt, s.response)
+            s.response.close()
+            s.finish()
+        time.sleep(delay)
+        attempt += 1
+    try:
+        yield s.response
+    except BaseException as e:
+        s.response.close()
+        s.finish(e)
+        raise
+    s.response.close()
+    s.finish()
+
+
+@asynccontextmanager
+async def astream(
+    client: httpx.AsyncClient,
+    config: ClientConfig,
+    method: str,
+    path: str,
+    *,
+    signer: Signer | AsyncSigner | None = None,
+    headers: dict[str, str] | None = None,
+) -> AsyncIterator[httpx.Response]:
+    """Async counterpart of :func:`stream`."""
+    if method not in _SAFE_METHODS:
+        config.content_index.discard(path)
+    retry = config.retry
+    retryable = retry is not None and retry.allows(method, None)
+    attempt = 1
+    while True:
+        try:
+            s = await _aopen_stream(client, config, method, path, signer, headers, attempt)
+        except Exception as e:
+            if not retryable or attempt >= retry.max_attempts or not isinstance(e, retry.retry_exceptions):
+                raise
+            delay = retry.delay(attempt)
+        else:
+            if not retryable or attempt >= retry.max_attempts or s.response.status_code not in retry.retry_statuses:
+                break
+            delay = retry.delay(attempt, s.response)
+            await s.response.aclose()
+            s.finish()
+        await asyncio.sleep(delay)
+        attempt += 1
+    try:
+        yield s.response
+    except BaseException as e:
+        await s.response.aclose()
+        s.finish(e)
+        raise
+    await s.response.aclose()
+    s.finish()
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
-from wallet_attached_storage_client._http_signature import build_auth_headers
+from wallet_attached_storage_client._bulk import run_bounded
+from wallet_attached_storage_client._config import ClientConfig
+from wallet_attached_storage_client._content import CHUNK_SIZE, prepare_content
+from wallet_attached_storage_client._dedup import HashingIterator, PutResult, content_digest
+from wallet_attached_storage_client._download import DownloadResult, atomic_destination, write_chunks
+from wallet_attached_storage_client._range import (
+    DEFAULT_PART_SIZE,
+    DEFAULT_PART_WORKERS,
+    PositionalFile,
+    RangeResult,
+    check_part,
+    if_range,
+    range_header,
+    result_for,
+    split_ranges,
+)
+from wallet_attached_storage_client._request import send, stream
 
 if TYPE_CHECKING:
+    import os
+
+    from wallet_attached_storage_client._content import Content
+    from wallet_attached_storage_client._download import Destination
     from wallet_attached_storage_client._types import Signer
 
 
@@ -19,19 +41,34 @@ class Resource:
         client: httpx.Client,
         path: str,
         signer: Signer | None = None,
+        config: ClientConfig | None = None,
     ) -> None:
         self._client = client
         self._path = path
         self._signer = signer
+        self._config = config or ClientConfig()
 
     @property
     def path(self) -> str:
         return self._path
 
-    def _auth_headers(
-        self, method: str, *, signer: Signer | None = None, headers: dict[str, str] | None = None
-    ) -> dict[str, str]:
-        return build_auth_headers(method=method, path=self._path, signer=signer or self._signer, headers=headers)
+    def _send(
+        self,
+        method: str,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+        content: Any = None,
+    ) -> httpx.Response:
+        return send(
+            self._client,
+            self._config,
+            method,
+            self._path,
+            signer=signer or self._signer,
+            headers=headers,
+            content=content,
+        )
 
     def get(
         self,
@@ -39,32 +76,204 @@ class Resource:
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("GET", signer=signer, headers=headers)
-        return self._client.get(self._path, headers=h)
+        return self._send("GET", signer=signer, headers=headers)
+
+    def head(
+        self,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        return self._send("HEAD", signer=signer, headers=headers)
+
+    @contextmanager
+    def stream(
+        self,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[httpx.Response]:
+        """GET this resource without buffering the body.
+
+        Yields the response as soon as its headers arrive; read the body incrementally with
+        ``response.iter_bytes()``. The connection is released when the block exits.
+        """
+        with stream(
+            self._client, self._config, "GET", self._path, signer=signer or self._signer, headers=headers
+        ) as response:
+            yield response
+
+    def iter_bytes(
+        self,
+        chunk_size: int | None = CHUNK_SIZE,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the body of this resource in chunks of at most *chunk_size* bytes.
+
+        Raises :class:`httpx.HTTPStatusError` if the server does not answer with a 2xx status.
+        """
+        with self.stream(signer=signer, headers=headers) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+
+    def download_to(
+        self,
+        dest: Destination,
+        *,
+        hash_algorithm: str | None = None,
+        chunk_size: int | None = CHUNK_SIZE,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> DownloadResult:
+        """Stream this resource into *dest*, a filesystem path or a writable binary file object.
+
+        Memory use is bounded by *chunk_size* regardless of the object size. Pass a
+        :mod:`hashlib` algorithm name such as ``"sha256"`` as *hash_algorithm* to compute a
+        digest of the body on the way through. A path is written via a temporary file, so an
+        existing file at *dest* is only replaced by a complete download.
+        """
+        chunks = self.iter_bytes(chunk_size, signer=signer, headers=headers)
+        return write_chunks(chunks, dest, hash_algorithm)
+
+    def get_range(
+        self,
+        start: int,
+        end: int | None = None,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> RangeResult:
+        """GET bytes *start* to *end* (inclusive, as in the ``Range`` header) of this resource.
+
+        With *end* ``None`` the range runs to the end of the resource. See :class:`RangeResult`
+        for how ``206`` and ``200`` answers are told apart; other statuses give empty *content*.
+        """
+        h = {**(headers or {}), "range": range_header(start, end)}
+        return RangeResult.from_response(self.get(signer=signer, headers=h), start, end)
+
+    def download_parallel(
+        self,
+        dest: str | os.PathLike[str],
+        *,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_PART_WORKERS,
+        hash_algorithm: str | None = None,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> DownloadResult:
+        """Download this resource into the file *dest* as concurrent ranged GETs of *part_size* bytes.
+
+        The first part reveals the total size; a temporary file next to *dest* is then
+        preallocated and the remaining parts are fetched by up to *max_workers* threads over the
+        client's connection pool, each written straight to its offset. Later parts carry
+        ``If-Range`` with the first part's ETag, so a resource that changes mid-download raises
+        :class:`ValueError` instead of producing a mixed file. Servers without range support get
+        a single plain download. The temporary file replaces *dest* only once every part has
+        arrived; on any failure it is removed and an existing *dest* is left untouched.
+        """
+        first = self.get_range(0, part_size - 1, signer=signer, headers=headers)
+        if first.response.status_code == 416 and first.total == 0:
+            return write_chunks([], dest, hash_algorithm)
+        first.response.raise_for_status()
+        if not first.partial:
+            return write_chunks([first.response.content], dest, hash_algorithm)
+        if first.total is None or first.start != 0:
+            raise ValueError(f"Cannot split {self._path}: server did not report a usable Content-Range")
+        h = if_range(headers, first.response)
+
+        with atomic_destination(dest) as tmp:
+            out = PositionalFile(tmp, first.total)
+
+            def fetch(part: tuple[int, int]) -> None:
+                result = self.get_range(*part, signer=signer, headers=h)
+                check_part(result, *part)
+                out.write_at(result.content, part[0])
+
+            try:
+                out.write_at(first.content, 0)
+                for _ in run_bounded(fetch, split_ranges(first.total, part_size, len(first.content)), max_workers):
+                    pass
+            finally:
+                out.close()
+        return result_for(dest, first.total, hash_algorithm)
 
     def put(
         self,
-        content: bytes = b"",
+        content: Content = b"",
         content_type: str = "application/octet-stream",
         *,
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("PUT", signer=signer, headers=headers)
+        """PUT *content* to this resource.
+
+        *content* may be ``bytes``, a binary file object, an ``os.PathLike`` or an iterable of
+        ``bytes`` chunks. Anything other than ``bytes`` is streamed in bounded chunks, with a
+        ``content-length`` when the size is known up front and chunked transfer otherwise.
+        """
+        body, body_headers = prepare_content(content)
+        h = dict(headers or {})
         h.setdefault("content-type", content_type)
-        return self._client.put(self._path, content=content, headers=h)
+        for k, v in body_headers.items():
+            h.setdefault(k, v)
+        return self._send("PUT", signer=signer, headers=h, content=body)
+
+    def put_if_changed(
+        self,
+        content: Content = b"",
+        content_type: str = "application/octet-stream",
+        *,
+        verify: bool = False,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> PutResult:
+        """PUT *content* unless this resource is already known to hold the same bytes.
+
+        The SHA-256 of *content* is compared with the client's :class:`ContentIndex` entry for
+        this path, recorded by the last successful ``put_if_changed``; any other write through
+        the client clears it. On a match no request is made. With *verify*, a conditional
+        ``HEAD`` using the ETag stored with the entry first checks that nobody else changed the
+        resource since. Paths and seekable files are hashed in a pass before the upload;
+        iterators are hashed as they stream, so they are always sent but still indexed.
+        """
+        if isinstance(content, AsyncIterable):
+            raise TypeError("Async iterables can only be uploaded with AsyncResource")
+        index = self._config.content_index
+        digest = content_digest(content)
+        entry = index.get(self._path) if digest is not None else None
+        if entry is not None and entry.digest == digest:
+            if not verify or entry.etag is None:
+                return PutResult(None, sent=False, digest=digest)
+            h = {**(headers or {}), "if-none-match": entry.etag}
+            check = self.head(signer=signer, headers=h)
+            if check.status_code == 304:
+                return PutResult(check, sent=False, digest=digest)
+        hasher = None
+        if digest is None:
+            content = hasher = HashingIterator(content)
+        response = self.put(content, content_type, signer=signer, headers=headers)
+        digest = digest or hasher.hexdigest()
+        if response.is_success:
+            index.record(self._path, digest, response.headers.get("etag"))
+        return PutResult(response, sent=True, digest=digest)
 
     def post(
         self,
-        content: bytes = b"",
+        content: Content = b"",
         content_type: str = "application/octet-stream",
         *,
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("POST", signer=signer, headers=headers)
+        """POST *content* to this resource; accepts the same body types as :meth:`put`."""
+        body, body_headers = prepare_content(content)
+        h = dict(headers or {})
         h.setdefault("content-type", content_type)
-        return self._client.post(self._path, content=content, headers=h)
+        for k, v in body_headers.items():
+            h.setdefault(k, v)
+        return self._send("POST", signer=signer, headers=h, content=body)
 
     def delete(
         self,
@@ -72,5 +281,4 @@ class Resource:
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("DELETE", signer=signer, headers=headers)
-        return self._client.delete(self._path, headers=h)
+        return self._send("DELETE", signer=signer, headers=headers)
@@ -0,0 +1,72 @@
+"""Retry policy for transient WAS failures."""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import time
+from dataclasses import dataclass
+
+import httpx
+
+_REPLAYABLE = (type(None), bytes, str)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failures to retry and how long to wait between attempts.
+
+    Every attempt is signed afresh, so a retry never replays an ``Authorization`` header whose
+    ``(expires)`` window has lapsed. Only requests whose method is in *idempotent_methods* and
+    whose body can be replayed (``bytes`` or no body) are retried; streamed uploads are sent once.
+
+    The delay before attempt ``n + 1`` is ``min(backoff_max, backoff_base * 2 ** (n - 1))``,
+    reduced by up to *jitter* (a fraction, ``1.0`` = full jitter). When *respect_retry_after* is
+    set, a server ``Retry-After`` header (seconds or HTTP date) takes precedence, capped at
+    *backoff_max*.
+    """
+
+    max_attempts: int = 3
+    retry_statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    retry_exceptions: tuple[type[Exception], ...] = (httpx.TransportError,)
+    idempotent_methods: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    backoff_base: float = 0.1
+    backoff_max: float = 10.0
+    jitter: float = 1.0
+    respect_retry_after: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError(f"jitter must be in [0, 1], got {self.jitter}")
+
+    def allows(self, method: str, content: object) -> bool:
+        """Return True if a request with this *method* and body may be attempted more than once."""
+        return self.max_attempts > 1 and method.upper() in self.idempotent_methods and isinstance(content, _REPLAYABLE)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay after failed attempt number *attempt* (1-based)."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())  # noqa: S311 - jitter, not crypto
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Return how long to wait after *attempt*, honouring ``Retry-After`` on *response*."""
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("retry-after"))
+            if retry_after is not None:
+                return min(self.backoff_max, retry_after)
+        return self.backoff(attempt)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,287 @@
+"""Route spaces across several WAS servers with a weighted consistent-hash ring."""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._dedup import ContentIndex
+from wallet_attached_storage_client._urn_uuid import make_urn_uuid, parse_urn_uuid
+
+if TYPE_CHECKING:
+    import httpx
+
+    from wallet_attached_storage_client._async_space import AsyncSpace
+    from wallet_attached_storage_client._cache import ResponseCache
+    from wallet_attached_storage_client._config import ConnectionOptions
+    from wallet_attached_storage_client._http_signature import SignatureCache
+    from wallet_attached_storage_client._instrument import Observer
+    from wallet_attached_storage_client._retry import RetryPolicy
+    from wallet_attached_storage_client._space import Space
+    from wallet_attached_storage_client._types import AsyncSigner, Signer
+
+DEFAULT_VNODES = 160
+
+Nodes = Mapping[str, float] | Iterable[str]
+"""Base URLs, optionally mapped to a relative weight (default ``1``)."""
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def _shard_key(space_id: str) -> str:
+    # Hash the bare UUID so "urn:uuid:ABC..." and "urn:uuid:abc..." land on the same node.
+    return str(parse_urn_uuid(space_id))
+
+
+def _normalize(nodes: Nodes) -> dict[str, float]:
+    weights = dict(nodes) if isinstance(nodes, Mapping) else dict.fromkeys(nodes, 1.0)
+    normalized = {url.rstrip("/"): float(w) for url, w in weights.items()}
+    if not normalized:
+        raise ValueError("At least one node is required")
+    for url, weight in normalized.items():
+        if weight <= 0:
+            raise ValueError(f"Node weight must be > 0, got {weight} for {url}")
+    return normalized
+
+
+class HashRing:
+    """A consistent-hash ring mapping keys onto weighted nodes.
+
+    Each node is placed on the ring at ``vnodes * weight`` pseudo-random points, and a key
+    belongs to the first point at or after its own hash. Adding or removing a node therefore
+    only moves the keys between that node's points and their predecessors: about ``1/N`` of
+    them for ``N`` equally weighted nodes. Placement depends only on the node URLs and weights,
+    so every client configured with the same membership routes identically.
+    """
+
+    def __init__(self, nodes: Nodes, *, vnodes: int = DEFAULT_VNODES) -> None:
+        if vnodes < 1:
+            raise ValueError(f"vnodes must be >= 1, got {vnodes}")
+        self._weights = _normalize(nodes)
+        self._vnodes = vnodes
+        points = sorted(
+            (_hash(f"{url}#{i}"), url)
+            for url, weight in self._weights.items()
+            for i in range(max(1, round(vnodes * weight)))
+        )
+        self._hashes = [h for h, _ in points]
+        self._owners = [url for _, url in points]
+
+    @property
+    def nodes(self) -> dict[str, float]:
+        """Node base URLs mapped to their weights."""
+        return dict(self._weights)
+
+    @property
+    def vnodes(self) -> int:
+        return self._vnodes
+
+    def node_for(self, key: str) -> str:
+        i = bisect.bisect_left(self._hashes, _hash(key))
+        return self._owners[i % len(self._owners)]
+
+    def node_for_space(self, space_id: str) -> str:
+        return self.node_for(_shard_key(space_id))
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A space whose owning node changes from *source* to *target*."""
+
+    space_id: str
+    source: str
+    target: str
+
+
+def plan_migration(old: HashRing, new: HashRing, space_ids: Iterable[str]) -> list[Migration]:
+    """List the spaces in *space_ids* that *new* routes to a different node than *old* does.
+
+    The ring cannot enumerate spaces itself, so pass every known space id (for example from an
+    inventory kept by the application). Copy each listed space from *source* to *target* before
+    switching clients over to the new membership.
+    """
+    migrations = []
+    for space_id in space_ids:
+        source = old.node_for_space(space_id)
+        target = new.node_for_space(space_id)
+        if source != target:
+            migrations.append(Migration(space_id, source, target))
+    return migrations
+
+
+class ShardedStorageClient:
+    """Spreads spaces over several WAS servers by consistent hashing on the space ``urn:uuid``.
+
+    One :class:`StorageClient`, and so one connection pool, is kept per node; :meth:`space`
+    returns a handle bound to the node that owns the id. The caches, retry policy, observers
+    and :class:`ContentIndex` are shared by all nodes, which is safe because every space lives
+    on exactly one of them. Node weights scale each node's share of the key space.
+
+    *httpx_client_factory*, called with each node's base URL, replaces the default pooled
+    ``httpx.Client`` per node (e.g. for a custom transport); the caller then owns those clients.
+    """
+
+    def __init__(
+        self,
+        nodes: Nodes,
+        *,
+        vnodes: int = DEFAULT_VNODES,
+        signature_cache: SignatureCache | None = None,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        coalesce: bool = False,
+        content_index: ContentIndex | None = None,
+        httpx_client_factory: Callable[[str], httpx.Client] | None = None,
+    ) -> None:
+        self._ring = HashRing(nodes, vnodes=vnodes)
+        content_index = content_index or ContentIndex()
+        observers = list(observers)
+        self._clients = {
+            url: StorageClient(
+                url,
+                httpx_client=httpx_client_factory(url) if httpx_client_factory is not None else None,
+                signature_cache=signature_cache,
+                response_cache=response_cache,
+                retry=retry,
+                observers=observers,
+                connection=connection,
+                coalesce=coalesce,
+                content_index=content_index,
+            )
+            for url in self._ring.nodes
+        }
+
+    @property
+    def ring(self) -> HashRing:
+        return self._ring
+
+    @property
+    def clients(self) -> dict[str, StorageClient]:
+        """The per-node clients, keyed by base URL."""
+        return dict(self._clients)
+
+    def node_for(self, space_id: str) -> str:
+        """Base URL of the node that owns *space_id*."""
+        return self._ring.node_for_space(space_id)
+
+    def client_for(self, space_id: str) -> StorageClient:
+        return self._clients[self.node_for(space_id)]
+
+    def add_observer(self, observer: Observer) -> None:
+        for client in self._clients.values():
+            client.add_observer(observer)
+
+    def space(
+        self,
+        id: str | None = None,  # noqa: A002
+        *,
+        signer: Signer | None = None,
+    ) -> Space:
+        """Create a :class:`Space` handle on the node that owns *id* (a new id if ``None``)."""
+        if id is None:
+            id = make_urn_uuid()  # noqa: A001
+        return self.client_for(id).space(id, signer=signer)
+
+    def plan_migration(self, nodes: Nodes, space_ids: Iterable[str]) -> list[Migration]:
+        """Spaces that would move if membership changed to *nodes*; see :func:`plan_migration`."""
+        return plan_migration(self._ring, HashRing(nodes, vnodes=self._ring.vnodes), space_ids)
+
+    def close(self) -> None:
+        for client in self._clients.values():
+            client.close()
+
+    def __enter__(self) -> ShardedStorageClient:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class AsyncShardedStorageClient:
+    """Async counterpart of :class:`ShardedStorageClient`, with one :class:`AsyncStorageClient` per node."""
+
+    def __init__(
+        self,
+        nodes: Nodes,
+        *,
+        vnodes: int = DEFAULT_VNODES,
+        signature_cache: SignatureCache | None = None,
+        response_cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        observers: Iterable[Observer] = (),
+        connection: ConnectionOptions | None = None,
+        coalesce: bool = False,
+        content_index: ContentIndex | None = None,
+        httpx_client_factory: Callable[[str], httpx.AsyncClient] | None = None,
+    ) -> None:
+        self._ring = HashRing(nodes, vnodes=vnodes)
+        content_index = content_index or ContentIndex()
+        observers = list(observers)
+        self._clients = {
+            url: AsyncStorageClient(
+                url,
+                httpx_client=httpx_client_factory(url) if httpx_client_factory is not None else None,
+                signature_cache=signature_cache,
+                response_cache=response_cache,
+                retry=retry,
+                observers=observers,
+                connection=connection,
+                coalesce=coalesce,
+                content_index=content_index,
+            )
+            for url in self._ring.nodes
+        }
+
+    @property
+    def ring(self) -> HashRing:
+        return self._ring
+
+    @property
+    def clients(self) -> dict[str, AsyncStorageClient]:
+        """The per-node clients, keyed by base URL."""
+        return dict(self._clients)
+
+    def node_for(self, space_id: str) -> str:
+        """Base URL of the node that owns *space_id*."""
+        return self._ring.node_for_space(space_id)
+
+    def client_for(self, space_id: str) -> AsyncStorageClient:
+        return self._clients[self.node_for(space_id)]
+
+    def add_observer(self, observer: Observer) -> None:
+        for client in self._clients.values():
+            client.add_observer(observer)
+
+    def space(
+        self,
+        id: str | None = None,  # noqa: A002
+        *,
+        signer: Signer | AsyncSigner | None = None,
+    ) -> AsyncSpace:
+        """Create an :class:`AsyncSpace` handle on the node that owns *id* (a new id if ``None``)."""
+        if id is None:
+            id = make_urn_uuid()  # noqa: A001
+        return self.client_for(id).space(id, signer=signer)
+
+    def plan_migration(self, nodes: Nodes, space_ids: Iterable[str]) -> list[Migration]:
+        """Spaces that would move if membership changed to *nodes*; see :func:`plan_migration`."""
+        return plan_migration(self._ring, HashRing(nodes, vnodes=self._ring.vnodes), space_ids)
+
+    async def aclose(self) -> None:
+        for client in self._clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncShardedStorageClient:
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
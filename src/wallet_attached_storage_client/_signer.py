@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 import base58
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._types import Signer
+
 
 class Ed25519Signer:
     """Ed25519 signer backed by the ``cryptography`` library.
@@ -21,6 +28,15 @@ class Ed25519Signer:
         self._controller = f"did:key:{fingerprint}"
         self._id = f"{self._controller}#{fingerprint}"
 
+    @classmethod
+    def from_private_bytes(cls, data: bytes) -> Ed25519Signer:
+        """Rebuild a signer from the 32-byte raw private key returned by :meth:`private_bytes_raw`."""
+        return cls(Ed25519PrivateKey.from_private_bytes(data))
+
+    def private_bytes_raw(self) -> bytes:
+        """Return the raw 32-byte private key, e.g. to rebuild this signer in a worker process."""
+        return self._private_key.private_bytes_raw()
+
     @property
     def id(self) -> str:
         """Verification method ID (``did:key:z6Mk...#z6Mk...``)."""
@@ -33,3 +49,33 @@ class Ed25519Signer:
 
     def sign(self, data: bytes) -> bytes:
         return self._private_key.sign(data)
+
+    def sign_many(self, data: list[bytes]) -> list[bytes]:
+        sign = self._private_key.sign
+        return [sign(d) for d in data]
+
+
+class ThreadPoolSigner:
+    """Adapt a synchronous :class:`Signer` into an :class:`AsyncSigner` by signing on a thread pool.
+
+    Useful for signers that block for a long time (remote KMS, HSM), so the event loop keeps
+    driving in-flight requests while signatures are produced. Pass an *executor* to share a pool,
+    or let the adapter create one with *max_workers* threads (closed by :meth:`close`).
+    """
+
+    def __init__(self, signer: Signer, *, executor: Executor | None = None, max_workers: int | None = None) -> None:
+        self._signer = signer
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="was-signer")
+
+    @property
+    def id(self) -> str:
+        return self._signer.id
+
+    async def sign(self, data: bytes) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._signer.sign, data)
+
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
@@ -1,15 +1,28 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
-from wallet_attached_storage_client._http_signature import build_auth_headers
+from wallet_attached_storage_client import _chunked
+from wallet_attached_storage_client._bulk import DEFAULT_MAX_WORKERS, BulkResult, PutItem, run_bounded, split_put_item
+from wallet_attached_storage_client._chunked import (
+    DEFAULT_CHUNK_ATTEMPTS,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CHUNK_WORKERS,
+    ChunkedManifest,
+)
+from wallet_attached_storage_client._collection import CollectionParser, SpaceItem, link_path
+from wallet_attached_storage_client._config import ClientConfig
+from wallet_attached_storage_client._request import send, stream
 from wallet_attached_storage_client._resource import Resource
 from wallet_attached_storage_client._urn_uuid import is_urn_uuid, parse_urn_uuid
 
 if TYPE_CHECKING:
+    from wallet_attached_storage_client._content import Content
+    from wallet_attached_storage_client._download import Destination, DownloadResult
     from wallet_attached_storage_client._types import Signer
 
 
@@ -22,6 +35,7 @@ class Space:
         client: httpx.Client,
         id: str,  # noqa: A002
         signer: Signer | None = None,
+        config: ClientConfig | None = None,
     ) -> None:
         if not is_urn_uuid(id):
             raise ValueError(f"Expected a urn:uuid, got {id!r}")
@@ -29,6 +43,7 @@ class Space:
         self._id = id
         self._uuid = parse_urn_uuid(id)
         self._signer = signer
+        self._config = config or ClientConfig()
 
     @property
     def id(self) -> str:
@@ -38,10 +53,23 @@ class Space:
     def path(self) -> str:
         return f"/space/{self._uuid}"
 
-    def _auth_headers(
-        self, method: str, *, signer: Signer | None = None, headers: dict[str, str] | None = None
-    ) -> dict[str, str]:
-        return build_auth_headers(method=method, path=self.path, signer=signer or self._signer, headers=headers)
+    def _send(
+        self,
+        method: str,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+        content: Any = None,
+    ) -> httpx.Response:
+        return send(
+            self._client,
+            self._config,
+            method,
+            self.path,
+            signer=signer or self._signer,
+            headers=headers,
+            content=content,
+        )
 
     def get(
         self,
@@ -49,8 +77,7 @@ class Space:
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("GET", signer=signer, headers=headers)
-        return self._client.get(self.path, headers=h)
+        return self._send("GET", signer=signer, headers=headers)
 
     def put(
         self,
@@ -60,9 +87,9 @@ class Space:
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("PUT", signer=signer, headers=headers)
+        h = dict(headers or {})
         h.setdefault("content-type", content_type)
-        return self._client.put(self.path, content=content, headers=h)
+        return self._send("PUT", signer=signer, headers=h, content=content)
 
     def delete(
         self,
@@ -70,8 +97,35 @@ class Space:
         signer: Signer | None = None,
         headers: dict[str, str] | None = None,
     ) -> httpx.Response:
-        h = self._auth_headers("DELETE", signer=signer, headers=headers)
-        return self._client.delete(self.path, headers=h)
+        return self._send("DELETE", signer=signer, headers=headers)
+
+    def iter_items(
+        self,
+        *,
+        signer: Signer | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Iterator[SpaceItem]:
+        """Yield the resources listed in this space one at a time.
+
+        The collection body is parsed incrementally as it streams in, so the first item is
+        available before the whole listing has arrived and memory use does not grow with the
+        number of items. ``next`` (or ``first``) page links are followed until the last page.
+        Raises :class:`httpx.HTTPStatusError` if a page does not answer with a 2xx status.
+        """
+        path: str | None = self.path
+        seen: set[str] = set()
+        while path is not None and path not in seen:
+            seen.add(path)
+            parser = CollectionParser()
+            with stream(
+                self._client, self._config, "GET", path, signer=signer or self._signer, headers=headers
+            ) as response:
+                response.raise_for_status()
+                for text in response.iter_text():
+                    yield from parser.feed(text)
+                yield from parser.close()
+            link = parser.next_link
+            path = link_path(link) if link is not None else None
 
     def resource(
         self,
@@ -91,4 +145,153 @@ class Space:
             client=self._client,
             path=f"{self.path}{path}",
             signer=signer or self._signer,
+            config=self._config,
         )
+
+    def put_many(
+        self,
+        items: Iterable[PutItem],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        dedup: bool = False,
+        signer: Signer | None = None,
+    ) -> Iterator[BulkResult]:
+        """PUT many resources concurrently, yielding a :class:`BulkResult` per item as it finishes.
+
+        *items* yields ``(path, content)`` or ``(path, content, content_type)`` tuples, with paths
+        relative to this space as for :meth:`resource`. At most *max_workers* requests are in
+        flight at once, and every request is signed individually. With *dedup*, each item goes
+        through :meth:`Resource.put_if_changed` and unchanged ones are skipped (``sent=False``).
+        """
+
+        def put_one(item: PutItem) -> BulkResult:
+            path, content, content_type = split_put_item(item)
+            r = self.resource(path, signer=signer)
+            try:
+                if dedup:
+                    result = r.put_if_changed(content, content_type)
+                    return BulkResult(r.path, response=result.response if result.sent else None, sent=result.sent)
+                return BulkResult(r.path, response=r.put(content, content_type))
+            except (httpx.HTTPError, OSError, ValueError) as e:
+                # A missing or unreadable local file fails its own item, not the whole batch.
+                return BulkResult(r.path, error=e)
+
+        return run_bounded(put_one, items, max_workers)
+
+    def get_many(
+        self,
+        paths: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        signer: Signer | None = None,
+    ) -> Iterator[BulkResult]:
+        """GET many resources concurrently, yielding a :class:`BulkResult` per path as it finishes."""
+
+        def get_one(path: str) -> BulkResult:
+            r = self.resource(path, signer=signer)
+            try:
+                return BulkResult(r.path, response=r.get())
+            except httpx.HTTPError as e:
+                return BulkResult(r.path, error=e)
+
+        return run_bounded(get_one, paths, max_workers)
+
+    def delete_many(
+        self,
+        paths: Iterable[str],
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        signer: Signer | None = None,
+    ) -> Iterator[BulkResult]:
+        """DELETE many resources concurrently, yielding a :class:`BulkResult` per path as it finishes."""
+
+        def delete_one(path: str) -> BulkResult:
+            r = self.resource(path, signer=signer)
+            try:
+                return BulkResult(r.path, response=r.delete())
+            except httpx.HTTPError as e:
+                return BulkResult(r.path, error=e)
+
+        return run_bounded(delete_one, paths, max_workers)
+
+    def put_chunked(
+        self,
+        path: str,
+        content: Content,
+        content_type: str = "application/octet-stream",
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+        attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+        resume: bool = False,
+        signer: Signer | None = None,
+    ) -> ChunkedManifest:
+        """Store a large *content* at *path* as ``chunk_size`` pieces plus a manifest written last.
+
+        Chunks go to hidden resources under ``/.chunks/<path>/`` and are uploaded concurrently,
+        each retried up to *attempts* times on its own, backing off as the client's
+        :class:`RetryPolicy` says. The manifest is only written once every chunk is stored, so
+        readers never see a partial object; if a chunk still fails the error is raised and the
+        manifest left untouched. Once a new manifest replaces an older one, chunks only the old
+        manifest referenced are deleted. With *resume*, each chunk is checked with a ``HEAD``
+        first and skipped if already present, so re-running an interrupted upload only sends
+        what is missing. Chunk names include their digest, so stale chunks never match.
+        """
+        return _chunked.put_chunked(
+            self,
+            path,
+            content,
+            content_type,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            attempts=attempts,
+            resume=resume,
+            retry=self._config.retry,
+            signer=signer,
+        )
+
+    def get_chunked_manifest(self, path: str, *, signer: Signer | None = None) -> ChunkedManifest:
+        """Fetch and parse the manifest of the chunked object at *path*."""
+        return _chunked.get_manifest(self, path, signer=signer)
+
+    def iter_chunked(
+        self,
+        path: str,
+        *,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+        attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+        signer: Signer | None = None,
+    ) -> Iterator[bytes]:
+        """Yield the chunks of the object at *path* in order, fetching up to *max_workers* ahead.
+
+        Each chunk is checked against its manifest digest; a mismatch is retried like a failed
+        request and raises :class:`ValueError` once *attempts* run out.
+        """
+        manifest = _chunked.get_manifest(self, path, signer=signer)
+        return _chunked.iter_chunks(
+            self, manifest, max_workers=max_workers, attempts=attempts, retry=self._config.retry, signer=signer
+        )
+
+    def download_chunked(
+        self,
+        path: str,
+        dest: Destination,
+        *,
+        max_workers: int = DEFAULT_CHUNK_WORKERS,
+        attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+        signer: Signer | None = None,
+    ) -> DownloadResult:
+        """Reassemble the chunked object at *path* into *dest*, verifying the whole-object digest."""
+        return _chunked.download_chunked(
+            self, path, dest, max_workers=max_workers, attempts=attempts, retry=self._config.retry, signer=signer
+        )
+
+    def delete_chunked(
+        self,
+        path: str,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        signer: Signer | None = None,
+    ) -> list[BulkResult]:
+        """Delete the manifest at *path*, then its chunks; returns one :class:`BulkResult` per chunk."""
+        return _chunked.delete_chunked(self, path, max_workers=max_workers, signer=signer)
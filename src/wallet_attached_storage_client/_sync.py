@@ -0,0 +1,326 @@
+"""Incremental directory sync between a local tree and a space, driven by content manifests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mimetypes
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+import httpx
+
+from wallet_attached_storage_client._bulk import DEFAULT_MAX_WORKERS, run_bounded
+
+if TYPE_CHECKING:
+    from wallet_attached_storage_client._space import Space
+
+SIDECAR_NAME = ".was-sync.json"
+_TMP_SUFFIX = ".was-sync.tmp"
+_MANIFEST_VERSION = 1
+
+Progress = Callable[[int, int, str], None]
+"""Called as ``progress(done, total, path)`` after each planned transfer or deletion finishes."""
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """Size, modification time and SHA-256 digest of one file at the time it was last synced."""
+
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+Manifest = dict[str, ManifestEntry]
+
+
+def load_manifest(path: str | os.PathLike[str]) -> Manifest:
+    """Read a manifest written by :func:`save_manifest`; a missing file is an empty manifest."""
+    return _load_sidecar(path)[0]
+
+
+def _load_sidecar(path: str | os.PathLike[str]) -> tuple[Manifest, str | None]:
+    # Also returns the digest of the manifest last uploaded to the space, if any.
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}, None
+    return parse_manifest(data), json.loads(data).get("remoteDigest")
+
+
+def parse_manifest(data: bytes) -> Manifest:
+    doc = json.loads(data)
+    if doc.get("version") != _MANIFEST_VERSION:
+        raise ValueError(f"Unsupported sync manifest version: {doc.get('version')!r}")
+    return {rel: ManifestEntry(**entry) for rel, entry in doc["files"].items()}
+
+
+def dump_manifest(manifest: Manifest, *, remote_digest: str | None = None) -> bytes:
+    files = {rel: vars(entry) for rel, entry in sorted(manifest.items())}
+    doc: dict[str, object] = {"version": _MANIFEST_VERSION, "files": files}
+    if remote_digest is not None:
+        doc["remoteDigest"] = remote_digest
+    return json.dumps(doc, separators=(",", ":")).encode()
+
+
+def save_manifest(
+    path: str | os.PathLike[str], manifest: Manifest, *, remote_digest: str | None = None
+) -> None:
+    """Atomically write *manifest* to *path*.
+
+    *remote_digest* records the SHA-256 of the copy last uploaded to the space, so a later run
+    can tell whether that copy is stale.
+    """
+    tmp = f"{os.fspath(path)}{_TMP_SUFFIX}"
+    with open(tmp, "wb") as f:
+        f.write(dump_manifest(manifest, remote_digest=remote_digest))
+    os.replace(tmp, path)
+
+
+def _hash_file(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def scan(root: str | os.PathLike[str], previous: Manifest | None = None, *, exclude: str = SIDECAR_NAME) -> Manifest:
+    """Build a manifest of every regular file under *root*, keyed by ``/``-separated relative path.
+
+    Files whose size and mtime match their entry in *previous* reuse its digest instead of
+    being read again, so rescanning an unchanged tree only costs a ``stat`` per file.
+    """
+    root = Path(root)
+    previous = previous or {}
+    manifest: Manifest = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = Path(dirpath, name)
+            rel = path.relative_to(root).as_posix()
+            if rel == exclude or name.endswith(_TMP_SUFFIX):
+                continue
+            st = path.stat()
+            old = previous.get(rel)
+            if old is not None and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                manifest[rel] = old
+            else:
+                manifest[rel] = ManifestEntry(st.st_size, st.st_mtime_ns, _hash_file(path))
+    return manifest
+
+
+@dataclass(frozen=True)
+class SyncPlan:
+    """The minimal set of transfers and deletions that brings the target in line with the source."""
+
+    transfer: list[str]
+    delete: list[str]
+    unchanged: int
+
+    def __len__(self) -> int:
+        return len(self.transfer) + len(self.delete)
+
+
+@dataclass
+class SyncReport:
+    """What a :meth:`DirectorySync.push` or :meth:`DirectorySync.pull` run did."""
+
+    transferred: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _check_rel(rel: str) -> None:
+    p = PurePosixPath(rel)
+    if p.is_absolute() or not p.parts or ".." in p.parts:
+        raise ValueError(f"Refusing to sync unsafe path {rel!r}")
+
+
+class DirectorySync:
+    """Mirror a local directory into a :class:`Space` (push) or back out of it (pull).
+
+    Every run scans *root* into a manifest of ``(size, mtime, sha256)`` per file and compares it
+    with the manifest of the last successful sync, kept in a sidecar file (``.was-sync.json``)
+    in *root* and, after each push, as a resource of the same name under *prefix* in the space.
+    Only changed files are transferred; the sidecar only records operations that succeeded, so
+    failures are retried on the next run, and the space's copy is re-uploaded whenever it no
+    longer matches the local one. Push makes the space match the local tree; pull makes
+    the local tree match the last push, never deleting local files the remote has not seen.
+    """
+
+    def __init__(
+        self,
+        space: Space,
+        root: str | os.PathLike[str],
+        *,
+        prefix: str = "",
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        progress: Progress | None = None,
+    ) -> None:
+        self._space = space
+        self._root = Path(root)
+        self._prefix = prefix.strip("/")
+        self._max_workers = max_workers
+        self._progress = progress
+        self._sidecar = self._root / SIDECAR_NAME
+
+    def _remote_path(self, rel: str) -> str:
+        path = quote(rel)
+        return f"/{self._prefix}/{path}" if self._prefix else f"/{path}"
+
+    def _report(self, done: int, total: int, rel: str) -> None:
+        if self._progress is not None:
+            self._progress(done, total, rel)
+
+    def _diff_push(self) -> tuple[SyncPlan, Manifest, Manifest, str | None]:
+        synced, published = _load_sidecar(self._sidecar)
+        local = scan(self._root, synced)
+        transfer = sorted(rel for rel, e in local.items() if rel not in synced or synced[rel].digest != e.digest)
+        delete = sorted(rel for rel in synced if rel not in local)
+        return SyncPlan(transfer, delete, len(local) - len(transfer)), synced, local, published
+
+    def plan_push(self) -> SyncPlan:
+        """Scan *root* and work out what :meth:`push` would upload and delete, without doing it."""
+        return self._diff_push()[0]
+
+    def push(self) -> SyncReport:
+        """Upload new and changed files and delete removed ones so the space mirrors *root*."""
+        plan, synced, local, published = self._diff_push()
+        # Unchanged files may have a new mtime; remember it so the next scan skips hashing them.
+        state = {rel: local[rel] for rel in synced if rel in local and local[rel].digest == synced[rel].digest}
+        # Until an operation succeeds the space still holds the previously synced version.
+        state.update({rel: synced[rel] for rel in [*plan.transfer, *plan.delete] if rel in synced})
+        report = SyncReport(unchanged=plan.unchanged)
+        if plan:
+            self._push_files(plan, local, state, report, published)
+        # Upload the space's copy whenever it differs from the last one that reached the space,
+        # so a failed upload is retried by the next push even if no file has changed since.
+        body = dump_manifest(state)
+        digest = hashlib.sha256(body).hexdigest()
+        if digest != published:
+            self._space.resource(self._remote_path(SIDECAR_NAME)).put(body, "application/json").raise_for_status()
+        save_manifest(self._sidecar, state, remote_digest=digest)
+        return report
+
+    def _push_files(
+        self, plan: SyncPlan, local: Manifest, state: Manifest, report: SyncReport, published: str | None
+    ) -> None:
+        by_path = {self._space.resource(self._remote_path(rel)).path: rel for rel in [*plan.transfer, *plan.delete]}
+        done = 0
+        items = (
+            (self._remote_path(rel), self._root / rel, mimetypes.guess_type(rel)[0] or "application/octet-stream")
+            for rel in plan.transfer
+        )
+        # Files that vanish or become unreadable mid-run come back as per-item errors; the
+        # sidecar is written even if the run is interrupted, so completed uploads are kept.
+        try:
+            for result in self._space.put_many(items, max_workers=self._max_workers):
+                rel = by_path[result.path]
+                if result.ok:
+                    state[rel] = local[rel]
+                    report.transferred.append(rel)
+                else:
+                    report.errors[rel] = result.error or _status_error(result.response)
+                done += 1
+                self._report(done, len(plan), rel)
+            paths = (self._remote_path(rel) for rel in plan.delete)
+            for result in self._space.delete_many(paths, max_workers=self._max_workers):
+                rel = by_path[result.path]
+                if result.ok or (result.response is not None and result.response.status_code == 404):
+                    del state[rel]
+                    report.deleted.append(rel)
+                else:
+                    report.errors[rel] = result.error or _status_error(result.response)
+                done += 1
+                self._report(done, len(plan), rel)
+        finally:
+            save_manifest(self._sidecar, state, remote_digest=published)
+
+    def _fetch_remote_manifest(self) -> Manifest:
+        response = self._space.resource(self._remote_path(SIDECAR_NAME)).get()
+        response.raise_for_status()
+        manifest = parse_manifest(response.content)
+        for rel in manifest:
+            _check_rel(rel)
+        return manifest
+
+    def _diff_pull(self) -> tuple[SyncPlan, Manifest, Manifest, Manifest]:
+        remote = self._fetch_remote_manifest()
+        synced = load_manifest(self._sidecar)
+        local = scan(self._root, synced)
+        transfer = sorted(rel for rel, e in remote.items() if rel not in local or local[rel].digest != e.digest)
+        # Only remove files deleted remotely that have not been modified locally since the last sync.
+        delete = sorted(
+            rel
+            for rel, e in synced.items()
+            if rel not in remote and rel in local and local[rel].digest == e.digest
+        )
+        return SyncPlan(transfer, delete, len(remote) - len(transfer)), remote, synced, local
+
+    def plan_pull(self) -> SyncPlan:
+        """Fetch the space's manifest and work out what :meth:`pull` would download and remove."""
+        return self._diff_pull()[0]
+
+    def pull(self) -> SyncReport:
+        """Download new and changed files and remove files deleted from the space since the last sync."""
+        plan, remote, synced, local = self._diff_pull()
+        published = _load_sidecar(self._sidecar)[1]
+        state = {rel: local[rel] for rel in remote if rel in local and local[rel].digest == remote[rel].digest}
+        # Until an operation succeeds the local tree still holds the previously synced version.
+        state.update({rel: synced[rel] for rel in [*plan.transfer, *plan.delete] if rel in synced})
+        report = SyncReport(unchanged=plan.unchanged)
+
+        def fetch(rel: str) -> tuple[str, ManifestEntry | Exception]:
+            dest = self._root / rel
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f"{dest.name}{_TMP_SUFFIX}")
+            try:
+                result = self._space.resource(self._remote_path(rel)).download_to(tmp, hash_algorithm="sha256")
+            except (httpx.HTTPError, OSError) as e:
+                return rel, e
+            if result.digest != remote[rel].digest:
+                os.unlink(tmp)
+                return rel, ValueError(f"Digest mismatch for {rel!r}: remote changed during pull?")
+            os.replace(tmp, dest)
+            st = dest.stat()
+            return rel, ManifestEntry(st.st_size, st.st_mtime_ns, result.digest)
+
+        done = 0
+        try:
+            for rel, outcome in run_bounded(fetch, plan.transfer, self._max_workers):
+                if isinstance(outcome, Exception):
+                    report.errors[rel] = outcome
+                else:
+                    state[rel] = outcome
+                    report.transferred.append(rel)
+                done += 1
+                self._report(done, len(plan), rel)
+            for rel in plan.delete:
+                try:
+                    (self._root / rel).unlink(missing_ok=True)
+                except OSError as e:
+                    report.errors[rel] = e
+                else:
+                    del state[rel]
+                    report.deleted.append(rel)
+                done += 1
+                self._report(done, len(plan), rel)
+        finally:
+            save_manifest(self._sidecar, state, remote_digest=published)
+        return report
+
+
+def _status_error(response: httpx.Response) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError(
+        f"{response.status_code} for {response.request.method} {response.request.url}",
+        request=response.request,
+        response=response,
+    )
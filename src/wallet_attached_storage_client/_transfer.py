@@ -0,0 +1,179 @@
+"""Multi-process bulk transfer: shard a work list across worker processes, one client and signer each."""
+
+from __future__ import annotations
+
+import itertools
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import httpx
+
+from wallet_attached_storage_client._bulk import DEFAULT_MAX_WORKERS, run_bounded, submit_bounded
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._signer import Ed25519Signer
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from wallet_attached_storage_client._config import ConnectionOptions
+    from wallet_attached_storage_client._retry import RetryPolicy
+
+_METHODS = frozenset({"GET", "PUT", "POST", "DELETE"})
+
+
+@dataclass(frozen=True)
+class TransferItem:
+    """One unit of work for :class:`BulkTransferEngine`: a request against a resource in a space."""
+
+    method: str
+    space_id: str
+    path: str
+    content: bytes = b""
+    content_type: str = "application/octet-stream"
+
+    def __post_init__(self) -> None:
+        if self.method.upper() not in _METHODS:
+            raise ValueError(f"Unsupported transfer method: {self.method!r}")
+
+
+@dataclass(frozen=True)
+class TransferResult:
+    """Per-item outcome streamed back from a worker process.
+
+    *index* is the item's position in the input. *status* is ``None`` when the request failed
+    at the transport level or could not be built (e.g. an invalid *space_id*), in which case
+    *error* describes the failure (exceptions are flattened to strings so they always survive
+    pickling). Successful ``GET`` results carry the body in *content*.
+    """
+
+    index: int
+    method: str
+    space_id: str
+    path: str
+    status: int | None = None
+    error: str | None = None
+    content: bytes | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300
+
+
+# Per-process state, populated by _init_worker in each pool worker.
+_worker_client: StorageClient | None = None
+_worker_signer: Ed25519Signer | None = None
+_worker_threads = DEFAULT_MAX_WORKERS
+
+
+def _init_worker(
+    base_url: str,
+    private_key: bytes,
+    threads: int,
+    connection: ConnectionOptions | None,
+    retry: RetryPolicy | None,
+    httpx_client_factory: Callable[[], httpx.Client] | None,
+) -> None:
+    global _worker_client, _worker_signer, _worker_threads
+    _worker_signer = Ed25519Signer.from_private_bytes(private_key)
+    _worker_threads = threads
+    if httpx_client_factory is not None:
+        _worker_client = StorageClient(base_url, httpx_client=httpx_client_factory(), retry=retry)
+    else:
+        _worker_client = StorageClient(base_url, connection=connection, retry=retry)
+
+
+def _transfer_one(entry: tuple[int, TransferItem]) -> TransferResult:
+    index, item = entry
+    method = item.method.upper()
+    result = {"index": index, "method": method, "space_id": item.space_id, "path": item.path}
+    try:
+        resource = _worker_client.space(item.space_id, signer=_worker_signer).resource(item.path)
+        if method == "GET":
+            resp = resource.get()
+            return TransferResult(**result, status=resp.status_code, content=resp.content if resp.is_success else None)
+        if method == "PUT":
+            resp = resource.put(item.content, item.content_type)
+        elif method == "POST":
+            resp = resource.post(item.content, item.content_type)
+        else:
+            resp = resource.delete()
+    except (httpx.HTTPError, OSError, ValueError) as e:
+        # A bad item (e.g. a malformed space id) fails on its own instead of killing the run.
+        return TransferResult(**result, error=f"{type(e).__name__}: {e}")
+    return TransferResult(**result, status=resp.status_code)
+
+
+def _transfer_chunk(chunk: list[tuple[int, TransferItem]]) -> list[TransferResult]:
+    return list(run_bounded(_transfer_one, chunk, _worker_threads))
+
+
+def _chunked(entries: Iterable[tuple[int, TransferItem]], size: int) -> Iterator[list[tuple[int, TransferItem]]]:
+    it = iter(entries)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+class BulkTransferEngine:
+    """Shard a transfer work list across a process pool so signing and request building scale with cores.
+
+    Each worker process rebuilds its own :class:`StorageClient` and :class:`Ed25519Signer` from
+    the serialised raw key, then runs its share of items over *threads_per_process* threads.
+    Items are sent to workers in chunks of *chunksize*; :meth:`run` yields a
+    :class:`TransferResult` per item as chunks complete, keeping only a bounded number of chunks
+    in flight so arbitrarily long inputs stream through in constant memory.
+
+    *httpx_client_factory* (a picklable, module-level callable) lets each worker build a custom
+    ``httpx.Client``, e.g. for tests or a bespoke transport.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        signer: Ed25519Signer,
+        *,
+        processes: int | None = None,
+        threads_per_process: int = DEFAULT_MAX_WORKERS,
+        chunksize: int = 64,
+        connection: ConnectionOptions | None = None,
+        retry: RetryPolicy | None = None,
+        httpx_client_factory: Callable[[], httpx.Client] | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be >= 1, got {chunksize}")
+        if threads_per_process < 1:
+            raise ValueError(f"threads_per_process must be >= 1, got {threads_per_process}")
+        self._base_url = base_url
+        self._private_key = signer.private_bytes_raw()
+        self._processes = processes or os.cpu_count() or 1
+        self._threads = threads_per_process
+        self._chunksize = chunksize
+        self._connection = connection
+        self._retry = retry
+        self._httpx_client_factory = httpx_client_factory
+        self._mp_context = mp_context
+
+    def run(self, items: Iterable[TransferItem]) -> Iterator[TransferResult]:
+        """Execute *items* across the process pool, yielding results as they complete."""
+        pool = ProcessPoolExecutor(
+            max_workers=self._processes,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(
+                self._base_url,
+                self._private_key,
+                self._threads,
+                self._connection,
+                self._retry,
+                self._httpx_client_factory,
+            ),
+        )
+        try:
+            chunks = _chunked(enumerate(items), self._chunksize)
+            for results in submit_bounded(pool, _transfer_chunk, chunks, 2 * self._processes):
+                yield from results
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
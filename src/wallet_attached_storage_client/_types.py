@@ -9,3 +9,28 @@ class Signer(Protocol):
     def id(self) -> str: ...
 
     def sign(self, data: bytes) -> bytes: ...
+
+
+@runtime_checkable
+class BatchSigner(Signer, Protocol):
+    """A :class:`Signer` that can also sign many payloads in one call.
+
+    Optional: :func:`create_authorization_headers` uses ``sign_many`` when present and falls back
+    to per-item ``sign`` otherwise. Remote and HSM-backed signers can implement it as one round trip.
+    """
+
+    def sign_many(self, data: list[bytes]) -> list[bytes]: ...
+
+
+@runtime_checkable
+class AsyncSigner(Protocol):
+    """A signer whose ``sign`` is a coroutine, e.g. one backed by a remote KMS or HSM.
+
+    Accepted wherever the async client takes a signer. Wrap a slow synchronous :class:`Signer`
+    in :class:`ThreadPoolSigner` to get one.
+    """
+
+    @property
+    def id(self) -> str: ...
+
+    async def sign(self, data: bytes) -> bytes: ...
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import base64
-import json
+import threading
+from collections.abc import Callable
+from typing import Any
 
+import base58
 import httpx
 import nacl.signing
 import pytest
 
+from wallet_attached_storage_client._async_client import AsyncStorageClient
 from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._emulator import WasEmulator
+
+BASE_URL = "https://storage.example"
+SPACE_ID = "urn:uuid:f47ac10b-58cc-4372-a567-0e02b2c3d479"
+SPACE_PATH = "/space/f47ac10b-58cc-4372-a567-0e02b2c3d479"
 
 
 class Ed25519TestSigner:
@@ -16,11 +24,16 @@ class Ed25519TestSigner:
     def __init__(self) -> None:
         self._signing_key = nacl.signing.SigningKey.generate()
         self._verify_key = self._signing_key.verify_key
+        multikey = b"\xed\x01" + self._verify_key.encode()
+        self._fingerprint = "z" + base58.b58encode(multikey).decode("ascii")
 
     @property
     def id(self) -> str:
-        pub_b64 = base64.urlsafe_b64encode(self._verify_key.encode()).decode("ascii").rstrip("=")
-        return f"did:key:{pub_b64}"
+        return f"{self.controller}#{self._fingerprint}"
+
+    @property
+    def controller(self) -> str:
+        return f"did:key:{self._fingerprint}"
 
     def sign(self, data: bytes) -> bytes:
         signed = self._signing_key.sign(data)
@@ -34,69 +47,101 @@ class Ed25519TestSigner:
         return True
 
 
-# In-memory WAS server mock
-_store: dict[str, tuple[bytes, str]] = {}
-
+class EmulatorTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Routes requests to a :class:`WasEmulator`, recording them and failing chosen ones first.
+
+    :meth:`fail` answers the next matching requests with an error status (or a dropped
+    connection when ``status`` is ``None``) before they reach the emulator.  Clearing
+    :attr:`release` holds sync requests until it is set again, so concurrent callers overlap.
+    """
+
+    def __init__(self, emulator: WasEmulator) -> None:
+        self.emulator = emulator
+        self.requests: list[httpx.Request] = []
+        self.failures: list[tuple[Callable[[httpx.Request], bool], int | None, dict[str, str]]] = []
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def fail(
+        self,
+        count: int = 1,
+        status: int | None = 503,
+        *,
+        when: Callable[[httpx.Request], bool] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        with self._lock:
+            self.failures.extend([(when or (lambda request: True), status, headers or {})] * count)
+
+    def methods(self) -> list[str]:
+        return [request.method for request in self.requests]
+
+    def client(self, **kwargs: Any) -> StorageClient:
+        return StorageClient(BASE_URL, httpx_client=httpx.Client(base_url=BASE_URL, transport=self), **kwargs)
+
+    def async_client(self, **kwargs: Any) -> AsyncStorageClient:
+        hx = httpx.AsyncClient(base_url=BASE_URL, transport=self)
+        return AsyncStorageClient(BASE_URL, httpx_client=hx, **kwargs)
+
+    def _failure(self, request: httpx.Request) -> httpx.Response | None:
+        with self._lock:
+            failure = next((f for f in self.failures if f[0](request)), None)
+            if failure is None:
+                return None
+            self.failures.remove(failure)
+        _, status, headers = failure
+        if status is None:
+            raise httpx.ConnectError("Connection reset", request=request)
+        return httpx.Response(status, headers=headers)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        assert self.release.wait(timeout=5)
+        failure = self._failure(request)
+        return failure if failure is not None else self.emulator.handle_request(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        failure = self._failure(request)
+        return failure if failure is not None else await self.emulator.handle_async_request(request)
 
-def _mock_handler(request: httpx.Request) -> httpx.Response:
-    """Mock httpx transport handler simulating a WAS server."""
-    path = request.url.raw_path.decode("utf-8")
-    method = request.method
 
-    if method == "PUT":
-        body = request.read()
-        ct = request.headers.get("content-type", "application/octet-stream")
-        _store[path] = (body, ct)
-        return httpx.Response(204)
+@pytest.fixture()
+def signer() -> Ed25519TestSigner:
+    return Ed25519TestSigner()
 
-    if method == "POST":
-        body = request.read()
-        ct = request.headers.get("content-type", "application/octet-stream")
-        _store[path] = (body, ct)
-        return httpx.Response(201)
 
-    if method == "GET":
-        if path in _store:
-            body, ct = _store[path]
-            return httpx.Response(200, content=body, headers={"content-type": ct})
-        # Space GET returns an empty collection
-        if path.startswith("/space/") and path.count("/") == 2:
-            collection = {"type": "Collection", "totalItems": 0, "items": []}
-            return httpx.Response(
-                200,
-                content=json.dumps(collection).encode(),
-                headers={"content-type": "application/activity+json"},
-            )
-        return httpx.Response(404)
+@pytest.fixture()
+def space_id() -> str:
+    return SPACE_ID
 
-    if method == "DELETE":
-        if path in _store:
-            del _store[path]
-            return httpx.Response(204)
-        if path.startswith("/space/") and path.count("/") == 2:
-            return httpx.Response(204)
-        return httpx.Response(404)
 
-    return httpx.Response(405)
+@pytest.fixture()
+def space_path() -> str:
+    return SPACE_PATH
 
 
-@pytest.fixture(autouse=True)
-def _clear_store() -> None:
-    _store.clear()
+@pytest.fixture()
+def emulator(signer: Ed25519TestSigner, space_id: str) -> WasEmulator:
+    """A :class:`WasEmulator` with ``space_id`` provisioned for ``signer``."""
+    emulator = WasEmulator()
+    emulator.provision(space_id, controller=signer.controller)
+    return emulator
 
 
 @pytest.fixture()
-def signer() -> Ed25519TestSigner:
-    return Ed25519TestSigner()
+def transport(emulator: WasEmulator) -> EmulatorTransport:
+    return EmulatorTransport(emulator)
 
 
 @pytest.fixture()
-def mock_client() -> StorageClient:
-    transport = httpx.MockTransport(_mock_handler)
-    hx = httpx.Client(base_url="https://storage.example", transport=transport)
-    return StorageClient("https://storage.example", httpx_client=hx)
+def mock_client(transport: EmulatorTransport) -> StorageClient:
+    return transport.client()
 
 
 @pytest.fixture()
-def space_id() -> str:
-    return "urn:uuid:f47ac10b-58cc-4372-a567-0e02b2c3d479"
+def mock_async_client(transport: EmulatorTransport) -> AsyncStorageClient:
+    return transport.async_client()
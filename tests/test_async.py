@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._async_resource import AsyncResource
+from wallet_attached_storage_client._async_space import AsyncSpace
+from wallet_attached_storage_client._urn_uuid import is_urn_uuid
+
+from .conftest import Ed25519TestSigner
+
+
+class TestAsyncStorageClient:
+    def test_space_with_id(self, mock_async_client: AsyncStorageClient, space_id: str) -> None:
+        s = mock_async_client.space(space_id)
+        assert isinstance(s, AsyncSpace)
+        assert s.id == space_id
+        assert s.path == "/space/f47ac10b-58cc-4372-a567-0e02b2c3d479"
+
+    def test_space_generates_id(self, mock_async_client: AsyncStorageClient) -> None:
+        s = mock_async_client.space()
+        assert is_urn_uuid(s.id)
+
+    def test_invalid_id_raises(self, mock_async_client: AsyncStorageClient) -> None:
+        with pytest.raises(ValueError):
+            mock_async_client.space("not-a-urn")
+
+    def test_context_manager(self) -> None:
+        async def run() -> None:
+            async with AsyncStorageClient("https://example.com") as client:
+                assert client is not None
+
+        asyncio.run(run())
+
+    def test_resource_path(self, mock_async_client: AsyncStorageClient, space_id: str) -> None:
+        r = mock_async_client.space(space_id).resource("data.json")
+        assert isinstance(r, AsyncResource)
+        assert r.path == "/space/f47ac10b-58cc-4372-a567-0e02b2c3d479/data.json"
+
+
+class TestAsyncSpace:
+    def test_get_put_delete(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        async def run() -> None:
+            s = mock_async_client.space(space_id, signer=signer)
+            resp = await s.get()
+            assert resp.json()["type"] == "Collection"
+            body = json.dumps({"controller": signer.controller}).encode()
+            assert (await s.put(body, "application/json")).status_code == 204
+            assert (await s.delete()).status_code == 204
+
+        asyncio.run(run())
+
+
+class TestAsyncResource:
+    def test_full_lifecycle(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        async def run() -> None:
+            r = mock_async_client.space(space_id, signer=signer).resource("/doc.txt")
+            assert (await r.put(b"hello", "text/plain")).status_code == 204
+            resp = await r.get()
+            assert resp.text == "hello"
+            assert resp.headers["content-type"] == "text/plain"
+            assert (await r.post(b"{}", "application/json")).status_code == 201
+            assert (await r.delete()).status_code == 204
+            assert (await r.get()).status_code == 404
+
+        asyncio.run(run())
+
+    def test_concurrent_requests(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        async def run() -> None:
+            s = mock_async_client.space(space_id, signer=signer)
+            resources = [s.resource(f"/item-{i}") for i in range(20)]
+            await asyncio.gather(*(r.put(f"v{i}".encode()) for i, r in enumerate(resources)))
+            responses = await asyncio.gather(*(r.get() for r in resources))
+            assert [resp.text for resp in responses] == [f"v{i}" for i in range(20)]
+
+        asyncio.run(run())
+
+    def test_sends_signed_authorization(self, space_id: str, signer: Ed25519TestSigner) -> None:
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("authorization", ""))
+            return httpx.Response(204)
+
+        async def run() -> None:
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+            async with AsyncStorageClient("https://storage.example", httpx_client=hx) as client:
+                await client.space(space_id).resource("/x").put(b"data", signer=signer)
+
+        asyncio.run(run())
+        assert seen[0].startswith(f'Signature keyId="{signer.id}"')
+
+
+class TestAsyncResourceStreamingUpload:
+    def test_put_async_and_sync_iterables(self, space_id: str, tmp_path: Path) -> None:
+        bodies: list[tuple[httpx.Headers, bytes]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append((request.headers, request.content))
+            return httpx.Response(204)
+
+        async def agen():
+            for part in (b"one-", b"two-", b"three"):
+                yield part
+
+        f = tmp_path / "upload.bin"
+        f.write_bytes(b"from-disk" * 10_000)
+
+        async def run() -> None:
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+            r = AsyncStorageClient("https://storage.example", httpx_client=hx).space(space_id).resource("/up")
+            await r.put(agen())
+            await r.post(iter([b"a", b"b"]))
+            await r.put(f)
+            with open(f, "rb") as fh:
+                await r.put(fh)
+
+        asyncio.run(run())
+        assert [b for _, b in bodies] == [b"one-two-three", b"ab", f.read_bytes(), f.read_bytes()]
+        assert bodies[0][0]["transfer-encoding"] == "chunked"
+        assert bodies[2][0]["content-length"] == "90000"
+        assert bodies[3][0]["content-length"] == "90000"
+
+
+class TestAsyncResourceStreamingDownload:
+    def test_stream_and_download(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        payload = b"0123456789" * 20_000
+
+        async def run() -> None:
+            r = mock_async_client.space(space_id, signer=signer).resource("/blob")
+            await r.put(payload)
+            async with r.stream() as resp:
+                assert resp.status_code == 200
+                streamed = b"".join([c async for c in resp.aiter_bytes()])
+            assert streamed == payload
+            assert b"".join([c async for c in r.iter_bytes(1000)]) == payload
+            result = await r.download_to(tmp_path / "out.bin", hash_algorithm="sha256")
+            assert result.bytes_written == len(payload)
+            assert result.digest == hashlib.sha256(payload).hexdigest()
+
+        asyncio.run(run())
+        assert (tmp_path / "out.bin").read_bytes() == payload
+
+    def test_download_failure_removes_partial_file(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        async def run() -> None:
+            r = mock_async_client.space(space_id, signer=signer).resource("/missing")
+            await r.download_to(tmp_path / "out.bin")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert not (tmp_path / "out.bin").exists()
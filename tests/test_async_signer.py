@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._http_signature import (
+    SignatureCache,
+    acreate_authorization_header,
+    create_authorization_header,
+)
+from wallet_attached_storage_client._signer import ThreadPoolSigner
+from wallet_attached_storage_client._types import AsyncSigner
+
+from .conftest import Ed25519TestSigner
+
+
+class _AsyncTestSigner:
+    """AsyncSigner that simulates a remote KMS with a fixed latency."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self._inner = Ed25519TestSigner()
+        self._delay = delay
+        self.calls = 0
+
+    @property
+    def id(self) -> str:
+        return self._inner.id
+
+    async def sign(self, data: bytes) -> bytes:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        return self._inner.sign(data)
+
+
+class _SlowSigner(Ed25519TestSigner):
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.threads: set[str] = set()
+
+    def sign(self, data: bytes) -> bytes:
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return super().sign(data)
+
+
+class TestAcreateAuthorizationHeader:
+    def test_async_signer_matches_sync(self) -> None:
+        signer = _AsyncTestSigner()
+        header = asyncio.run(
+            acreate_authorization_header(signer=signer, method="GET", url="/x", created=1.0, expires=31.0)
+        )
+        expected = create_authorization_header(signer=signer._inner, method="GET", url="/x", created=1.0, expires=31.0)
+        assert header == expected
+
+    def test_accepts_sync_signer(self) -> None:
+        signer = Ed25519TestSigner()
+        header = asyncio.run(acreate_authorization_header(signer=signer, method="GET", url="/x"))
+        assert header.startswith(f'Signature keyId="{signer.id}"')
+
+    def test_uses_signature_cache(self) -> None:
+        signer = _AsyncTestSigner()
+        cache = SignatureCache()
+
+        async def run() -> None:
+            for _ in range(3):
+                await acreate_authorization_header(signer=signer, method="GET", url="/x", cache=cache)
+
+        asyncio.run(run())
+        assert signer.calls == 1
+        assert cache.hits == 2
+
+    def test_sync_path_rejects_async_signer(self) -> None:
+        with pytest.raises(TypeError):
+            create_authorization_header(signer=_AsyncTestSigner(), method="GET", url="/x")
+
+
+class TestThreadPoolSigner:
+    def test_satisfies_protocol(self) -> None:
+        signer = ThreadPoolSigner(Ed25519TestSigner())
+        assert isinstance(signer, AsyncSigner)
+        signer.close()
+
+    def test_signs_off_the_event_loop(self) -> None:
+        inner = _SlowSigner(delay=0.05)
+        signer = ThreadPoolSigner(inner, max_workers=8)
+
+        async def run() -> list[bytes]:
+            return await asyncio.gather(*(signer.sign(f"payload-{i}".encode()) for i in range(8)))
+
+        start = time.perf_counter()
+        sigs = asyncio.run(run())
+        elapsed = time.perf_counter() - start
+        signer.close()
+        assert all(inner.verify(f"payload-{i}".encode(), s) for i, s in enumerate(sigs))
+        assert elapsed < 8 * 0.05
+        assert all(name.startswith("was-signer") for name in inner.threads)
+
+
+class TestAsyncClientWithAsyncSigner:
+    def test_requests_signed_concurrently(self, space_id: str) -> None:
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["authorization"])
+            return httpx.Response(204)
+
+        signer = _AsyncTestSigner(delay=0.05)
+
+        async def run() -> float:
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+            space = AsyncStorageClient("https://storage.example", httpx_client=hx).space(space_id, signer=signer)
+            start = time.perf_counter()
+            await asyncio.gather(*(space.resource(f"/r{i}").put(b"x") for i in range(10)))
+            async with space.resource("/r0").stream() as resp:
+                assert resp.status_code == 204
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+        assert len(seen) == 11
+        assert all(a.startswith(f'Signature keyId="{signer.id}"') for a in seen)
+        assert elapsed < 10 * 0.05
+
+    def test_sync_client_rejects_async_signer(self, space_id: str) -> None:
+        transport = httpx.MockTransport(lambda r: httpx.Response(200))
+        hx = httpx.Client(base_url="https://storage.example", transport=transport)
+        client = StorageClient("https://storage.example", httpx_client=hx)
+        with pytest.raises(TypeError):
+            client.space(space_id, signer=_AsyncTestSigner()).get()
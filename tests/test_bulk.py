@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._bulk import BulkResult, run_bounded
+from wallet_attached_storage_client._client import StorageClient
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+class TestRunBounded:
+    def test_respects_max_workers(self) -> None:
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        gate = threading.Barrier(3)
+
+        def work(i: int) -> int:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            if i < 3:
+                gate.wait(timeout=5)
+            with lock:
+                active -= 1
+            return i
+
+        assert sorted(run_bounded(work, range(30), max_workers=3)) == list(range(30))
+        assert peak == 3
+
+    def test_consumes_input_lazily(self) -> None:
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(1000):
+                pulled += 1
+                yield i
+
+        results = run_bounded(lambda i: i, source(), max_workers=2)
+        next(results)
+        results.close()
+        assert pulled < 10
+
+    def test_rejects_zero_workers(self) -> None:
+        with pytest.raises(ValueError):
+            list(run_bounded(lambda i: i, [1], max_workers=0))
+
+
+class TestSpaceBulk:
+    def test_put_get_delete_many(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        s = mock_client.space(space_id, signer=signer)
+        items = [(f"/doc-{i}", f"body-{i}".encode(), "text/plain") for i in range(50)]
+        put_results = list(s.put_many(items, max_workers=8))
+        assert len(put_results) == 50
+        assert all(isinstance(r, BulkResult) and r.ok for r in put_results)
+
+        got = {r.path: r.response.text for r in s.get_many((f"/doc-{i}" for i in range(50)), max_workers=8)}
+        assert got[f"{s.path}/doc-7"] == "body-7"
+        assert len(got) == 50
+
+        assert all(r.ok for r in s.delete_many([f"doc-{i}" for i in range(50)]))
+        assert all(r.response.status_code == 404 for r in s.get_many(["/doc-0", "/doc-49"]))
+
+    def test_two_tuple_defaults_content_type(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        s = mock_client.space(space_id, signer=signer)
+        list(s.put_many([("/bin", b"\x00\x01")]))
+        assert s.resource("/bin").get().headers["content-type"] == "application/octet-stream"
+
+    def test_each_request_signed(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = transport.client().space(space_id, signer=signer)
+        assert all(r.ok for r in s.put_many([("/a", b"1"), ("/b", b"2"), ("/c", b"3")]))
+        assert len(transport.requests) == 3
+        assert all(r.headers["authorization"].startswith("Signature ") for r in transport.requests)
+
+    def test_transport_errors_are_captured(
+        self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        s = transport.client().space(space_id, signer=signer)
+        s.resource("/good").put(b"x")
+        transport.fail(1, None, when=lambda request: request.url.path.endswith("/bad"))
+        results = {r.path.rsplit("/", 1)[1]: r for r in s.delete_many(["/good", "/bad"])}
+        assert results["good"].ok
+        assert not results["bad"].ok
+        assert isinstance(results["bad"].error, httpx.ConnectError)
+        assert results["bad"].response is None
+
+    @pytest.mark.parametrize("dedup", [False, True])
+    def test_missing_file_fails_only_its_item(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path, dedup: bool
+    ) -> None:
+        present = tmp_path / "present.txt"
+        present.write_bytes(b"here")
+        s = mock_client.space(space_id, signer=signer)
+        items = [("/present", present), ("/missing", tmp_path / "missing.txt")]
+        results = {r.path.rsplit("/", 1)[1]: r for r in s.put_many(items, dedup=dedup)}
+        assert results["present"].ok
+        assert isinstance(results["missing"].error, FileNotFoundError)
+        assert not results["missing"].ok
+
+
+class TestAsyncSpaceBulk:
+    def test_put_get_delete_many(
+        self, mock_async_client: AsyncStorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        async def run() -> None:
+            s = mock_async_client.space(space_id, signer=signer)
+            items = [(f"/doc-{i}", f"body-{i}".encode()) for i in range(30)]
+            put_results = [r async for r in s.put_many(items, max_workers=4)]
+            assert len(put_results) == 30
+            assert all(r.ok for r in put_results)
+
+            got = {r.path: r.response.text async for r in s.get_many([f"/doc-{i}" for i in range(30)])}
+            assert got[f"{s.path}/doc-3"] == "body-3"
+
+            deleted = [r async for r in s.delete_many([f"/doc-{i}" for i in range(30)])]
+            assert all(r.ok for r in deleted)
+
+        asyncio.run(run())
@@ -0,0 +1,104 @@
+import asyncio
+from pathlib import Path
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._cache import CachedResponse, DiskResponseCache, MemoryResponseCache
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+class TestMemoryResponseCache:
+    def test_lru_bounded_by_bytes(self) -> None:
+        cache = MemoryResponseCache(max_bytes=10)
+        cache.set("/a", CachedResponse(b"aaaa", {}))
+        cache.set("/b", CachedResponse(b"bbbb", {}))
+        cache.get("/a")
+        cache.set("/c", CachedResponse(b"cccc", {}))
+        assert cache.get("/b") is None
+        assert cache.get("/a") is not None
+        assert cache.size == 8
+
+    def test_oversized_entry_not_stored(self) -> None:
+        cache = MemoryResponseCache(max_bytes=3)
+        cache.set("/a", CachedResponse(b"toolong", {}))
+        assert len(cache) == 0
+
+
+class TestDiskResponseCache:
+    def test_roundtrip(self, tmp_path: Path) -> None:
+        cache = DiskResponseCache(tmp_path)
+        cache.set("/space/x/a", CachedResponse(b"\x00body", {"etag": '"1"'}))
+        entry = cache.get("/space/x/a")
+        assert entry == CachedResponse(b"\x00body", {"etag": '"1"'})
+        assert DiskResponseCache(tmp_path).get("/space/x/a") == entry
+        cache.delete("/space/x/a")
+        assert cache.get("/space/x/a") is None
+        cache.delete("/space/x/a")
+
+
+class TestConditionalGet:
+    def test_revalidates_and_serves_cached_body(
+        self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        client = transport.client(response_cache=MemoryResponseCache())
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put(b"hello", "text/plain")
+        first = r.get()
+        assert first.status_code == 200
+        assert "if-none-match" not in transport.requests[-1].headers
+
+        second = r.get()
+        assert transport.requests[-1].headers["if-none-match"] == first.headers["etag"]
+        assert second.status_code == 200
+        assert second.content == b"hello"
+        assert second.headers["content-type"] == "text/plain"
+        assert client.cache_stats.hits == 1
+        assert client.cache_stats.misses == 1
+        assert client.cache_stats.bytes_saved == 5
+
+    def test_write_invalidates(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        cache = MemoryResponseCache()
+        client = transport.client(response_cache=cache)
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put(b"v1")
+        r.get()
+        assert len(cache) == 1
+        r.put(b"v2")
+        assert len(cache) == 0
+        assert r.get().content == b"v2"
+        r.delete()
+        assert len(cache) == 0
+        assert r.get().status_code == 404
+
+    def test_caller_conditional_headers_bypass_cache(
+        self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        client = transport.client(response_cache=MemoryResponseCache())
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put(b"v1")
+        etag = r.get().headers["etag"]
+        resp = r.get(headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert client.cache_stats.hits == 0
+
+    def test_disk_backend(
+        self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        client = transport.client(response_cache=DiskResponseCache(tmp_path))
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put(b"on disk")
+        r.get()
+        assert r.get().content == b"on disk"
+        assert client.cache_stats.hits == 1
+
+    def test_async_client(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        async def run() -> AsyncStorageClient:
+            client = transport.async_client(response_cache=MemoryResponseCache())
+            r = client.space(space_id, signer=signer).resource("/doc")
+            await r.put(b"async")
+            await r.get()
+            assert (await r.get()).content == b"async"
+            return client
+
+        client = asyncio.run(run())
+        assert client.cache_stats.hits == 1
@@ -0,0 +1,194 @@
+import hashlib
+import io
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client import _chunked
+from wallet_attached_storage_client._bulk import run_ordered
+from wallet_attached_storage_client._chunked import (
+    MANIFEST_CONTENT_TYPE,
+    ChunkedManifest,
+    chunk_path,
+    split_chunks,
+)
+from wallet_attached_storage_client._emulator import WasEmulator
+from wallet_attached_storage_client._retry import RetryPolicy
+from wallet_attached_storage_client._space import Space
+
+from .conftest import SPACE_ID, SPACE_PATH, Ed25519TestSigner, EmulatorTransport
+
+BODY = bytes(range(256)) * 40  # 10240 bytes -> 11 chunks of 1000
+
+
+def _requests(transport: EmulatorTransport, method: str | None = None) -> list[tuple[str, str]]:
+    """``(method, path)`` of each request the transport saw, with paths relative to the space."""
+    requests = [(r.method, r.url.path.removeprefix(SPACE_PATH)) for r in transport.requests]
+    return [(m, p) for m, p in requests if method is None or m == method]
+
+
+def _puts(transport: EmulatorTransport) -> list[str]:
+    return [p for _, p in _requests(transport, "PUT")]
+
+
+def _failing(transport: EmulatorTransport, path: str, count: int) -> None:
+    transport.fail(count, 503, when=lambda request: request.url.path == SPACE_PATH + path)
+
+
+def _stored(space: Space) -> set[str]:
+    return {item.name for item in space.iter_items()}
+
+
+def _space(transport: EmulatorTransport, signer: Ed25519TestSigner, retry: RetryPolicy) -> Space:
+    return transport.client(retry=retry).space(SPACE_ID, signer=signer)
+
+
+@pytest.fixture
+def space(transport: EmulatorTransport, signer: Ed25519TestSigner) -> Space:
+    # The client itself sends every request once; chunk attempts retry without waiting.
+    return _space(transport, signer, RetryPolicy(max_attempts=1, backoff_base=0))
+
+
+@pytest.fixture
+def direct(emulator: WasEmulator, signer: Ed25519TestSigner) -> Space:
+    """The same space, reached without going through the recording transport."""
+    return emulator.client().space(SPACE_ID, signer=signer)
+
+
+class TestSplitChunks:
+    @pytest.mark.parametrize("make", [bytes, io.BytesIO, lambda b: iter([b[:7], b[7:2500], b[2500:]])])
+    def test_sources_split_identically(self, make) -> None:
+        chunks = list(split_chunks(make(BODY), 1000))
+        assert [len(c) for c in chunks] == [1000] * 10 + [240]
+        assert b"".join(chunks) == BODY
+
+    def test_rejects_bad_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(split_chunks(b"x", 0))
+
+
+def test_run_ordered_preserves_input_order() -> None:
+    def slow_first(i: int) -> int:
+        time.sleep(0.02 if i == 0 else 0)
+        return i * i
+
+    assert list(run_ordered(slow_first, range(20), 4)) == [i * i for i in range(20)]
+
+
+class TestChunkedObjects:
+    def test_round_trip(self, space: Space, transport: EmulatorTransport, direct: Space, tmp_path: Path) -> None:
+        manifest = space.put_chunked("/big.bin", BODY, "video/mp4", chunk_size=1000, max_workers=3)
+        assert manifest.size == len(BODY)
+        assert manifest.digest == hashlib.sha256(BODY).hexdigest()
+        assert len(manifest.chunks) == 11
+        assert manifest.chunks[3].path == chunk_path("/big.bin", 3, hashlib.sha256(BODY[3000:4000]).hexdigest())
+        # The manifest is the last write, under the object's own path.
+        assert _puts(transport)[-1] == "/big.bin"
+        assert direct.resource("/big.bin").get().headers["content-type"] == MANIFEST_CONTENT_TYPE
+        assert space.get_chunked_manifest("/big.bin") == manifest
+
+        assert b"".join(space.iter_chunked("/big.bin", max_workers=3)) == BODY
+        result = space.download_chunked("/big.bin", tmp_path / "out.bin")
+        assert result.bytes_written == len(BODY)
+        assert (tmp_path / "out.bin").read_bytes() == BODY
+
+    def test_resume_skips_stored_chunks(self, space: Space, transport: EmulatorTransport, direct: Space) -> None:
+        for i in range(5):
+            info_path = chunk_path("/big.bin", i, hashlib.sha256(BODY[i * 1000:(i + 1) * 1000]).hexdigest())
+            direct.resource(info_path).put(BODY[i * 1000:(i + 1) * 1000])
+        space.put_chunked("/big.bin", io.BytesIO(BODY), chunk_size=1000, resume=True)
+        assert len(_puts(transport)) == 6 + 1
+        assert b"".join(space.iter_chunked("/big.bin")) == BODY
+
+    def test_failed_chunk_is_retried_alone(self, space: Space, transport: EmulatorTransport) -> None:
+        failing = chunk_path("/big.bin", 4, hashlib.sha256(BODY[4000:5000]).hexdigest())
+        _failing(transport, failing, 2)
+        space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        assert _puts(transport).count(failing) == 3
+        assert len(_puts(transport)) == 11 + 2 + 1
+
+    def test_exhausted_chunk_leaves_no_manifest(
+        self, space: Space, transport: EmulatorTransport, direct: Space
+    ) -> None:
+        _failing(transport, chunk_path("/big.bin", 0, hashlib.sha256(BODY[:1000]).hexdigest()), 10)
+        with pytest.raises(httpx.HTTPStatusError):
+            space.put_chunked("/big.bin", BODY, chunk_size=1000, attempts=2)
+        assert "/big.bin" not in _stored(direct)
+        # Re-running resumes: chunks stored before the failure are not sent again.
+        transport.failures.clear()
+        before = len(_puts(transport))
+        space.put_chunked("/big.bin", BODY, chunk_size=1000, resume=True)
+        assert len(_puts(transport)) - before <= 11 + 1
+        assert b"".join(space.iter_chunked("/big.bin")) == BODY
+
+    def test_chunks_are_not_probed_by_default(
+        self, space: Space, transport: EmulatorTransport, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        digests: list[bytes] = []
+        real_digest = _chunked._digest
+        monkeypatch.setattr(_chunked, "_digest", lambda data: digests.append(data) or real_digest(data))
+        space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        assert transport.methods() == ["GET"] + ["PUT"] * 12
+        assert len(digests) == 11
+
+    def test_chunk_retries_back_off(
+        self, transport: EmulatorTransport, signer: Ed25519TestSigner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        delays: list[float] = []
+        monkeypatch.setattr(_chunked.time, "sleep", delays.append)
+        space = _space(transport, signer, RetryPolicy(max_attempts=1, backoff_base=1, jitter=0))
+        _failing(transport, chunk_path("/big.bin", 4, hashlib.sha256(BODY[4000:5000]).hexdigest()), 2)
+        space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        assert delays == [1, 2]
+
+    def test_overwrite_deletes_unreferenced_chunks(
+        self, space: Space, transport: EmulatorTransport, direct: Space
+    ) -> None:
+        space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        changed = b"y" * 1000 + BODY[1000:]
+        manifest = space.put_chunked("/big.bin", changed, chunk_size=1000)
+        assert _stored(direct) == {"/big.bin", *(c.path for c in manifest.chunks)}
+        assert [p for _, p in _requests(transport, "DELETE")] == [
+            chunk_path("/big.bin", 0, hashlib.sha256(BODY[:1000]).hexdigest())
+        ]
+        assert b"".join(space.iter_chunked("/big.bin")) == changed
+
+    def test_overwrite_plain_resource(self, space: Space, transport: EmulatorTransport) -> None:
+        space.resource("/big.bin").put(b"plain", "text/plain")
+        space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        assert "DELETE" not in transport.methods()
+        assert b"".join(space.iter_chunked("/big.bin")) == BODY
+
+    def test_invalid_attempts_sends_nothing(self, space: Space, transport: EmulatorTransport) -> None:
+        with pytest.raises(ValueError, match="attempts"):
+            space.put_chunked("/big.bin", BODY, chunk_size=1000, attempts=0)
+        assert transport.requests == []
+
+    def test_corrupt_chunk_raises(self, space: Space, direct: Space, tmp_path: Path) -> None:
+        manifest = space.put_chunked("/big.bin", BODY, chunk_size=1000)
+        direct.resource(manifest.chunks[2].path).put(b"x" * 1000)
+        with pytest.raises(ValueError, match="digest"):
+            b"".join(space.iter_chunked("/big.bin"))
+        with pytest.raises(ValueError):
+            space.download_chunked("/big.bin", tmp_path / "out.bin")
+        assert not (tmp_path / "out.bin").exists()
+
+    def test_delete_removes_manifest_then_chunks(
+        self, space: Space, transport: EmulatorTransport, direct: Space
+    ) -> None:
+        space.put_chunked("/big.bin", BODY, chunk_size=4096)
+        results = space.delete_chunked("/big.bin")
+        assert len(results) == 3 and all(r.ok for r in results)
+        assert _stored(direct) == set()
+        assert _requests(transport, "DELETE")[0] == ("DELETE", "/big.bin")
+
+    def test_empty_object_and_non_manifest(self, space: Space) -> None:
+        manifest = space.put_chunked("/empty", b"")
+        assert manifest.chunks == () and manifest.size == 0
+        assert list(space.iter_chunked("/empty")) == []
+        space.resource("/plain").put(b'{"type": "Other"}', "application/json")
+        with pytest.raises(ValueError):
+            space.get_chunked_manifest("/plain")
+        assert ChunkedManifest.from_json(manifest.to_json()) == manifest
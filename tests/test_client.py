@@ -1,4 +1,11 @@
+import asyncio
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
 from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._config import ConnectionOptions
 from wallet_attached_storage_client._space import Space
 from wallet_attached_storage_client._urn_uuid import is_urn_uuid
 
@@ -29,3 +36,52 @@ class TestStorageClient:
         # The underlying httpx client should still be usable
         s = mock_client.space()
         assert is_urn_uuid(s.id)
+
+
+class TestConnectionOptions:
+    def test_defaults_match_httpx(self) -> None:
+        opts = ConnectionOptions()
+        assert opts.limits() == httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0)
+        assert opts.timeouts() == httpx.Timeout(5.0)
+
+    def test_per_phase_timeouts(self) -> None:
+        opts = ConnectionOptions(timeout=10.0, connect_timeout=1.0, pool_timeout=0.5)
+        assert opts.timeouts() == httpx.Timeout(10.0, connect=1.0, pool=0.5)
+
+    def test_applied_to_owned_client(self) -> None:
+        opts = ConnectionOptions(max_connections=200, timeout=None, read_timeout=30.0)
+        with StorageClient("https://example.com", connection=opts) as client:
+            assert client._client.timeout == httpx.Timeout(None, read=30.0)
+
+    def test_rejected_with_external_client(self) -> None:
+        with pytest.raises(ValueError):
+            StorageClient("https://example.com", httpx_client=httpx.Client(), connection=ConnectionOptions())
+
+
+class TestWarmup:
+    def test_opens_concurrent_probes(self) -> None:
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.method)
+            return httpx.Response(404)
+
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+        client = StorageClient("https://storage.example", httpx_client=hx)
+        assert client.warmup(8) == 8
+        assert seen == ["HEAD"] * 8
+        assert client.warmup(0) == 0
+
+    def test_counts_failures(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+        assert StorageClient("https://storage.example", httpx_client=hx).warmup(3) == 0
+
+    def test_async_warmup(self) -> None:
+        hx = httpx.AsyncClient(
+            base_url="https://storage.example", transport=httpx.MockTransport(lambda r: httpx.Response(200))
+        )
+        client = AsyncStorageClient("https://storage.example", httpx_client=hx)
+        assert asyncio.run(client.warmup(5)) == 5
@@ -0,0 +1,149 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._coalesce import RequestCoalescer
+from wallet_attached_storage_client._emulator import WasEmulator
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+@pytest.fixture()
+def etag(emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> str:
+    """Stores ``/config.json`` in the emulator space and returns its ETag."""
+    response = emulator.client().space(space_id, signer=signer).resource("/config.json").put(b"shared config")
+    return response.headers["etag"]
+
+
+@pytest.fixture()
+def gated(transport: EmulatorTransport, etag: str) -> EmulatorTransport:
+    """The emulator transport, holding each request until :attr:`~EmulatorTransport.release` is set."""
+    transport.release.clear()
+    return transport
+
+
+class TestSyncCoalescing:
+    def test_concurrent_gets_share_one_request(
+        self, gated: EmulatorTransport, etag: str, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        client = gated.client(coalesce=True)
+        resource = client.space(space_id, signer=signer).resource("/config.json")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(resource.get) for _ in range(8)]
+            _wait_for(lambda: client.coalescer.coalesced == 7)
+            gated.release.set()
+            responses = [f.result() for f in futures]
+        assert len(gated.requests) == 1
+        assert client.coalescer.requests == 1
+        assert {r.content for r in responses} == {b"shared config"}
+        assert all(r.headers["etag"] == etag for r in responses)
+        assert len({id(r) for r in responses}) == 8
+
+    def test_sequential_gets_are_not_coalesced(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        client = transport.client(coalesce=True)
+        resource = client.space(space_id, signer=signer).resource("/config.json")
+        resource.get()
+        resource.get()
+        assert len(transport.requests) == 2
+        assert client.coalescer.coalesced == 0
+
+    def test_different_signers_are_not_coalesced(
+        self, gated: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        client = gated.client(coalesce=True)
+        resource = client.space(space_id).resource("/config.json")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(resource.get, signer=s) for s in (signer, Ed25519TestSigner())]
+            _wait_for(lambda: len(gated.requests) == 2)
+            gated.release.set()
+            statuses = [f.result().status_code for f in futures]
+        assert statuses == [200, 403]
+        assert client.coalescer.coalesced == 0
+
+    def test_writes_are_not_coalesced(self, gated: EmulatorTransport, signer: Ed25519TestSigner, space_id: str) -> None:
+        client = gated.client(coalesce=True)
+        resource = client.space(space_id, signer=signer).resource("/config.json")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(resource.delete) for _ in range(2)]
+            _wait_for(lambda: len(gated.requests) == 2)
+            gated.release.set()
+            statuses = sorted(f.result().status_code for f in futures)
+        assert statuses == [204, 404]
+
+    def test_errors_propagate_to_every_waiter(
+        self, gated: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        gated.fail(1, None)
+        client = gated.client(coalesce=True)
+        resource = client.space(space_id, signer=signer).resource("/config.json")
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(resource.get) for _ in range(4)]
+            _wait_for(lambda: client.coalescer.coalesced == 3)
+            gated.release.set()
+            for f in futures:
+                with pytest.raises(httpx.ConnectError):
+                    f.result()
+        assert len(gated.requests) == 1
+
+    def test_disabled_by_default(self, transport: EmulatorTransport) -> None:
+        assert transport.client().coalescer is None
+
+
+class TestAsyncCoalescing:
+    def test_concurrent_gets_share_one_request(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        transport.emulator.latency = 0.01
+
+        async def run() -> list[httpx.Response]:
+            async with transport.async_client(coalesce=True) as client:
+                resource = client.space(space_id, signer=signer).resource("/config.json")
+                responses = await asyncio.gather(*(resource.get() for _ in range(10)))
+                assert client.coalescer.coalesced == 9
+                return responses
+
+        responses = asyncio.run(run())
+        assert len(transport.requests) == 1
+        assert [r.content for r in responses] == [b"shared config"] * 10
+
+    def test_cancelling_first_caller_does_not_cancel_others(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        transport.emulator.latency = 0.02
+
+        async def run() -> httpx.Response:
+            async with transport.async_client(coalesce=True) as client:
+                resource = client.space(space_id, signer=signer).resource("/config.json")
+                first = asyncio.create_task(resource.get())
+                await asyncio.sleep(0)
+                second = asyncio.create_task(resource.get())
+                await asyncio.sleep(0)
+                first.cancel()
+                return await second
+
+        assert asyncio.run(run()).content == b"shared config"
+
+
+class TestRequestCoalescer:
+    def test_leader_exception_clears_key(self) -> None:
+        coalescer = RequestCoalescer()
+
+        def boom() -> httpx.Response:
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError):
+            coalescer.do("k", boom)
+        assert coalescer.do("k", lambda: httpx.Response(204)).status_code == 204
+        assert coalescer.requests == 2
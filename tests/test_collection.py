@@ -0,0 +1,165 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._collection import CollectionParser, SpaceItem, link_path
+
+from .conftest import SPACE_ID, SPACE_PATH, Ed25519TestSigner, EmulatorTransport
+
+
+def _parse(text: str, step: int) -> tuple[list[SpaceItem], CollectionParser]:
+    parser = CollectionParser()
+    items = []
+    for i in range(0, len(text), step):
+        items.extend(parser.feed(text[i:i + step]))
+    items.extend(parser.close())
+    return items, parser
+
+
+class TestCollectionParser:
+    DOC = {
+        "type": "Collection",
+        "totalItems": 4,
+        "items": [
+            {"id": "urn:uuid:1", "type": "Resource", "name": "notes é \"q\"", "url": {"href": "/a"}},
+            "https://storage.example/space/x/b",
+            {"id": 1234567890, "nested": [1, 2.5e10, {"deep": [True, None]}]},
+            {"id": "urn:uuid:4", "type": ["Resource", "Document"], "url": "/d"},
+        ],
+        "next": "https://storage.example/space/x?page=2",
+    }
+
+    @pytest.mark.parametrize("step", [1, 2, 3, 7, 64, 100_000])
+    def test_any_chunking_gives_same_items(self, step: int) -> None:
+        items, parser = _parse(json.dumps(self.DOC, indent=2), step)
+        assert [i.data for i in items] == [
+            self.DOC["items"][0],
+            {"id": "https://storage.example/space/x/b"},
+            self.DOC["items"][2],
+            self.DOC["items"][3],
+        ]
+        assert items[0] == SpaceItem(id="urn:uuid:1", type="Resource", name='notes é "q"', url="/a")
+        assert items[3].type == ["Resource", "Document"]
+        assert parser.fields["totalItems"] == 4
+        assert "items" not in parser.fields
+        assert parser.next_link == "https://storage.example/space/x?page=2"
+
+    def test_yields_items_before_body_completes(self) -> None:
+        parser = CollectionParser()
+        assert list(parser.feed('{"items": [{"id": "a"}, {"id": "b"')) == [SpaceItem(id="a")]
+        assert list(parser.feed("}]}")) == [SpaceItem(id="b")]
+        assert list(parser.close()) == []
+
+    def test_number_split_across_chunks(self) -> None:
+        parser = CollectionParser()
+        assert list(parser.feed('{"totalItems": 12')) == []
+        list(parser.feed("34}"))
+        list(parser.close())
+        assert parser.fields["totalItems"] == 1234
+
+    def test_ordered_items_and_empty_collection(self) -> None:
+        items, _ = _parse('{"orderedItems": ["x", "y"]}', 4)
+        assert [i.id for i in items] == ["x", "y"]
+        items, parser = _parse('{"type": "Collection", "totalItems": 0, "items": []}', 5)
+        assert items == []
+        assert parser.next_link is None
+
+    def test_embedded_first_page(self) -> None:
+        doc = {"type": "Collection", "first": {"type": "CollectionPage", "items": ["a"], "next": "/p2"}}
+        items, parser = _parse(json.dumps(doc), 3)
+        assert [i.id for i in items] == ["a"]
+        assert parser.next_link == "/p2"
+
+    def test_first_link_followed_only_without_items(self) -> None:
+        _, parser = _parse('{"type": "Collection", "totalItems": 9, "first": "/p1"}', 8)
+        assert parser.next_link == "/p1"
+        _, parser = _parse('{"type": "CollectionPage", "first": "/p1", "items": ["z"]}', 8)
+        assert parser.next_link is None
+
+    @pytest.mark.parametrize("body", ['{"items": [{"id": "a"}', '{"items": [1 2]}', '{"a": 1} x', "[1]"])
+    def test_malformed_bodies_raise(self, body: str) -> None:
+        with pytest.raises(ValueError):
+            _parse(body, 3)
+
+    def test_link_path(self) -> None:
+        assert link_path("https://storage.example/space/x?page=2") == "/space/x?page=2"
+        assert link_path("/space/x?page=3") == "/space/x?page=3"
+
+
+def _paged_handler(requests: list[httpx.Request]):
+    pages = {
+        SPACE_PATH: {"type": "Collection", "totalItems": 5, "first": f"https://storage.example{SPACE_PATH}?page=1"},
+        f"{SPACE_PATH}?page=1": {
+            "type": "CollectionPage",
+            "items": [{"id": f"r{i}", "type": "Resource"} for i in range(3)],
+            "next": f"{SPACE_PATH}?page=2",
+        },
+        f"{SPACE_PATH}?page=2": {
+            "type": "CollectionPage",
+            "items": [{"id": "r3"}, {"id": "r4"}],
+            "first": f"{SPACE_PATH}?page=1",
+        },
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        page = pages.get(request.url.raw_path.decode())
+        if page is None:
+            return httpx.Response(404)
+        return httpx.Response(200, json=page)
+
+    return handler
+
+
+class TestSpaceIterItems:
+    def test_follows_pages(self) -> None:
+        requests: list[httpx.Request] = []
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(_paged_handler(requests)))
+        space = StorageClient("https://storage.example", httpx_client=hx).space(SPACE_ID, signer=Ed25519TestSigner())
+        assert [i.id for i in space.iter_items()] == ["r0", "r1", "r2", "r3", "r4"]
+        assert len(requests) == 3
+        assert all(r.headers["authorization"].startswith("Signature ") for r in requests)
+
+    def test_streams_first_item_before_body_is_read(self) -> None:
+        sent = []
+
+        def body():
+            sent.append("head")
+            yield b'{"type": "Collection", "items": [{"id": "first"}'
+            sent.append("tail")
+            yield b', {"id": "second"}]}'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=body())
+
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+        space = StorageClient("https://storage.example", httpx_client=hx).space(SPACE_ID)
+        items = space.iter_items()
+        assert next(items).id == "first"
+        assert sent == ["head"]
+        assert [i.id for i in items] == ["second"]
+
+    def test_error_status_raises(self, transport: EmulatorTransport, space_id: str) -> None:
+        # Unsigned, so the server answers 401.
+        with pytest.raises(httpx.HTTPStatusError):
+            list(transport.client().space(space_id).iter_items())
+
+    def test_empty_space(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        assert list(transport.client().space(space_id, signer=signer).iter_items()) == []
+
+    def test_async_follows_pages(self) -> None:
+        requests: list[httpx.Request] = []
+
+        async def run() -> list[str]:
+            transport = httpx.MockTransport(_paged_handler(requests))
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=transport)
+            async with AsyncStorageClient("https://storage.example", httpx_client=hx) as client:
+                space = client.space(SPACE_ID, signer=Ed25519TestSigner())
+                return [i.id async for i in space.iter_items()]
+
+        assert asyncio.run(run()) == ["r0", "r1", "r2", "r3", "r4"]
+        assert len(requests) == 3
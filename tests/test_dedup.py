@@ -0,0 +1,164 @@
+import asyncio
+import hashlib
+import io
+from pathlib import Path
+
+import pytest
+
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._dedup import ContentIndex, content_digest
+from wallet_attached_storage_client._emulator import WasEmulator
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+@pytest.fixture
+def client(transport: EmulatorTransport) -> StorageClient:
+    return transport.client()
+
+
+class TestContentDigest:
+    def test_bytes_path_and_seekable_file(self, tmp_path: Path) -> None:
+        expected = hashlib.sha256(b"payload").hexdigest()
+        path = tmp_path / "f"
+        path.write_bytes(b"payload")
+        f = io.BytesIO(b"xxpayload")
+        f.seek(2)
+        assert content_digest(b"payload") == expected
+        assert content_digest(bytearray(b"payload")) == expected
+        assert content_digest(path) == expected
+        assert content_digest(f) == expected
+        assert f.tell() == 2
+
+    def test_iterators_are_not_consumed(self) -> None:
+        chunks = iter([b"a", b"b"])
+        assert content_digest(chunks) is None
+        assert list(chunks) == [b"a", b"b"]
+
+
+class TestContentIndex:
+    def test_lru_eviction(self) -> None:
+        index = ContentIndex(max_entries=2)
+        index.record("/a", "1")
+        index.record("/b", "2")
+        index.get("/a")
+        index.record("/c", "3")
+        assert index.get("/b") is None
+        assert index.get("/a").digest == "1"
+        assert len(index) == 2
+
+
+class TestPutIfChanged:
+    def test_skips_identical_upload(
+        self, client: StorageClient, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        r = client.space(space_id, signer=signer).resource("/doc")
+        first = r.put_if_changed(b"same bytes")
+        assert first.sent and first.ok
+        second = r.put_if_changed(b"same bytes")
+        assert not second.sent and second.ok
+        assert second.response is None
+        assert second.digest == first.digest
+        assert transport.methods() == ["PUT"]
+        assert r.put_if_changed(b"new bytes").sent
+        assert transport.methods() == ["PUT", "PUT"]
+
+    def test_other_writes_invalidate(
+        self, client: StorageClient, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put_if_changed(b"v1")
+        r.put(b"v2")
+        assert r.put_if_changed(b"v1").sent
+        r.delete()
+        assert r.put_if_changed(b"v1").sent
+        assert transport.methods() == ["PUT", "PUT", "PUT", "DELETE", "PUT"]
+
+    def test_verify_uses_etag(
+        self,
+        client: StorageClient,
+        transport: EmulatorTransport,
+        emulator: WasEmulator,
+        signer: Ed25519TestSigner,
+        space_id: str,
+    ) -> None:
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put_if_changed(b"v1")
+        result = r.put_if_changed(b"v1", verify=True)
+        assert not result.sent
+        assert result.response.status_code == 304
+        # Someone else overwrites the resource behind this client's back.
+        emulator.client().space(space_id, signer=signer).resource("/doc").put(b"other")
+        assert r.put_if_changed(b"v1", verify=True).sent
+        assert transport.methods() == ["PUT", "HEAD", "HEAD", "PUT"]
+
+    def test_streamed_iterator_is_indexed(
+        self, client: StorageClient, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        r = client.space(space_id, signer=signer).resource("/doc")
+        result = r.put_if_changed(iter([b"chunk-1", b"chunk-2"]))
+        assert result.sent
+        assert result.digest == hashlib.sha256(b"chunk-1chunk-2").hexdigest()
+        assert not r.put_if_changed(b"chunk-1chunk-2").sent
+
+    def test_rejects_async_iterable(
+        self, client: StorageClient, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        async def agen():
+            yield b"x"
+
+        with pytest.raises(TypeError):
+            client.space(space_id, signer=signer).resource("/doc").put_if_changed(agen())
+        assert transport.methods() == []
+
+    def test_failed_put_is_not_indexed(
+        self, client: StorageClient, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        transport.fail(1, 500)
+        r = client.space(space_id, signer=signer).resource("/doc")
+        assert not r.put_if_changed(b"x").ok
+        assert r.put_if_changed(b"x").sent
+
+    def test_put_many_dedup(
+        self, client: StorageClient, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        space = client.space(space_id, signer=signer)
+        items = [(f"/doc-{i}", f"body-{i}".encode()) for i in range(4)]
+        assert all(r.sent and r.ok for r in space.put_many(items, dedup=True))
+        items[2] = ("/doc-2", b"changed")
+        results = {r.path.rsplit("/", 1)[1]: r for r in space.put_many(items, dedup=True)}
+        assert [k for k, r in sorted(results.items()) if r.sent] == ["doc-2"]
+        assert all(r.ok for r in results.values())
+        assert transport.methods().count("PUT") == 5
+
+    def test_shared_index(self, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str) -> None:
+        index = ContentIndex()
+        clients = [transport.client(content_index=index) for _ in range(2)]
+        clients[0].space(space_id, signer=signer).resource("/doc").put_if_changed(b"x")
+        assert clients[1].content_index is index
+        assert not clients[1].space(space_id, signer=signer).resource("/doc").put_if_changed(b"x").sent
+
+
+class TestAsyncPutIfChanged:
+    def test_skips_identical_upload(
+        self, transport: EmulatorTransport, signer: Ed25519TestSigner, space_id: str, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "blob"
+        path.write_bytes(b"file body")
+
+        async def chunks():
+            yield b"file "
+            yield b"body"
+
+        async def run() -> list[bool]:
+            async with transport.async_client() as client:
+                space = client.space(space_id, signer=signer)
+                r = space.resource("/blob")
+                results = [await r.put_if_changed(path), await r.put_if_changed(b"file body")]
+                results.append(await r.put_if_changed(chunks()))
+                results.append(await r.put_if_changed(path, verify=True))
+                bulk = [b async for b in space.put_many([("/blob", b"file body")], dedup=True)]
+                return [x.sent for x in results] + [b.sent for b in bulk]
+
+        assert asyncio.run(run()) == [True, False, True, False, False]
+        assert transport.methods() == ["PUT", "PUT", "HEAD"]
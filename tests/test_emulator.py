@@ -0,0 +1,180 @@
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._emulator import WasEmulator, resolve_did_key
+from wallet_attached_storage_client._http_signature import create_authorization_header
+from wallet_attached_storage_client._retry import RetryPolicy
+from wallet_attached_storage_client._signer import Ed25519Signer
+
+from .conftest import Ed25519TestSigner
+
+
+class TestSpaces:
+    def test_provision_get_delete(self, signer: Ed25519TestSigner, space_id: str) -> None:
+        space = WasEmulator().client().space(space_id, signer=signer)
+        body = json.dumps({"id": space_id, "controller": signer.controller}).encode()
+        assert space.put(body, "application/json").status_code == 204
+        assert space.get().json()["controller"] == signer.controller
+        assert space.delete().status_code == 204
+        assert space.get().status_code == 404
+
+    def test_cannot_provision_for_another_controller_or_take_over(self, space_id: str) -> None:
+        client = WasEmulator().client()
+        owner, other = Ed25519Signer(), Ed25519Signer()
+        body = json.dumps({"controller": owner.controller}).encode()
+        assert client.space(space_id, signer=other).put(body, "application/json").status_code == 403
+        assert client.space(space_id, signer=owner).put(body, "application/json").status_code == 204
+        takeover = json.dumps({"controller": other.controller}).encode()
+        assert client.space(space_id, signer=other).put(takeover, "application/json").status_code == 403
+        assert client.space(space_id).put(body, "application/json").status_code == 401
+
+    def test_listing_is_paginated(
+        self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str, space_path: str
+    ) -> None:
+        emulator.page_size = 2
+        space = emulator.client().space(space_id, signer=signer)
+        for i in range(5):
+            space.resource(f"/doc-{i}").put(b"x", "text/plain")
+        items = list(space.iter_items())
+        assert [item.name for item in items] == [f"/doc-{i}" for i in range(5)]
+        assert items[0].url == f"{space_path}/doc-0"
+        assert emulator.stats().statuses[200] == 3
+
+
+class TestResources:
+    def test_crud_and_etags(self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> None:
+        space = emulator.client().space(space_id, signer=signer)
+        doc = space.resource("/doc.json")
+        put = doc.put(b'{"a": 1}', "application/json")
+        assert put.status_code == 204
+        got = doc.get()
+        assert got.json() == {"a": 1}
+        assert got.headers["content-type"] == "application/json"
+        assert got.headers["etag"] == put.headers["etag"]
+        assert doc.get(headers={"if-none-match": put.headers["etag"]}).status_code == 304
+        assert doc.put(b"x", headers={"if-match": '"stale"'}).status_code == 412
+        assert doc.delete().status_code == 204
+        assert doc.get().status_code == 404
+        assert doc.delete().status_code == 404
+
+    def test_put_if_changed_round_trip(self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> None:
+        space = emulator.client().space(space_id, signer=signer)
+        doc = space.resource("/doc")
+        assert doc.put_if_changed(b"v1").sent
+        result = doc.put_if_changed(b"v1", verify=True)
+        assert not result.sent and result.response.status_code == 304
+
+    def test_ranges(self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str, tmp_path: Path) -> None:
+        body = bytes(range(256)) * 40
+        space = emulator.client().space(space_id, signer=signer)
+        blob = space.resource("/blob.bin")
+        blob.put(body)
+        part = blob.get_range(100, 199)
+        assert part.partial and part.content == body[100:200] and part.total == len(body)
+        assert blob.get_range(len(body)).response.status_code == 416
+        dest = tmp_path / "blob.bin"
+        result = blob.download_parallel(dest, part_size=1000, hash_algorithm="sha256")
+        assert result.digest == hashlib.sha256(body).hexdigest()
+        assert dest.read_bytes() == body
+
+    def test_resource_on_unknown_space(self, signer: Ed25519TestSigner, space_id: str) -> None:
+        space = WasEmulator().client().space(space_id, signer=signer)
+        assert space.resource("/doc").put(b"x").status_code == 404
+
+
+class TestSignatures:
+    def test_other_signer_and_unsigned_requests(self, emulator: WasEmulator, space_id: str) -> None:
+        client = emulator.client()
+        intruder = client.space(space_id, signer=Ed25519Signer()).resource("/doc")
+        assert intruder.put(b"x").status_code == 403
+        assert intruder.get().status_code == 403
+        anonymous = client.space(space_id).resource("/doc")
+        assert anonymous.put(b"x").status_code == 401
+        assert anonymous.get().status_code == 401
+
+    def test_public_reads(self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> None:
+        emulator.public_reads = True
+        client = emulator.client()
+        client.space(space_id, signer=signer).resource("/doc").put(b"hello")
+        assert client.space(space_id).resource("/doc").get().content == b"hello"
+
+    def test_expired_and_tampered_signatures(self, space_id: str, space_path: str) -> None:
+        now = [time.time()]
+        emulator = WasEmulator(clock=lambda: now[0])
+        signer = Ed25519Signer()
+        emulator.provision(space_id, controller=signer.controller)
+        hx = httpx.Client(base_url="https://was.emulator", transport=emulator)
+        path = f"{space_path}/doc"
+
+        header = create_authorization_header(signer=signer, method="PUT", url=path)
+        assert hx.put(path, content=b"x", headers={"authorization": header}).status_code == 204
+        now[0] += 60
+        assert hx.put(path, content=b"x", headers={"authorization": header}).status_code == 401
+        now[0] -= 60
+        # Signed for a different path.
+        header = create_authorization_header(signer=signer, method="PUT", url=f"{space_path}/other")
+        response = hx.put(path, content=b"x", headers={"authorization": header})
+        assert response.status_code == 401
+        assert response.json()["title"] == "Invalid signature"
+        garbled = header.replace('keyId="did:key:z', 'keyId="did:key:zz')
+        assert hx.put(path, content=b"x", headers={"authorization": garbled}).status_code == 401
+
+    def test_resolve_did_key(self) -> None:
+        signer = Ed25519Signer()
+        key = resolve_did_key(signer.id)
+        key.verify(signer.sign(b"data"), b"data")
+        assert resolve_did_key(signer.controller).public_bytes_raw() == key.public_bytes_raw()
+        for bad in ("did:web:example.com", "did:key:abc", f"{signer.controller}#zOther"):
+            with pytest.raises(ValueError):
+                resolve_did_key(bad)
+
+
+class TestFaults:
+    def test_fail_next_is_retried(self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> None:
+        retry = RetryPolicy(max_attempts=3, backoff_base=0, jitter=0)
+        space = emulator.client(retry=retry).space(space_id, signer=signer)
+        emulator.fail_next(2, 503, retry_after=0)
+        assert space.resource("/doc").put(b"x").status_code == 204
+        stats = emulator.stats()
+        assert stats.injected_errors == 2
+        assert stats.statuses == {204: 1, 503: 2}
+
+    def test_error_rate_is_seeded(self, space_id: str) -> None:
+        def statuses(seed: int) -> list[int]:
+            emulator = WasEmulator(error_rate=0.5, error_status=500, seed=seed)
+            emulator.provision(space_id, controller="did:key:zNobody")
+            resource = emulator.client().space(space_id).resource("/doc")
+            return [resource.get().status_code for _ in range(40)]
+
+        first = statuses(7)
+        assert first == statuses(7)
+        assert set(first) == {401, 500}
+
+    def test_latency_overlaps_in_async_clients(
+        self, emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str
+    ) -> None:
+        emulator.latency = lambda request: 0.1 if request.method == "GET" else 0
+
+        async def run() -> list[bytes]:
+            async with emulator.async_client() as client:
+                space = client.space(space_id, signer=signer)
+                await space.resource("/doc").put(b"hello")
+                responses = await asyncio.gather(*(space.resource("/doc").get() for _ in range(20)))
+                return [r.content for r in responses]
+
+        start = time.perf_counter()
+        assert asyncio.run(run()) == [b"hello"] * 20
+        assert time.perf_counter() - start < 1
+        assert emulator.stats().requests == 21
+
+    def test_invalid_options(self) -> None:
+        with pytest.raises(ValueError):
+            WasEmulator(error_rate=2)
+        with pytest.raises(ValueError):
+            WasEmulator(page_size=0)
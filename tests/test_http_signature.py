@@ -1,8 +1,18 @@
 import base64
 
+import httpx
 import pytest
 
-from wallet_attached_storage_client._http_signature import build_signature_string, create_authorization_header
+from wallet_attached_storage_client import _http_signature
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._http_signature import (
+    SignatureCache,
+    SignatureTemplate,
+    build_signature_string,
+    compile_signature_template,
+    create_authorization_header,
+    create_authorization_headers,
+)
 
 from .conftest import Ed25519TestSigner
 
@@ -59,6 +69,42 @@ class TestBuildSignatureString:
             )
 
 
+class TestSignatureTemplate:
+    def test_matches_build_signature_string(self) -> None:
+        template = SignatureTemplate()
+        expected = build_signature_string(method="PUT", path="/space/x/y", created=1, expires=31, key_id="k")
+        got = template.build(method="PUT", path="/space/x/y", created=1, expires=31, key_id="k")
+        assert got == expected.encode("utf-8")
+        assert template.headers_param == "(created) (expires) (key-id) (request-target)"
+
+    def test_custom_order(self) -> None:
+        template = SignatureTemplate(["(request-target)", "(key-id)"])
+        assert template.build_string(method="GET", path="/p", created=0, expires=0, key_id="k") == (
+            "(request-target): get /p\n(key-id): k"
+        )
+
+    def test_validated_at_compile_time(self) -> None:
+        with pytest.raises(ValueError):
+            SignatureTemplate(["(created)", "host"])
+
+    def test_braces_in_values_are_literal(self) -> None:
+        out = SignatureTemplate().build_string(method="GET", path="/{0}", created=1, expires=2, key_id="{x}")
+        assert "(key-id): {x}" in out
+        assert "(request-target): get /{0}" in out
+
+    def test_compile_is_memoised(self) -> None:
+        assert compile_signature_template() is compile_signature_template(None)
+        assert compile_signature_template(["(created)"]) is compile_signature_template(("(created)",))
+
+    def test_header_uses_template(self) -> None:
+        signer = Ed25519TestSigner()
+        template = SignatureTemplate(["(created)", "(request-target)"])
+        header = create_authorization_header(
+            signer=signer, method="GET", url="/x", created=1.0, expires=31.0, template=template
+        )
+        assert 'headers="(created) (request-target)"' in header
+
+
 class TestCreateAuthorizationHeader:
     def test_format(self) -> None:
         signer = Ed25519TestSigner()
@@ -120,3 +166,119 @@ class TestCreateAuthorizationHeader:
         expires = int(header[expires_idx:expires_end])
 
         assert expires - created == 30
+
+
+class TestSignatureCache:
+    def test_reuses_header_within_window(self) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache()
+        h1 = create_authorization_header(signer=signer, method="GET", url="/space/a", cache=cache)
+        h2 = create_authorization_header(signer=signer, method="GET", url="/space/a", cache=cache)
+        assert h1 == h2
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_method_and_path(self) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache()
+        create_authorization_header(signer=signer, method="GET", url="/space/a", cache=cache)
+        create_authorization_header(signer=signer, method="PUT", url="/space/a", cache=cache)
+        create_authorization_header(signer=signer, method="GET", url="/space/b", cache=cache)
+        create_authorization_header(signer=Ed25519TestSigner(), method="GET", url="/space/a", cache=cache)
+        assert cache.hits == 0
+        assert len(cache) == 4
+
+    def test_expires_within_margin(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache(margin=5)
+        clock = [1700000000.0]
+        monkeypatch.setattr(_http_signature.time, "time", lambda: clock[0])
+        h1 = create_authorization_header(signer=signer, method="GET", url="/x", cache=cache)
+        clock[0] += 24
+        assert create_authorization_header(signer=signer, method="GET", url="/x", cache=cache) == h1
+        clock[0] += 1
+        h3 = create_authorization_header(signer=signer, method="GET", url="/x", cache=cache)
+        assert h3 != h1
+        assert 'created="1700000025"' in h3
+
+    def test_lru_eviction(self) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache(max_size=2)
+        for path in ("/a", "/b", "/a", "/c"):
+            create_authorization_header(signer=signer, method="GET", url=path, cache=cache)
+        assert len(cache) == 2
+        create_authorization_header(signer=signer, method="GET", url="/a", cache=cache)
+        create_authorization_header(signer=signer, method="GET", url="/b", cache=cache)
+        # "/a" survived as most recently used; "/b" was evicted by "/c"
+        assert cache.hits == 2
+        assert cache.misses == 4
+
+    def test_pinned_timestamps_bypass_cache(self) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache()
+        create_authorization_header(signer=signer, method="GET", url="/x", created=1.0, expires=31.0, cache=cache)
+        assert len(cache) == 0
+        assert cache.hits == cache.misses == 0
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            SignatureCache(max_size=0)
+        with pytest.raises(ValueError):
+            SignatureCache(margin=30)
+
+    def test_client_threads_cache_to_resources(self, space_id: str) -> None:
+        signer = Ed25519TestSigner()
+        cache = SignatureCache()
+        transport = httpx.MockTransport(lambda r: httpx.Response(200))
+        hx = httpx.Client(base_url="https://storage.example", transport=transport)
+        client = StorageClient("https://storage.example", httpx_client=hx, signature_cache=cache)
+        r = client.space(space_id, signer=signer).resource("/poll")
+        for _ in range(5):
+            r.get()
+        assert cache.misses == 1
+        assert cache.hits == 4
+
+
+class _CountingBatchSigner(Ed25519TestSigner):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[int] = []
+
+    def sign_many(self, data: list[bytes]) -> list[bytes]:
+        self.batches.append(len(data))
+        return [self.sign(d) for d in data]
+
+
+class TestCreateAuthorizationHeaders:
+    def test_matches_single_header_path(self) -> None:
+        signer = Ed25519TestSigner()
+        requests = [("GET", "/space/a"), ("PUT", "/space/a/b"), ("DELETE", "/space/a/c")]
+        batch = create_authorization_headers(signer=signer, requests=requests, created=1700000000, expires=1700000030)
+        singles = [
+            create_authorization_header(signer=signer, method=m, url=u, created=1700000000, expires=1700000030)
+            for m, u in requests
+        ]
+        assert batch == singles
+
+    def test_shared_timestamps(self) -> None:
+        signer = Ed25519TestSigner()
+        headers = create_authorization_headers(signer=signer, requests=[("GET", f"/r{i}") for i in range(10)])
+        windows = {(h[h.index('created="'):]) for h in headers}
+        assert len(windows) == 1
+
+    def test_uses_sign_many_when_available(self) -> None:
+        signer = _CountingBatchSigner()
+        headers = create_authorization_headers(signer=signer, requests=[("GET", f"/r{i}") for i in range(5)])
+        assert signer.batches == [5]
+        assert len(headers) == 5
+
+    def test_sign_many_length_mismatch(self) -> None:
+        class BrokenSigner(Ed25519TestSigner):
+            def sign_many(self, data: list[bytes]) -> list[bytes]:
+                return []
+
+        with pytest.raises(ValueError):
+            create_authorization_headers(signer=BrokenSigner(), requests=[("GET", "/a")])
+
+    def test_empty_batch(self) -> None:
+        assert create_authorization_headers(signer=_CountingBatchSigner(), requests=[]) == []
@@ -0,0 +1,155 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client import _request
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._instrument import (
+    LatencyHistogram,
+    LatencyRecorder,
+    RequestRecord,
+    path_template,
+)
+from wallet_attached_storage_client._retry import RetryPolicy
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+class TestPathTemplate:
+    def test_templates(self) -> None:
+        assert path_template("/space/f47ac10b-58cc-4372-a567-0e02b2c3d479") == "/space/{space}"
+        assert path_template("/space/f47ac10b/a/b.txt") == "/space/{space}/{resource}"
+        assert path_template("/other") == "/other"
+
+
+class TestLatencyHistogram:
+    def test_empty_snapshot(self) -> None:
+        snap = LatencyHistogram().snapshot()
+        assert snap.count == 0
+        assert snap.p99 == 0.0
+
+    def test_percentiles_within_bucket_resolution(self) -> None:
+        hist = LatencyHistogram()
+        for ms in range(1, 1001):
+            hist.record(ms / 1000)
+        snap = hist.snapshot()
+        assert snap.count == 1000
+        assert snap.max == 1.0
+        assert snap.mean == pytest.approx(0.5005)
+        assert 0.5 <= snap.p50 <= 0.5 * 1.1
+        assert 0.95 <= snap.p95 <= 0.95 * 1.1
+        assert 0.99 <= snap.p99 <= 1.0
+
+    def test_reset(self) -> None:
+        hist = LatencyHistogram()
+        hist.record(0.1)
+        hist.reset()
+        assert hist.snapshot().count == 0
+
+
+class TestObservers:
+    def test_record_per_request(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        records: list[RequestRecord] = []
+        client = transport.client(observers=[records.append])
+        r = client.space(space_id, signer=signer).resource("/doc")
+        r.put(b"hello world")
+        r.get()
+
+        put, get = records
+        assert put.method == "PUT"
+        assert put.path_template == "/space/{space}/{resource}"
+        assert put.status == 204
+        assert put.bytes_sent == 11
+        assert get.status == 200
+        assert get.bytes_received == 11
+        for rec in records:
+            assert rec.signing > 0
+            assert rec.ttfb is not None
+            assert rec.total >= rec.signing + rec.ttfb
+
+    def test_unsigned_request_has_negligible_signing(self, mock_client: StorageClient, space_id: str) -> None:
+        records: list[RequestRecord] = []
+        mock_client.add_observer(records.append)
+        mock_client.space(space_id).get()
+        assert records[0].path_template == "/space/{space}"
+        assert records[0].signing < records[0].total
+
+    def test_streamed_body_has_unknown_size(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        records: list[RequestRecord] = []
+        mock_client.add_observer(records.append)
+        mock_client.space(space_id, signer=signer).resource("/s").put(iter([b"a", b"b"]))
+        assert records[0].bytes_sent is None
+
+    def test_failed_attempts_are_recorded(
+        self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_request.time, "sleep", lambda _: None)
+        transport.fail(1, None)
+        records: list[RequestRecord] = []
+        client = transport.client(retry=RetryPolicy(), observers=[records.append])
+        client.space(space_id, signer=signer).get()
+        assert [(r.attempt, r.status) for r in records] == [(1, None), (2, 200)]
+        assert isinstance(records[0].error, httpx.ConnectError)
+        assert records[0].ttfb is None
+
+    def test_streamed_downloads_and_listings_are_recorded(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        records: list[RequestRecord] = []
+        mock_client.add_observer(records.append)
+        space = mock_client.space(space_id, signer=signer)
+        r = space.resource("/blob")
+        r.put(b"x" * 5000)
+        records.clear()
+        assert b"".join(r.iter_bytes(1000)) == b"x" * 5000
+        r.download_to(tmp_path / "out.bin")
+        list(space.iter_items())
+        assert [(rec.method, rec.status, rec.bytes_received) for rec in records[:2]] == [("GET", 200, 5000)] * 2
+        assert records[2].path_template == "/space/{space}"
+        assert all(rec.ttfb is not None and rec.total >= rec.ttfb for rec in records)
+
+    def test_streamed_error_is_recorded(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        records: list[RequestRecord] = []
+        mock_client.add_observer(records.append)
+        with pytest.raises(httpx.HTTPStatusError):
+            list(mock_client.space(space_id, signer=signer).resource("/missing").iter_bytes())
+        assert records[0].status == 404
+        assert isinstance(records[0].error, httpx.HTTPStatusError)
+
+    def test_latency_recorder(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        recorder = LatencyRecorder()
+        mock_client.add_observer(recorder)
+        r = mock_client.space(space_id, signer=signer).resource("/doc")
+        for _ in range(5):
+            r.get()
+        r.delete()
+        snap = recorder.snapshot()
+        assert snap[("GET", "/space/{space}/{resource}")].count == 5
+        assert snap[("DELETE", "/space/{space}/{resource}")].count == 1
+
+    def test_async_observers(self, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> None:
+        records: list[RequestRecord] = []
+
+        async def run() -> None:
+            client = transport.async_client(observers=[records.append])
+            space = client.space(space_id, signer=signer)
+            r = space.resource("/doc")
+            await r.put(b"abc")
+            await r.get()
+            assert b"".join([c async for c in r.iter_bytes()]) == b"abc"
+            assert [item.name async for item in space.iter_items()] == ["/doc"]
+
+        asyncio.run(run())
+        assert [(r.method, r.status, r.bytes_received) for r in records] == [
+            ("PUT", 204, 0),
+            ("GET", 200, 3),
+            ("GET", 200, 3),
+            ("GET", 200, records[3].bytes_received),
+        ]
+        assert records[3].path_template == "/space/{space}"
@@ -0,0 +1,52 @@
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+import wallet_attached_storage_client
+
+HEAVY_MODULES = ("httpx", "cryptography", "base58")
+
+
+def _imported_modules(statement: str) -> set[str]:
+    """Module names ``python -X importtime`` reports as loaded while running *statement*."""
+    proc = subprocess.run(  # noqa: S603  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    names = set()
+    for line in proc.stderr.splitlines():
+        _, _, fields = line.partition("import time:")
+        parts = fields.split("|")
+        if len(parts) == 3:
+            names.add(parts[2].strip())
+    return names
+
+
+class TestLazyImports:
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import wallet_attached_storage_client",
+            "from wallet_attached_storage_client import make_urn_uuid, parse_urn_uuid",
+            "from wallet_attached_storage_client import create_authorization_header",
+        ],
+    )
+    def test_light_imports_skip_heavy_dependencies(self, statement: str) -> None:
+        loaded = _imported_modules(statement)
+        assert "wallet_attached_storage_client" in loaded
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_client_import_loads_httpx(self) -> None:
+        assert "httpx" in _imported_modules("from wallet_attached_storage_client import StorageClient")
+
+    @pytest.mark.parametrize("name", wallet_attached_storage_client.__all__)
+    def test_every_public_name_resolves(self, name: str) -> None:
+        value = getattr(wallet_attached_storage_client, name)
+        assert getattr(value, "__name__", name) == name
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="no_such_name"):
+            wallet_attached_storage_client.no_such_name
+
+    def test_dir_lists_public_names(self) -> None:
+        assert set(wallet_attached_storage_client.__all__) <= set(dir(wallet_attached_storage_client))
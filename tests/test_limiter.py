@@ -0,0 +1,268 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._async_client import AsyncStorageClient
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._limiter import AdaptiveLimiter
+from wallet_attached_storage_client._retry import RetryPolicy
+
+from .conftest import SPACE_ID, Ed25519TestSigner
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr("wallet_attached_storage_client._limiter.time.monotonic", clock)
+    return clock
+
+
+class TestAdaptiveLimiter:
+    def test_grows_additively_on_success(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=None)
+        for _ in range(4):
+            limiter.release(limiter.acquire(), status=200)
+        assert limiter.limit == 4  # 4 + 1/4 + ... < 5
+        for _ in range(4):
+            limiter.release(limiter.acquire(), status=200)
+        assert limiter.limit == 5
+        assert limiter.in_flight == 0
+
+    def test_never_exceeds_max(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=2, max_limit=3, latency_tolerance=None)
+        for _ in range(100):
+            limiter.release(limiter.acquire(), status=200)
+        assert limiter.limit == 3
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_halves_on_overload(self, status: int) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=None)
+        limiter.release(limiter.acquire(), status=status)
+        assert limiter.limit == 8
+
+    def test_timeout_counts_as_overload(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=None)
+        limiter.release(limiter.acquire(), error=httpx.ReadTimeout("slow"))
+        assert limiter.limit == 8
+
+    def test_other_errors_leave_limit_alone(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=None)
+        limiter.release(limiter.acquire(), error=httpx.ConnectError("refused"))
+        assert limiter.limit == 16
+
+    def test_one_decrease_per_window(self, clock: _Clock) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=None)
+        tokens = [limiter.acquire() for _ in range(8)]
+        clock.now += 1
+        for t in tokens:
+            limiter.release(t, status=429)
+        assert limiter.limit == 8
+        # A request started after the decrease may shrink it again.
+        limiter.release(limiter.acquire(), status=429)
+        assert limiter.limit == 4
+
+    def test_respects_min_limit(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, latency_tolerance=None)
+        limiter.release(limiter.acquire(), status=503)
+        assert limiter.limit == 2
+
+    def test_rising_latency_shrinks_limit(self, clock: _Clock) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=2.0, smoothing=1.0)
+        started = limiter.acquire()
+        clock.now += 0.010
+        limiter.release(started, status=200)
+        assert limiter.limit == 16
+        started = limiter.acquire()
+        clock.now += 0.050
+        limiter.release(started, status=200)
+        assert limiter.limit == 8
+
+    def test_explicit_latency_overrides_slot_time(self, clock: _Clock) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, latency_tolerance=2.0, smoothing=1.0)
+        started = limiter.acquire()
+        clock.now += 0.010
+        limiter.release(started, status=200)
+        started = limiter.acquire()
+        clock.now += 5.0  # a long streamed body, but the headers came back quickly
+        limiter.release(started, status=200, latency=0.010)
+        assert limiter.limit == 16
+
+    def test_fast_outlier_does_not_pin_the_limit(self, clock: _Clock) -> None:
+        limiter = AdaptiveLimiter(initial_limit=16, baseline_window=20)
+
+        def sample(latency: float) -> None:
+            started = limiter.acquire()
+            clock.now += latency
+            limiter.release(started, status=200)
+
+        for _ in range(5):
+            sample(0.005)
+        sample(0.000001)  # e.g. a cached 304
+        for _ in range(50):
+            sample(0.005)
+        # The outlier left the window after 20 samples; the limit is climbing back.
+        assert limiter.limit >= 4
+        for _ in range(150):
+            sample(0.005)
+        assert limiter.limit >= 16
+
+    def test_invalid_baseline_window(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(baseline_window=0)
+
+    def test_queues_beyond_limit(self) -> None:
+        limiter = AdaptiveLimiter(initial_limit=1, max_limit=1, latency_tolerance=None)
+        first = limiter.acquire()
+        admitted = threading.Event()
+
+        def second() -> None:
+            limiter.release(limiter.acquire(), status=200)
+            admitted.set()
+
+        worker = threading.Thread(target=second)
+        worker.start()
+        deadline = time.monotonic() + 5
+        while limiter.queued == 0:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        assert not admitted.is_set()
+        limiter.release(first, status=200)
+        worker.join(timeout=5)
+        assert admitted.is_set()
+        assert limiter.queued == 0
+        assert limiter.in_flight == 0
+
+    def test_cancelled_async_waiter_leaves_queue(self) -> None:
+        async def run() -> AdaptiveLimiter:
+            limiter = AdaptiveLimiter(initial_limit=1, max_limit=1, latency_tolerance=None)
+            first = await limiter.aacquire()
+            waiter = asyncio.create_task(limiter.aacquire())
+            await asyncio.sleep(0)
+            assert limiter.queued == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            assert limiter.queued == 0
+            limiter.release(first, status=200)
+            return limiter
+
+        limiter = asyncio.run(run())
+        assert limiter.in_flight == 0
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"min_limit": 0}, {"initial_limit": 300}, {"min_limit": 8, "initial_limit": 4}, {"decrease": 1.0}]
+    )
+    def test_validates_arguments(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(**kwargs)
+
+
+class TestClientLimiter:
+    def test_caps_concurrency_and_backs_off(self) -> None:
+        lock = threading.Lock()
+        active = peak = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.005)
+            with lock:
+                active -= 1
+            return httpx.Response(429 if request.url.path.endswith("/busy") else 200)
+
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=4, latency_tolerance=None)
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+        client = StorageClient("https://storage.example", httpx_client=hx, limiter=limiter)
+        assert client.limiter is limiter
+        space = client.space(SPACE_ID, signer=Ed25519TestSigner())
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda i: space.resource(f"/r{i}").get(), range(32)))
+        assert peak <= 4
+        space.resource("/busy").get()
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+    def test_async_client(self) -> None:
+        active = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.002)
+            active -= 1
+            return httpx.Response(503 if request.url.path.endswith("/busy") else 200)
+
+        limiter = AdaptiveLimiter(initial_limit=3, max_limit=3, latency_tolerance=None)
+
+        async def run() -> None:
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+            async with AsyncStorageClient("https://storage.example", httpx_client=hx, limiter=limiter) as client:
+                space = client.space(SPACE_ID, signer=Ed25519TestSigner())
+                await asyncio.gather(*(space.resource(f"/r{i}").get() for i in range(20)))
+                await space.resource("/busy").get()
+
+        asyncio.run(run())
+        assert peak <= 3
+        assert limiter.limit == 1
+        assert limiter.in_flight == 0
+
+    def test_streams_hold_a_slot_until_closed(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                return httpx.Response(503, headers={"retry-after": "0"})
+            if request.url.path.endswith(f"/space/{SPACE_ID[9:]}"):
+                return httpx.Response(200, json={"type": "Collection", "items": []})
+            return httpx.Response(200, content=b"x" * 3000)
+
+        limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=None)
+        hx = httpx.Client(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+        client = StorageClient("https://storage.example", httpx_client=hx, limiter=limiter, retry=RetryPolicy())
+        space = client.space(SPACE_ID)
+        seen = []
+        for _ in space.resource("/blob").iter_bytes(1000):
+            seen.append(limiter.in_flight)
+        assert seen == [1, 1, 1]
+        assert calls == 2  # the 503 was retried before any body was handed out
+        assert limiter.limit == 2
+        assert list(space.iter_items()) == []
+        assert limiter.in_flight == 0
+
+        # Abandoning a stream part-way releases the slot too.
+        chunks = space.resource("/blob").iter_bytes(1000)
+        next(chunks)
+        assert limiter.in_flight == 1
+        chunks.close()
+        assert limiter.in_flight == 0
+
+    def test_async_streams_hold_a_slot(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"x" * 3000)
+
+        limiter = AdaptiveLimiter(initial_limit=4, latency_tolerance=None)
+
+        async def run() -> list[int]:
+            hx = httpx.AsyncClient(base_url="https://storage.example", transport=httpx.MockTransport(handler))
+            async with AsyncStorageClient("https://storage.example", httpx_client=hx, limiter=limiter) as client:
+                return [limiter.in_flight async for _ in client.space(SPACE_ID).resource("/blob").iter_bytes(1000)]
+
+        assert asyncio.run(run()) == [1, 1, 1]
+        assert limiter.in_flight == 0
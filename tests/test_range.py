@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._cache import MemoryResponseCache
+from wallet_attached_storage_client._emulator import WasEmulator
+from wallet_attached_storage_client._range import parse_content_range, split_ranges
+from wallet_attached_storage_client._resource import Resource
+
+from .conftest import SPACE_ID, Ed25519TestSigner, EmulatorTransport
+
+BODY = bytes(range(256)) * 41  # 10496 bytes
+
+
+class _NoRangeTransport(EmulatorTransport):
+    """Drops ``Range`` headers before they reach the emulator, like a server without range support."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        request.headers.pop("range", None)
+        return super().handle_request(request)
+
+
+class _ChangingTransport(EmulatorTransport):
+    """Overwrites ``/big.bin`` once *after* requests have been sent, as a concurrent writer would."""
+
+    def __init__(self, emulator: WasEmulator, signer: Ed25519TestSigner, after: int) -> None:
+        super().__init__(emulator)
+        self._writer = emulator.client().space(SPACE_ID, signer=signer).resource("/big.bin")
+        self._after = after
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if len(self.requests) == self._after:
+            self._writer.put(BODY[::-1])
+        return super().handle_request(request)
+
+
+@pytest.fixture
+def etag(emulator: WasEmulator, signer: Ed25519TestSigner) -> str:
+    """Stores BODY at ``/big.bin`` in the emulator space and returns its ETag."""
+    return emulator.client().space(SPACE_ID, signer=signer).resource("/big.bin").put(BODY).headers["etag"]
+
+
+def _resource(transport: EmulatorTransport, signer: Ed25519TestSigner, **kwargs) -> Resource:
+    return transport.client(**kwargs).space(SPACE_ID, signer=signer).resource("/big.bin")
+
+
+def _ranges_requested(transport: EmulatorTransport) -> list[str]:
+    return [r.headers.get("range") for r in transport.requests]
+
+
+class TestHelpers:
+    def test_parse_content_range(self) -> None:
+        cr = parse_content_range("bytes 100-199/1000")
+        assert (cr.start, cr.end, cr.total) == (100, 199, 1000)
+        cr = parse_content_range("bytes */1000")
+        assert (cr.start, cr.end, cr.total) == (None, None, 1000)
+        assert parse_content_range("bytes 0-9/*").total is None
+        with pytest.raises(ValueError):
+            parse_content_range("items 0-9/10")
+
+    def test_split_ranges(self) -> None:
+        assert split_ranges(10, 4) == [(0, 3), (4, 7), (8, 9)]
+        assert split_ranges(10, 4, offset=4) == [(4, 7), (8, 9)]
+        assert split_ranges(0, 4) == []
+
+
+class TestGetRange:
+    def test_partial_response(self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner) -> None:
+        result = _resource(transport, signer).get_range(100, 199)
+        assert result.partial and result.ok
+        assert result.content == BODY[100:200]
+        assert (result.start, result.total) == (100, len(BODY))
+        assert transport.requests[0].headers["range"] == "bytes=100-199"
+        assert transport.requests[0].headers["authorization"].startswith("Signature ")
+
+    def test_open_ended_range(self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner) -> None:
+        result = _resource(transport, signer).get_range(10_000)
+        assert result.content == BODY[10_000:]
+
+    def test_server_without_range_support(
+        self, emulator: WasEmulator, etag: str, signer: Ed25519TestSigner
+    ) -> None:
+        result = _resource(_NoRangeTransport(emulator), signer).get_range(100, 199)
+        assert not result.partial and result.ok
+        assert result.response.status_code == 200
+        assert result.content == BODY[100:200]
+        assert result.total == len(BODY)
+
+    def test_unsatisfiable(self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner) -> None:
+        result = _resource(transport, signer).get_range(len(BODY) + 10)
+        assert not result.ok
+        assert result.response.status_code == 416
+        assert result.content == b""
+        assert result.total == len(BODY)
+
+    def test_invalid_bounds(self, transport: EmulatorTransport, signer: Ed25519TestSigner) -> None:
+        with pytest.raises(ValueError):
+            _resource(transport, signer).get_range(10, 5)
+
+    def test_bypasses_response_cache(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner
+    ) -> None:
+        r = _resource(transport, signer, response_cache=MemoryResponseCache())
+        assert r.get().content == BODY
+        result = r.get_range(0, 9)
+        assert result.partial and result.content == BODY[:10]
+        assert "if-none-match" not in transport.requests[-1].headers
+
+
+class TestDownloadParallel:
+    def test_reassembles_parts(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        dest = tmp_path / "out.bin"
+        r = _resource(transport, signer)
+        result = r.download_parallel(dest, part_size=1000, max_workers=4, hash_algorithm="sha256")
+        assert dest.read_bytes() == BODY
+        assert result.bytes_written == len(BODY)
+        assert result.digest == hashlib.sha256(BODY).hexdigest()
+        assert len(transport.requests) == 11
+        expected = sorted(f"bytes={s}-{e}" for s, e in split_ranges(len(BODY), 1000))
+        assert sorted(_ranges_requested(transport)) == expected
+        assert all(r.headers.get("if-range") == etag for r in transport.requests[1:])
+
+    def test_falls_back_without_range_support(
+        self, emulator: WasEmulator, etag: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        transport = _NoRangeTransport(emulator)
+        dest = tmp_path / "out.bin"
+        _resource(transport, signer).download_parallel(dest, part_size=1000)
+        assert dest.read_bytes() == BODY
+        assert len(transport.requests) == 1
+
+    def test_empty_resource(
+        self, transport: EmulatorTransport, emulator: WasEmulator, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        emulator.client().space(SPACE_ID, signer=signer).resource("/big.bin").put(b"")
+        dest = tmp_path / "out.bin"
+        assert _resource(transport, signer).download_parallel(dest).bytes_written == 0
+        assert dest.read_bytes() == b""
+
+    def test_change_mid_download_removes_file(
+        self, emulator: WasEmulator, etag: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        r = _resource(_ChangingTransport(emulator, signer, after=3), signer)
+        dest = tmp_path / "out.bin"
+        with pytest.raises(ValueError, match="changed"):
+            r.download_parallel(dest, part_size=1000, max_workers=1)
+        assert not dest.exists()
+
+    def test_failed_part_removes_file(
+        self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        transport.fail(1, 500, when=lambda request: request.headers.get("range") == "bytes=5000-5999")
+        dest = tmp_path / "out.bin"
+        dest.write_bytes(b"precious")
+        with pytest.raises(httpx.HTTPStatusError):
+            _resource(transport, signer).download_parallel(dest, part_size=1000)
+        assert dest.read_bytes() == b"precious"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_async(self, transport: EmulatorTransport, etag: str, signer: Ed25519TestSigner, tmp_path: Path) -> None:
+        dest = tmp_path / "out.bin"
+
+        async def run():
+            async with transport.async_client() as client:
+                r = client.space(SPACE_ID, signer=signer).resource("/big.bin")
+                part = await r.get_range(5, 9)
+                result = await r.download_parallel(dest, part_size=999, max_workers=3, hash_algorithm="sha256")
+                return part, result
+
+        part, result = asyncio.run(run())
+        assert part.partial and part.content == BODY[5:10]
+        assert dest.read_bytes() == BODY
+        assert result.digest == hashlib.sha256(BODY).hexdigest()
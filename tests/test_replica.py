@@ -0,0 +1,227 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._replica import (
+    DEFAULT_HEDGE_AFTER,
+    AsyncReplicatedStorageClient,
+    QuorumError,
+    ReplicaSelector,
+    ReplicatedStorageClient,
+)
+
+from .conftest import SPACE_ID, Ed25519TestSigner
+A, B, C = "https://a.example", "https://b.example", "https://c.example"
+
+
+class _Replicas:
+    """One in-memory store per host, with configurable delay and status per host."""
+
+    def __init__(self) -> None:
+        self.delay: dict[str, float] = {}
+        self.status: dict[str, int] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.store: dict[tuple[str, str], bytes] = {}
+        self.cancelled: list[str] = []
+        self.lock = threading.Lock()
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        status = self.status.get(host)
+        if status is not None:
+            return httpx.Response(status)
+        key = (host, request.url.path)
+        if request.method == "PUT":
+            self.store[key] = request.read()
+            return httpx.Response(204)
+        if key not in self.store:
+            return httpx.Response(404)
+        return httpx.Response(200, content=self.store[key], headers={"x-host": host})
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append((request.method, request.url.host))
+        time.sleep(self.delay.get(request.url.host, 0))
+        return self._respond(request)
+
+    async def ahandler(self, request: httpx.Request) -> httpx.Response:
+        # Only reads are delayed here, so background writes never hold up aclose().
+        self.requests.append((request.method, request.url.host))
+        try:
+            await asyncio.sleep(self.delay.get(request.url.host, 0) if request.method == "GET" else 0)
+        except asyncio.CancelledError:
+            self.cancelled.append(request.url.host)
+            raise
+        return self._respond(request)
+
+    def seed(self, path: str, body: bytes, hosts=(A, B, C)) -> None:
+        for url in hosts:
+            self.store[(httpx.URL(url).host, path)] = body
+
+
+def _client(replicas: _Replicas, endpoints=(A, B, C), **kwargs) -> ReplicatedStorageClient:
+    transport = httpx.MockTransport(replicas.handler)
+    return ReplicatedStorageClient(
+        endpoints, httpx_client_factory=lambda url: httpx.Client(base_url=url, transport=transport), **kwargs
+    )
+
+
+DOC = "/space/f47ac10b-58cc-4372-a567-0e02b2c3d479/doc"
+
+
+class TestReplicaSelector:
+    def test_orders_by_ewma_with_unknown_first(self) -> None:
+        selector = ReplicaSelector([A, B, C])
+        selector.record_success(A, 0.050)
+        selector.record_success(B, 0.010)
+        assert selector.order() == [C, B, A]
+        for _ in range(10):
+            selector.record_success(B, 0.200)
+        selector.record_success(C, 0.100)
+        assert selector.order() == [A, C, B]
+
+    def test_failures_demote_until_cooldown(self) -> None:
+        now = [0.0]
+        selector = ReplicaSelector([A, B], failure_threshold=2, cooldown=10, clock=lambda: now[0])
+        selector.record_success(A, 0.001)
+        selector.record_success(B, 0.100)
+        selector.record_failure(A)
+        assert selector.order()[0] == A
+        selector.record_failure(A)
+        assert selector.order() == [B, A]
+        assert [s.healthy for s in selector.stats()] == [False, True]
+        now[0] = 11
+        assert selector.order() == [A, B]
+
+
+class TestReplicatedReads:
+    def test_reads_from_fastest_replica(self) -> None:
+        replicas = _Replicas()
+        replicas.seed(DOC, b"v1")
+        with _client(replicas) as client:
+            client.selector.record_success(A, 0.05)
+            client.selector.record_success(B, 0.01)
+            client.selector.record_success(C, 0.03)
+            response = client.space(SPACE_ID).resource("/doc").get()
+        assert response.headers["x-host"] == "b.example"
+        assert replicas.requests == [("GET", "b.example")]
+        assert client.hedged_requests == 0
+
+    def test_slow_replica_is_hedged(self) -> None:
+        replicas = _Replicas()
+        replicas.seed(DOC, b"v1")
+        replicas.delay["a.example"] = 0.5
+        with _client(replicas, endpoints=(A, B), hedge_after=0.02) as client:
+            start = time.perf_counter()
+            response = client.space(SPACE_ID, signer=Ed25519TestSigner()).resource("/doc").get()
+            elapsed = time.perf_counter() - start
+            assert response.headers["x-host"] == "b.example"
+            assert elapsed < 0.4
+            assert client.hedged_requests == 1
+        # The loser still finished in the background and taught the selector it is slow.
+        assert client.selector.order() == [B, A]
+
+    def test_failed_replica_fails_over(self) -> None:
+        replicas = _Replicas()
+        replicas.seed(DOC, b"v1")
+        replicas.status["a.example"] = 503
+        with _client(replicas, hedge_after=10) as client:
+            response = client.space(SPACE_ID).resource("/doc").get()
+        assert response.status_code == 200
+        assert [h for _, h in replicas.requests] == ["a.example", "b.example"]
+        assert client.selector.stats()[0].failures == 1
+
+    def test_all_replicas_failing_returns_last_response(self) -> None:
+        replicas = _Replicas()
+        for host in ("a.example", "b.example", "c.example"):
+            replicas.status[host] = 500
+        with _client(replicas, hedge_after=10) as client:
+            assert client.space(SPACE_ID).resource("/doc").get().status_code == 500
+        assert len(replicas.requests) == 3
+
+    def test_adaptive_hedge_delay_uses_p95(self) -> None:
+        replicas = _Replicas()
+        replicas.seed(DOC, b"v1")
+        with _client(replicas) as client:
+            assert client.hedge_delay() == DEFAULT_HEDGE_AFTER
+            resource = client.space(SPACE_ID).resource("/doc")
+            for _ in range(25):
+                resource.get()
+            assert 0 < client.hedge_delay() < DEFAULT_HEDGE_AFTER
+
+
+class TestQuorumWrites:
+    def test_majority_quorum_tolerates_one_failure(self) -> None:
+        replicas = _Replicas()
+        replicas.status["c.example"] = 500
+        with _client(replicas) as client:
+            assert client.write_quorum == 2
+            response = client.space(SPACE_ID).resource("/doc").put(iter([b"v", b"1"]), "text/plain")
+        assert response.status_code == 204
+        assert replicas.store[("a.example", DOC)] == replicas.store[("b.example", DOC)] == b"v1"
+
+    def test_quorum_failure_raises(self) -> None:
+        replicas = _Replicas()
+        replicas.status["b.example"] = 500
+        replicas.status["c.example"] = 503
+        with _client(replicas) as client, pytest.raises(QuorumError) as exc_info:
+            client.space(SPACE_ID).resource("/doc").put(b"v1")
+        outcomes = exc_info.value.outcomes
+        assert {outcomes[B].status_code, outcomes[C].status_code} == {500, 503}
+
+    def test_returns_at_quorum_without_waiting_for_stragglers(self) -> None:
+        replicas = _Replicas()
+        replicas.delay["c.example"] = 0.5
+        client = _client(replicas)
+        start = time.perf_counter()
+        client.space(SPACE_ID).resource("/doc").put(b"v1")
+        assert time.perf_counter() - start < 0.4
+        client.close()
+        # close() waits for the straggler, so every replica ends up with the write.
+        assert replicas.store[("c.example", DOC)] == b"v1"
+
+    def test_invalid_quorum(self) -> None:
+        with pytest.raises(ValueError):
+            ReplicatedStorageClient([A, B], write_quorum=3)
+
+    def test_invalid_space_id_is_rejected_up_front(self) -> None:
+        replicas = _Replicas()
+        with _client(replicas) as client, pytest.raises(ValueError, match="urn:uuid"):
+            client.space("not-a-uuid")
+        with pytest.raises(ValueError, match="urn:uuid"):
+            AsyncReplicatedStorageClient([A, B]).space("not-a-uuid")
+        assert replicas.requests == []
+
+
+class TestAsyncReplicated:
+    def test_hedge_cancels_loser_and_quorum_write(self) -> None:
+        replicas = _Replicas()
+        replicas.delay["a.example"] = 5
+
+        async def run() -> tuple[httpx.Response, AsyncReplicatedStorageClient]:
+            transport = httpx.MockTransport(replicas.ahandler)
+            factory = lambda url: httpx.AsyncClient(base_url=url, transport=transport)  # noqa: E731
+            client = AsyncReplicatedStorageClient((A, B), hedge_after=0.02, httpx_client_factory=factory)
+            async with client:
+                resource = client.space(SPACE_ID).resource("/doc")
+                await resource.put(b"v1")
+                # Make the slow replica look fastest so it is asked first.
+                for _ in range(20):
+                    client.selector.record_success(A, 0.0001)
+                    client.selector.record_success(B, 0.01)
+                response = await resource.get()
+                return response, client
+
+        start = time.perf_counter()
+        response, client = asyncio.run(run())
+        assert time.perf_counter() - start < 2
+        assert response.content == b"v1"
+        assert response.headers["x-host"] == "b.example"
+        assert "a.example" in replicas.cancelled
+        assert client.hedged_requests == 1
+        # The cancelled attempt (at least hedge_after long) still raised A's latency estimate.
+        stats = {s.endpoint: s for s in client.selector.stats()}
+        assert stats[A].ewma > 0.3 * 0.02
@@ -1,18 +1,27 @@
+import hashlib
+import io
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
 from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._resource import Resource
 
 from .conftest import Ed25519TestSigner
 
 
 class TestResource:
-    def test_get_not_found(self, mock_client: StorageClient, space_id: str) -> None:
-        s = mock_client.space(space_id)
+    def test_get_not_found(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = mock_client.space(space_id, signer=signer)
         r = s.resource("/nonexistent")
         resp = r.get()
         assert resp.status_code == 404
         assert not resp.is_success
 
-    def test_put_and_get(self, mock_client: StorageClient, space_id: str) -> None:
-        s = mock_client.space(space_id)
+    def test_put_and_get(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = mock_client.space(space_id, signer=signer)
         r = s.resource("/my-data")
         put_resp = r.put(b"hello world", "text/plain")
         assert put_resp.status_code == 204
@@ -23,14 +32,14 @@ class TestResource:
         assert get_resp.text == "hello world"
         assert get_resp.headers["content-type"] == "text/plain"
 
-    def test_post(self, mock_client: StorageClient, space_id: str) -> None:
-        s = mock_client.space(space_id)
+    def test_post(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = mock_client.space(space_id, signer=signer)
         r = s.resource("/items")
         resp = r.post(b'{"key": "value"}', "application/json")
         assert resp.status_code == 201
 
-    def test_delete(self, mock_client: StorageClient, space_id: str) -> None:
-        s = mock_client.space(space_id)
+    def test_delete(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = mock_client.space(space_id, signer=signer)
         r = s.resource("/to-delete")
         r.put(b"data")
         resp = r.delete()
@@ -81,3 +90,130 @@ class TestResourceWithSigner:
         # Pass signer per-method
         resp = r.put(b"data", signer=signer)
         assert resp.status_code == 204
+
+
+class _RecordingTransport(httpx.MockTransport):
+    """Mock transport that records request headers and bodies."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[httpx.Headers, bytes]] = []
+        super().__init__(self._handle)
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.headers, request.read()))
+        return httpx.Response(204)
+
+
+class TestResourceStreamingUpload:
+    def _resource(self, transport: httpx.MockTransport, space_id: str) -> Resource:
+        hx = httpx.Client(base_url="https://storage.example", transport=transport)
+        return StorageClient("https://storage.example", httpx_client=hx).space(space_id).resource("/blob")
+
+    def test_put_path(self, space_id: str, tmp_path: Path) -> None:
+        payload = os.urandom(200_000)
+        f = tmp_path / "blob.bin"
+        f.write_bytes(payload)
+        transport = _RecordingTransport()
+        self._resource(transport, space_id).put(f)
+        headers, body = transport.requests[0]
+        assert body == payload
+        assert headers["content-length"] == "200000"
+
+    def test_put_file_object(self, space_id: str) -> None:
+        transport = _RecordingTransport()
+        buf = io.BytesIO(b"skip:" + b"x" * 100_000)
+        buf.seek(5)
+        self._resource(transport, space_id).put(buf, "text/plain")
+        headers, body = transport.requests[0]
+        assert body == b"x" * 100_000
+        assert headers["content-length"] == "100000"
+        assert headers["content-type"] == "text/plain"
+
+    def test_post_iterator_is_chunked(self, space_id: str) -> None:
+        transport = _RecordingTransport()
+        self._resource(transport, space_id).post(iter([b"a", b"b", b"c"]))
+        headers, body = transport.requests[0]
+        assert body == b"abc"
+        assert headers["transfer-encoding"] == "chunked"
+        assert "content-length" not in headers
+
+    def test_streamed_put_is_signed(self, space_id: str, signer: Ed25519TestSigner) -> None:
+        transport = _RecordingTransport()
+        self._resource(transport, space_id).put(iter([b"data"]), signer=signer)
+        headers, _ = transport.requests[0]
+        assert headers["authorization"].startswith("Signature ")
+
+    def test_rejects_async_iterable(self, space_id: str) -> None:
+        async def agen():
+            yield b"x"
+
+        with pytest.raises(TypeError):
+            self._resource(_RecordingTransport(), space_id).put(agen())
+
+
+class TestResourceStreamingDownload:
+    def test_stream_yields_chunks(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/big")
+        r.put(b"x" * 300_000)
+        with r.stream() as resp:
+            assert resp.status_code == 200
+            chunks = list(resp.iter_bytes(65536))
+        assert b"".join(chunks) == b"x" * 300_000
+        assert max(len(c) for c in chunks) == 65536
+
+    def test_iter_bytes(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/big")
+        r.put(b"abc" * 1000)
+        assert b"".join(r.iter_bytes(100)) == b"abc" * 1000
+
+    def test_iter_bytes_raises_on_error(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/missing")
+        with pytest.raises(httpx.HTTPStatusError):
+            list(r.iter_bytes())
+
+    def test_download_to_path_with_hash(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        payload = os.urandom(250_000)
+        r = mock_client.space(space_id, signer=signer).resource("/blob")
+        r.put(payload)
+        result = r.download_to(tmp_path / "out.bin", hash_algorithm="sha256")
+        assert (tmp_path / "out.bin").read_bytes() == payload
+        assert result.bytes_written == 250_000
+        assert result.digest == hashlib.sha256(payload).hexdigest()
+
+    def test_download_to_fileobj(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/blob")
+        r.put(b"hello")
+        buf = io.BytesIO()
+        result = r.download_to(buf)
+        assert buf.getvalue() == b"hello"
+        assert result.digest is None
+
+    def test_download_failure_removes_partial_file(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/missing")
+        with pytest.raises(httpx.HTTPStatusError):
+            r.download_to(tmp_path / "out.bin")
+        assert not (tmp_path / "out.bin").exists()
+
+    def test_failed_download_keeps_existing_file(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        dest = tmp_path / "out.bin"
+        dest.write_bytes(b"precious")
+        with pytest.raises(httpx.HTTPStatusError):
+            mock_client.space(space_id, signer=signer).resource("/missing").download_to(dest)
+        assert dest.read_bytes() == b"precious"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_download_into_missing_directory(
+        self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner, tmp_path: Path
+    ) -> None:
+        r = mock_client.space(space_id, signer=signer).resource("/blob")
+        r.put(b"hello")
+        with pytest.raises(FileNotFoundError):
+            r.download_to(tmp_path / "nope" / "out.bin")
@@ -0,0 +1,151 @@
+import asyncio
+import email.utils
+import itertools
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client import _request
+from wallet_attached_storage_client._emulator import WasEmulator
+from wallet_attached_storage_client._resource import Resource
+from wallet_attached_storage_client._retry import RetryPolicy
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+@pytest.fixture()
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr(_request.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture()
+def resource(emulator: WasEmulator, signer: Ed25519TestSigner, space_id: str) -> Callable[..., Resource]:
+    """Builds ``/r`` in the emulator space, already stored, on a client with the given retry policy."""
+    emulator.client().space(space_id, signer=signer).resource("/r").put(b"ok")
+
+    def build(transport: EmulatorTransport, retry: RetryPolicy) -> Resource:
+        return transport.client(retry=retry).space(space_id, signer=signer).resource("/r")
+
+    return build
+
+
+class TestRetryPolicy:
+    def test_backoff_grows_and_caps(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=0.0)
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, jitter=0.5)
+        assert all(0.5 <= policy.backoff(1) <= 1.0 for _ in range(100))
+
+    def test_retry_after_seconds_and_date(self) -> None:
+        policy = RetryPolicy(backoff_max=60.0)
+        assert policy.delay(1, httpx.Response(503, headers={"retry-after": "7"})) == 7.0
+        when = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= policy.delay(1, httpx.Response(503, headers={"retry-after": when})) <= 30
+
+    def test_retry_after_capped(self) -> None:
+        policy = RetryPolicy(backoff_max=2.0)
+        assert policy.delay(1, httpx.Response(429, headers={"retry-after": "3600"})) == 2.0
+
+    def test_allows(self) -> None:
+        policy = RetryPolicy()
+        assert policy.allows("GET", None)
+        assert policy.allows("put", b"data")
+        assert not policy.allows("POST", b"data")
+        assert not policy.allows("PUT", iter([b"streamed"]))
+        assert not RetryPolicy(max_attempts=1).allows("GET", None)
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter=2)
+
+
+class TestRetries:
+    def test_retries_status_with_fresh_signature(
+        self,
+        sleeps: list[float],
+        transport: EmulatorTransport,
+        resource: Callable[..., Resource],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        transport.fail(2, 502)
+        clock = itertools.count(time.time(), 1)
+        monkeypatch.setattr("wallet_attached_storage_client._http_signature.time.time", lambda: next(clock))
+        resp = resource(transport, RetryPolicy(jitter=0)).get()
+        assert resp.status_code == 200
+        assert resp.content == b"ok"
+        assert len(transport.requests) == 3
+        assert sleeps == [0.1, 0.2]
+        auths = [r.headers["authorization"] for r in transport.requests]
+        assert len(set(auths)) == 3
+
+    def test_retries_transport_errors(
+        self, sleeps: list[float], transport: EmulatorTransport, resource: Callable[..., Resource]
+    ) -> None:
+        transport.fail(1, None)
+        resp = resource(transport, RetryPolicy()).delete()
+        assert resp.status_code == 204
+        assert len(sleeps) == 1
+
+    def test_gives_up_after_max_attempts(
+        self, sleeps: list[float], transport: EmulatorTransport, resource: Callable[..., Resource]
+    ) -> None:
+        transport.fail(10, 503)
+        resp = resource(transport, RetryPolicy(max_attempts=4)).get()
+        assert resp.status_code == 503
+        assert len(transport.requests) == 4
+
+    def test_raises_last_transport_error(
+        self, sleeps: list[float], transport: EmulatorTransport, resource: Callable[..., Resource]
+    ) -> None:
+        transport.fail(10, None)
+        with pytest.raises(httpx.ConnectError):
+            resource(transport, RetryPolicy(max_attempts=2)).get()
+        assert len(transport.requests) == 2
+
+    def test_honours_retry_after(
+        self, sleeps: list[float], transport: EmulatorTransport, resource: Callable[..., Resource]
+    ) -> None:
+        transport.fail(1, 429, headers={"retry-after": "3"})
+        assert resource(transport, RetryPolicy()).put(b"x").status_code == 204
+        assert sleeps == [3.0]
+
+    def test_post_not_retried(
+        self, sleeps: list[float], transport: EmulatorTransport, resource: Callable[..., Resource]
+    ) -> None:
+        transport.fail(1, 503)
+        resp = resource(transport, RetryPolicy()).post(b"x")
+        assert resp.status_code == 503
+        assert len(transport.requests) == 1
+
+    def test_non_retryable_status_returned(
+        self, sleeps: list[float], transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        resp = transport.client(retry=RetryPolicy()).space(space_id, signer=signer).resource("/missing").get()
+        assert resp.status_code == 404
+        assert sleeps == []
+
+    def test_async_retries(
+        self, monkeypatch: pytest.MonkeyPatch, transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner
+    ) -> None:
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(_request.asyncio, "sleep", fake_sleep)
+        transport.fail(2, 503)
+
+        async def run() -> httpx.Response:
+            client = transport.async_client(retry=RetryPolicy())
+            return await client.space(space_id, signer=signer).resource("/r").put(b"x")
+
+        assert asyncio.run(run()).status_code == 204
+        assert len(delays) == 2
@@ -0,0 +1,108 @@
+import asyncio
+import uuid
+from collections import Counter
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._client import StorageClient
+from wallet_attached_storage_client._shard import (
+    AsyncShardedStorageClient,
+    HashRing,
+    ShardedStorageClient,
+    plan_migration,
+)
+from wallet_attached_storage_client._urn_uuid import make_urn_uuid
+
+NODES = [f"https://node{i}.example" for i in range(4)]
+SPACES = [make_urn_uuid(uuid.UUID(int=i * 7919 + 1)) for i in range(4000)]
+
+
+class TestHashRing:
+    def test_deterministic_and_normalized(self) -> None:
+        a = HashRing(NODES)
+        b = HashRing([f"{url}/" for url in reversed(NODES)])
+        assert all(a.node_for_space(s) == b.node_for_space(s) for s in SPACES[:200])
+        upper = "urn:uuid:" + SPACES[0][9:].upper()
+        assert a.node_for_space(upper) == a.node_for_space(SPACES[0])
+
+    def test_roughly_even_spread(self) -> None:
+        ring = HashRing(NODES)
+        counts = Counter(ring.node_for_space(s) for s in SPACES)
+        assert set(counts) == set(NODES)
+        assert all(700 < n < 1300 for n in counts.values())
+
+    def test_weights_scale_share(self) -> None:
+        ring = HashRing({NODES[0]: 3, NODES[1]: 1})
+        counts = Counter(ring.node_for_space(s) for s in SPACES)
+        assert 2.0 < counts[NODES[0]] / counts[NODES[1]] < 4.5
+
+    def test_adding_a_node_moves_about_one_nth(self) -> None:
+        old = HashRing(NODES)
+        new = HashRing([*NODES, "https://node4.example"])
+        moves = plan_migration(old, new, SPACES)
+        assert 0.12 < len(moves) / len(SPACES) < 0.28
+        # Only the new node gains spaces; nothing shuffles between existing nodes.
+        assert {m.target for m in moves} == {"https://node4.example"}
+        assert all(m.source == old.node_for_space(m.space_id) for m in moves)
+
+    def test_removing_a_node_moves_only_its_spaces(self) -> None:
+        old = HashRing(NODES)
+        moves = plan_migration(old, HashRing(NODES[:3]), SPACES)
+        assert {m.source for m in moves} == {NODES[3]}
+        assert len(moves) == sum(old.node_for_space(s) == NODES[3] for s in SPACES)
+
+    @pytest.mark.parametrize("nodes", [[], {NODES[0]: 0}])
+    def test_invalid_membership(self, nodes) -> None:
+        with pytest.raises(ValueError):
+            HashRing(nodes)
+
+
+def _factory(hits: Counter, client_cls=httpx.Client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits[request.url.host] += 1
+        return httpx.Response(200, json={"id": request.url.path})
+
+    return lambda url: client_cls(base_url=url, transport=httpx.MockTransport(handler))
+
+
+class TestShardedStorageClient:
+    def test_routes_each_space_to_its_node(self) -> None:
+        hits: Counter = Counter()
+        with ShardedStorageClient(NODES, httpx_client_factory=_factory(hits)) as client:
+            expected = Counter()
+            for space_id in SPACES[:40]:
+                client.space(space_id).resource("/doc").get()
+                expected[httpx.URL(client.node_for(space_id)).host] += 1
+        assert hits == expected
+        assert len(hits) > 1
+
+    def test_one_pool_per_node_and_shared_state(self) -> None:
+        client = ShardedStorageClient({NODES[0]: 2, NODES[1]: 1})
+        clients = client.clients
+        assert set(clients) == set(NODES[:2])
+        assert all(isinstance(c, StorageClient) for c in clients.values())
+        assert clients[NODES[0]]._client is not clients[NODES[1]]._client
+        assert clients[NODES[0]].content_index is clients[NODES[1]].content_index
+        space = client.space()
+        assert client.client_for(space.id) is clients[client.node_for(space.id)]
+        client.close()
+
+    def test_plan_migration(self) -> None:
+        client = ShardedStorageClient(NODES)
+        moves = client.plan_migration([*NODES, "https://node4.example"], SPACES[:500])
+        assert moves == plan_migration(client.ring, HashRing([*NODES, "https://node4.example"]), SPACES[:500])
+        client.close()
+
+    def test_async(self) -> None:
+        hits: Counter = Counter()
+
+        async def run() -> None:
+            factory = _factory(hits, httpx.AsyncClient)
+            async with AsyncShardedStorageClient(NODES, httpx_client_factory=factory) as client:
+                for space_id in SPACES[:20]:
+                    await client.space(space_id).resource("/doc").get()
+
+        asyncio.run(run())
+        assert sum(hits.values()) == 20
+        assert set(hits) <= {httpx.URL(u).host for u in NODES}
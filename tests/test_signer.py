@@ -1,7 +1,7 @@
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from wallet_attached_storage_client._signer import Ed25519Signer
-from wallet_attached_storage_client._types import Signer
+from wallet_attached_storage_client._types import BatchSigner, Signer
 
 
 class TestEd25519Signer:
@@ -42,6 +42,22 @@ class TestEd25519Signer:
         # Verify with the public key
         key.public_key().verify(sig, data)
 
+    def test_sign_many(self) -> None:
+        key = Ed25519PrivateKey.generate()
+        signer = Ed25519Signer(key)
+        assert isinstance(signer, BatchSigner)
+        payloads = [b"one", b"two", b"three"]
+        sigs = signer.sign_many(payloads)
+        assert sigs == [signer.sign(p) for p in payloads]
+        for sig, data in zip(sigs, payloads):
+            key.public_key().verify(sig, data)
+
+    def test_private_bytes_round_trip(self) -> None:
+        signer = Ed25519Signer()
+        clone = Ed25519Signer.from_private_bytes(signer.private_bytes_raw())
+        assert clone.id == signer.id
+        assert clone.sign(b"msg") == signer.sign(b"msg")
+
     def test_importable_from_package(self) -> None:
         from wallet_attached_storage_client import Ed25519Signer as Imported
         assert Imported is Ed25519Signer
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from wallet_attached_storage_client._client import StorageClient
@@ -16,8 +18,8 @@ class TestSpace:
         with pytest.raises(ValueError):
             mock_client.space("not-a-urn")
 
-    def test_get(self, mock_client: StorageClient, space_id: str) -> None:
-        s = mock_client.space(space_id)
+    def test_get(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
+        s = mock_client.space(space_id, signer=signer)
         resp = s.get()
         assert resp.is_success
         data = resp.json()
@@ -25,7 +27,7 @@ class TestSpace:
 
     def test_put(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
         s = mock_client.space(space_id, signer=signer)
-        resp = s.put()
+        resp = s.put(json.dumps({"controller": signer.controller}).encode(), "application/json")
         assert resp.status_code == 204
 
     def test_delete(self, mock_client: StorageClient, space_id: str, signer: Ed25519TestSigner) -> None:
@@ -0,0 +1,176 @@
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client import _sync
+from wallet_attached_storage_client._space import Space
+from wallet_attached_storage_client._sync import SIDECAR_NAME, DirectorySync, load_manifest, scan
+
+from .conftest import Ed25519TestSigner, EmulatorTransport
+
+
+@pytest.fixture
+def space(transport: EmulatorTransport, space_id: str, signer: Ed25519TestSigner) -> Space:
+    return transport.client().space(space_id, signer=signer)
+
+
+def _calls(transport: EmulatorTransport) -> list[str]:
+    return sorted(f"{r.method} {r.url.path}" for r in transport.requests)
+
+
+def _write(root: Path, rel: str, data: bytes) -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+class TestScan:
+    def test_reuses_digest_when_stat_unchanged(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _write(tmp_path, "a.txt", b"alpha")
+        _write(tmp_path, "sub/b.bin", b"beta")
+        first = scan(tmp_path)
+        assert set(first) == {"a.txt", "sub/b.bin"}
+
+        def fail(path: Path) -> str:
+            raise AssertionError(f"rehashed {path}")
+
+        monkeypatch.setattr("wallet_attached_storage_client._sync._hash_file", fail)
+        assert scan(tmp_path, first) == first
+
+    def test_skips_sidecar(self, tmp_path: Path) -> None:
+        _write(tmp_path, SIDECAR_NAME, b"{}")
+        assert scan(tmp_path) == {}
+
+
+class TestPush:
+    def test_first_push_uploads_everything_then_only_changes(
+        self, tmp_path: Path, space: Space, transport: EmulatorTransport
+    ) -> None:
+        for i in range(5):
+            _write(tmp_path, f"dir/file-{i}.txt", f"v1-{i}".encode())
+        progress = []
+        sync = DirectorySync(space, tmp_path, prefix="backup", progress=lambda *a: progress.append(a))
+
+        report = sync.push()
+        assert report.ok
+        assert sorted(report.transferred) == [f"dir/file-{i}.txt" for i in range(5)]
+        assert [p[:2] for p in progress] == [(i, 5) for i in range(1, 6)]
+        assert space.resource("/backup/dir/file-3.txt").get().content == b"v1-3"
+        assert space.resource(f"/backup/{SIDECAR_NAME}").get().status_code == 200
+
+        transport.requests.clear()
+        assert len(sync.push().transferred) == 0
+        assert transport.requests == []
+
+        _write(tmp_path, "dir/file-1.txt", b"v2")
+        os.remove(tmp_path / "dir/file-4.txt")
+        (tmp_path / "dir/file-2.txt").touch()  # new mtime, same content: no upload
+        assert len(sync.plan_push()) == 2
+        report = sync.push()
+        assert report.transferred == ["dir/file-1.txt"]
+        assert report.deleted == ["dir/file-4.txt"]
+        assert report.unchanged == 3
+        assert _calls(transport) == [
+            f"DELETE {space.path}/backup/dir/file-4.txt",
+            f"PUT {space.path}/backup/{SIDECAR_NAME}",
+            f"PUT {space.path}/backup/dir/file-1.txt",
+        ]
+        assert space.resource("/backup/dir/file-4.txt").get().status_code == 404
+
+    def test_failed_uploads_are_retried_next_run(
+        self, tmp_path: Path, space: Space, transport: EmulatorTransport
+    ) -> None:
+        transport.fail(1, 500, when=lambda request: request.method == "PUT" and request.url.path.endswith("/bad.txt"))
+        _write(tmp_path, "good.txt", b"ok")
+        _write(tmp_path, "bad.txt", b"nope")
+        sync = DirectorySync(space, tmp_path)
+        report = sync.push()
+        assert report.transferred == ["good.txt"]
+        assert isinstance(report.errors["bad.txt"], httpx.HTTPStatusError)
+        assert set(load_manifest(tmp_path / SIDECAR_NAME)) == {"good.txt"}
+
+        assert sync.push().transferred == ["bad.txt"]
+
+    def test_failed_remote_manifest_is_uploaded_next_run(
+        self, tmp_path: Path, space: Space, transport: EmulatorTransport
+    ) -> None:
+        transport.fail(
+            1, 503, when=lambda request: request.method == "PUT" and request.url.path.endswith(f"/{SIDECAR_NAME}")
+        )
+        _write(tmp_path / "src", "a.txt", b"alpha")
+        sync = DirectorySync(space, tmp_path / "src")
+        with pytest.raises(httpx.HTTPStatusError):
+            sync.push()
+        assert sync.push().transferred == []
+        assert space.resource(f"/{SIDECAR_NAME}").get().status_code == 200
+        assert DirectorySync(space, tmp_path / "dst").pull().transferred == ["a.txt"]
+
+    def test_vanished_file_is_a_per_file_error(
+        self, tmp_path: Path, space: Space, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _write(tmp_path, "a.txt", b"a")
+        _write(tmp_path, "b.txt", b"b")
+        real_scan = _sync.scan
+
+        def scan_then_remove(*args, **kwargs):
+            manifest = real_scan(*args, **kwargs)
+            (tmp_path / "b.txt").unlink()
+            return manifest
+
+        monkeypatch.setattr(_sync, "scan", scan_then_remove)
+        report = DirectorySync(space, tmp_path).push()
+        assert report.transferred == ["a.txt"]
+        assert isinstance(report.errors["b.txt"], FileNotFoundError)
+        assert set(load_manifest(tmp_path / SIDECAR_NAME)) == {"a.txt"}
+
+    def test_interrupted_push_keeps_completed_uploads(self, tmp_path: Path, space: Space) -> None:
+        for i in range(3):
+            _write(tmp_path, f"f{i}.txt", b"x")
+
+        def progress(done: int, total: int, rel: str) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            DirectorySync(space, tmp_path, max_workers=1, progress=progress).push()
+        assert len(load_manifest(tmp_path / SIDECAR_NAME)) == 1
+        assert len(DirectorySync(space, tmp_path).push().transferred) == 2
+
+
+class TestPull:
+    def test_pull_mirrors_pushed_tree(self, tmp_path: Path, space: Space, transport: EmulatorTransport) -> None:
+        src, dst = tmp_path / "src", tmp_path / "dst"
+        _write(src, "a.txt", b"alpha")
+        _write(src, "nested/b.txt", b"beta")
+        DirectorySync(space, src).push()
+
+        puller = DirectorySync(space, dst)
+        report = puller.pull()
+        assert sorted(report.transferred) == ["a.txt", "nested/b.txt"]
+        assert (dst / "nested/b.txt").read_bytes() == b"beta"
+
+        transport.requests.clear()
+        assert puller.pull().transferred == []
+        assert len(transport.requests) == 1  # just the remote manifest
+
+        _write(src, "a.txt", b"alpha 2")
+        os.remove(src / "nested/b.txt")
+        DirectorySync(space, src).push()
+        _write(dst, "local-only.txt", b"mine")
+        report = puller.pull()
+        assert report.transferred == ["a.txt"]
+        assert report.deleted == ["nested/b.txt"]
+        assert (dst / "a.txt").read_bytes() == b"alpha 2"
+        assert not (dst / "nested/b.txt").exists()
+        assert (dst / "local-only.txt").exists()
+
+    def test_rejects_unsafe_remote_paths(self, tmp_path: Path, space: Space) -> None:
+        manifest = b'{"version":1,"files":{"../evil":{"size":1,"mtime_ns":0,"digest":"00"}}}'
+        space.resource(f"/{SIDECAR_NAME}").put(manifest)
+        with pytest.raises(ValueError, match="unsafe"):
+            DirectorySync(space, tmp_path).pull()
+
+    def test_missing_remote_manifest_raises(self, tmp_path: Path, space: Space) -> None:
+        with pytest.raises(httpx.HTTPStatusError):
+            DirectorySync(space, tmp_path).pull()
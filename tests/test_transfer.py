@@ -0,0 +1,100 @@
+import multiprocessing
+
+import httpx
+import pytest
+
+from wallet_attached_storage_client._signer import Ed25519Signer
+from wallet_attached_storage_client._transfer import BulkTransferEngine, TransferItem, TransferResult
+from wallet_attached_storage_client._urn_uuid import make_urn_uuid
+
+SPACE = make_urn_uuid()
+
+_store: dict[str, bytes] = {}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    assert request.headers["authorization"].startswith("Signature ")
+    path = request.url.path
+    if request.method == "PUT":
+        _store[path] = request.content
+        return httpx.Response(204)
+    if request.method == "GET":
+        if path in _store:
+            return httpx.Response(200, content=_store[path])
+        return httpx.Response(404)
+    if request.method == "DELETE":
+        _store.pop(path, None)
+        return httpx.Response(204)
+    if path.endswith("/boom"):
+        raise httpx.ConnectError("refused", request=request)
+    return httpx.Response(405)
+
+
+def _mock_client() -> httpx.Client:
+    # Module-level so it pickles into worker processes; each worker gets its own _store copy.
+    return httpx.Client(transport=httpx.MockTransport(_handler), base_url="https://was.test")
+
+
+def _engine(threads: int = 4) -> BulkTransferEngine:
+    return BulkTransferEngine(
+        "https://was.test",
+        Ed25519Signer(),
+        processes=2,
+        threads_per_process=threads,
+        chunksize=3,
+        httpx_client_factory=_mock_client,
+        mp_context=multiprocessing.get_context("fork"),
+    )
+
+
+@pytest.fixture
+def engine() -> BulkTransferEngine:
+    return _engine()
+
+
+class TestBulkTransferEngine:
+    def test_runs_every_item_across_processes(self, engine: BulkTransferEngine) -> None:
+        items = [TransferItem("PUT", SPACE, f"/doc-{i}", f"body-{i}".encode()) for i in range(20)]
+        results = list(engine.run(items))
+        assert sorted(r.index for r in results) == list(range(20))
+        assert all(r.ok and r.status == 204 for r in results)
+        assert {r.path for r in results} == {f"/doc-{i}" for i in range(20)}
+
+    def test_get_returns_content(self) -> None:
+        # Each chunk is handled wholly within one worker, so PUT-then-GET inside one chunk is visible.
+        items = [
+            TransferItem("PUT", SPACE, "/a", b"hello"),
+            TransferItem("GET", SPACE, "/a"),
+            TransferItem("GET", SPACE, "/missing"),
+        ]
+        results = {r.index: r for r in _engine(threads=1).run(items)}
+        assert results[1].content == b"hello"
+        assert results[2].status == 404
+        assert not results[2].ok
+        assert results[2].content is None
+
+    def test_transport_errors_are_reported_not_raised(self, engine: BulkTransferEngine) -> None:
+        [result] = engine.run([TransferItem("POST", SPACE, "/boom", b"x")])
+        assert result.status is None
+        assert not result.ok
+        assert result.error is not None and "ConnectError" in result.error
+
+    def test_invalid_item_is_reported_not_raised(self, engine: BulkTransferEngine) -> None:
+        items = [TransferItem("PUT", "not-a-urn", "/a", b"x"), TransferItem("PUT", SPACE, "/b", b"y")]
+        results = {r.index: r for r in engine.run(items)}
+        assert results[0].status is None
+        assert results[0].error is not None and "ValueError" in results[0].error
+        assert results[1].ok
+
+    def test_empty_input(self, engine: BulkTransferEngine) -> None:
+        assert list(engine.run([])) == []
+
+
+class TestTransferItem:
+    def test_rejects_unknown_method(self) -> None:
+        with pytest.raises(ValueError, match="PATCH"):
+            TransferItem("PATCH", SPACE, "/a")
+
+    def test_result_ok(self) -> None:
+        assert TransferResult(0, "GET", SPACE, "/a", status=200).ok
+        assert not TransferResult(0, "GET", SPACE, "/a", error="x").ok